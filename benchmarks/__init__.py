@@ -0,0 +1,11 @@
+"""
+Micro-benchmarks for the SX1262 driver.
+
+Each module is runnable on its own, e.g.:
+
+    python -m benchmarks.bench_event_emitter
+    python -m benchmarks.bench_driver --json results.json
+
+bench_driver covers the driver hot paths and can compare a run with a
+saved baseline (--baseline results.json), exiting non-zero on regression.
+"""
@@ -0,0 +1,127 @@
+"""
+Emits per second through EventEmitter in each dispatch mode.
+
+    python -m benchmarks.bench_event_emitter [--count N]
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+
+from sx1262_driver.core import (
+    EventEmitter,
+    DISPATCH_INLINE,
+    DISPATCH_LOOP,
+    DISPATCH_THREADPOOL,
+)
+
+
+def _report(name: str, count: int, elapsed: float):
+    print(f"{name:<28} {count / elapsed:>12,.0f} emits/s  ({elapsed * 1e6 / count:.2f} us/emit)")
+
+
+def bench_inline(count: int):
+    emitter = EventEmitter()
+    emitter.set_dispatch_mode(DISPATCH_INLINE)
+    hits = [0]
+
+    def handler(irq, timestamp=None):
+        hits[0] += 1
+
+    emitter.on("rx_done", handler)
+    start = time.perf_counter()
+    for _ in range(count):
+        emitter.emit("rx_done", 0x02, timestamp=0)
+    _report("inline", count, time.perf_counter() - start)
+    assert hits[0] == count
+
+
+def bench_threadpool(count: int):
+    emitter = EventEmitter()
+    emitter.set_dispatch_mode(DISPATCH_THREADPOOL)
+    done = threading.Event()
+    hits = [0]
+    lock = threading.Lock()
+
+    def handler(irq, timestamp=None):
+        with lock:
+            hits[0] += 1
+            if hits[0] == count:
+                done.set()
+
+    emitter.on("rx_done", handler)
+    start = time.perf_counter()
+    for _ in range(count):
+        emitter.emit("rx_done", 0x02, timestamp=0)
+    done.wait()
+    _report("threadpool", count, time.perf_counter() - start)
+
+
+def bench_loop_cross_thread(count: int):
+    """Emit from a worker thread, as the IRQ thread does, into an asyncio loop."""
+
+    async def run():
+        emitter = EventEmitter()
+        emitter.attach_loop(asyncio.get_running_loop())
+        emitter.set_dispatch_mode(DISPATCH_LOOP)
+        done = asyncio.Event()
+        hits = [0]
+
+        def handler(irq, timestamp=None):
+            hits[0] += 1
+            if hits[0] == count:
+                done.set()
+
+        emitter.on("rx_done", handler)
+
+        def producer():
+            for _ in range(count):
+                emitter.emit("rx_done", 0x02, timestamp=0)
+
+        start = time.perf_counter()
+        thread = threading.Thread(target=producer)
+        thread.start()
+        await done.wait()
+        elapsed = time.perf_counter() - start
+        thread.join()
+        _report("loop (cross-thread, sync)", count, elapsed)
+
+    asyncio.run(run())
+
+
+def bench_loop_async_handler(count: int):
+    async def run():
+        emitter = EventEmitter()
+        emitter.attach_loop(asyncio.get_running_loop())
+        done = asyncio.Event()
+        hits = [0]
+
+        async def handler(irq, timestamp=None):
+            hits[0] += 1
+            if hits[0] == count:
+                done.set()
+
+        emitter.on("rx_done", handler)
+        start = time.perf_counter()
+        for _ in range(count):
+            emitter.emit("rx_done", 0x02, timestamp=0)
+        await done.wait()
+        _report("loop (same thread, async)", count, time.perf_counter() - start)
+
+    asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    bench_inline(args.count)
+    bench_threadpool(args.count // 10)
+    bench_loop_cross_thread(args.count)
+    bench_loop_async_handler(args.count // 10)
+
+
+if __name__ == "__main__":
+    main()
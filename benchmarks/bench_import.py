@@ -0,0 +1,123 @@
+"""
+Import-time budget for the sx1262_driver package.
+
+    python -m benchmarks.bench_import [--budget-scale 3] [--json imports.json]
+                                      [--baseline base.json] [--profile]
+
+Each target is imported in a fresh interpreter and timed around the
+import statement itself (interpreter start-up is excluded); the median
+of --runs is compared with the target's budget. A target also fails if
+it pulls in a module it must not need: spidev/lgpio anywhere before a
+transport is created, asyncio for the constants and calculation
+modules. Budgets are ms on a desktop-class host; scale them with
+--budget-scale on slower boards. The exit status is 1 if any target is
+over budget, imports a forbidden module, or (with --baseline) regressed
+by more than --tolerance.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from .harness import compare, result, write_json
+
+HARDWARE = ("spidev", "lgpio")
+
+# (name, import statement, budget in ms, modules it must not load)
+TARGETS = (
+    ("constants", "import sx1262_driver", 15, HARDWARE + ("asyncio", "threading")),
+    ("airtime", "from sx1262_driver.sx1262_airtime import time_on_air", 20, HARDWARE + ("asyncio",)),
+    ("config", "from sx1262_driver import RadioConfig", 60, HARDWARE + ("asyncio",)),
+    ("driver", "from sx1262_driver import SX1262", 200, HARDWARE + ("http.server",)),
+    ("emulator", "from sx1262_driver import EmulatorTransport", 40, HARDWARE + ("asyncio",)),
+)
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1e3, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure(statement: str, runs: int) -> tuple:
+    """Median import time in ms over 'runs' fresh interpreters, and the modules loaded."""
+    times = []
+    modules = ()
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(statement=statement)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        probe = json.loads(out)
+        times.append(probe["ms"])
+        modules = probe["modules"]
+    return (statistics.median(times), modules)
+
+
+def profile(statement: str, top: int = 10):
+    """Print the modules with the largest self time from -X importtime."""
+    err = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    rows = []
+    for line in err.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        (own, cumulative, name) = line[len("import time:") :].split("|")
+        if name.strip() == "site":
+            rows = []  # everything so far is interpreter start-up
+            continue
+        rows.append((int(own), int(cumulative), name.strip()))
+    for own, cumulative, name in sorted(rows, reverse=True)[:top]:
+        print(f"    {name:<40} self {own / 1e3:>7.1f} ms  cumulative {cumulative / 1e3:>7.1f} ms")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="interpreters per target")
+    parser.add_argument("--budget-scale", type=float, default=1.0)
+    parser.add_argument("--profile", action="store_true", help="show the slowest modules")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="compare with a previous --json file")
+    parser.add_argument("--tolerance", type=float, default=0.20)
+    args = parser.parse_args(argv)
+
+    results = {}
+    failures = []
+    for name, statement, budget, forbidden in TARGETS:
+        (ms, modules) = measure(statement, args.runs)
+        budget *= args.budget_scale
+        loaded = [m for m in forbidden if m in modules]
+        status = "ok"
+        if ms > budget:
+            status = "OVER BUDGET"
+        if loaded:
+            status = f"imports {', '.join(loaded)}"
+        if status != "ok":
+            failures.append(name)
+        print(f"{name:<12} {ms:>8.1f} ms  budget {budget:>6.0f} ms  {len(modules):>4} modules  {status}")
+        if args.profile:
+            profile(statement)
+        results[f"import.{name}"] = result(ms, "ms")
+
+    if args.json:
+        write_json(args.json, results)
+    if args.baseline:
+        failures += compare(results, args.baseline, args.tolerance)
+    if failures:
+        print(f"\n{len(failures)} failure(s): {', '.join(failures)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Shared pieces of the driver benchmarks: a stand-in transport, timing
+helpers, JSON results and baseline comparison.
+"""
+
+import json
+import platform
+import subprocess
+import sys
+import time
+
+from sx1262_driver.transport import Transport
+
+
+class NullTransport(Transport):
+    """
+    Transport that answers every frame with zeros and keeps BUSY low, so
+    a benchmark measures the driver's own cost and nothing else.
+    """
+
+    supports_batch = True
+
+    def open(self, bus: int, cs: int, speed: int):
+        pass
+
+    def close(self):
+        pass
+
+    def setup_pins(self, *args, **kwargs):
+        pass
+
+    def write_pin(self, pin: int, level: int):
+        pass
+
+    def read_pin(self, pin: int) -> int:
+        return 0
+
+    def wait_for_level(self, pin: int, level: int, timeout: float) -> bool:
+        return level == 0
+
+    def transfer(self, data):
+        return bytearray(len(data))
+
+    def transfer_many(self, frames) -> list:
+        return [bytearray(len(frame)) for frame in frames]
+
+
+def time_per_op(fn, number: int, repeat: int = 5) -> float:
+    """Best of 'repeat' runs of 'number' calls to fn(), in ns per call."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter_ns() - start) / number)
+    return best
+
+
+def result(value: float, unit: str, higher_is_better: bool = False) -> dict:
+    return {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+
+
+def metadata() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "commit": commit,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def write_json(path: str, results: dict):
+    with open(path, "w") as f:
+        json.dump({"meta": metadata(), "results": results}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(results: dict, baseline_path: str, tolerance: float) -> list:
+    """
+    Print each benchmark against the baseline file and return the names
+    that got worse by more than 'tolerance' (a fraction, 0.10 = 10%).
+    """
+    with open(baseline_path) as f:
+        baseline = json.load(f)["results"]
+
+    regressions = []
+    print(f"\n{'benchmark':<36} {'baseline':>14} {'current':>14} {'change':>9}")
+    for name, current in results.items():
+        before = baseline.get(name)
+        if before is None or not before["value"]:
+            print(f"{name:<36} {'-':>14} {current['value']:>14.1f}       new")
+            continue
+        change = current["value"] / before["value"] - 1
+        worse = -change if current["higher_is_better"] else change
+        flag = ""
+        if worse > tolerance:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif worse < -tolerance:
+            flag = "  improved"
+        print(
+            f"{name:<36} {before['value']:>14.1f} {current['value']:>14.1f}"
+            f" {change * 100:>+8.1f}%{flag}"
+        )
+    return regressions
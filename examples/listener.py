@@ -3,14 +3,14 @@
 import time
 import threading
 import asyncio
-from sx1262_driver import SX1262
+from sx1262_driver import SX1262, RadioConfig
 from sx1262_driver import *   # brings in LORA_SYNC_WORD_PUBLIC, HEADER_EXPLICIT, TX_SINGLE, etc.
 
 # ------------------------------------------------------------
 # Pin mapping (BCM)
 # ------------------------------------------------------------
 BUSY_PIN = 20
-IRQ_PIN = 16     # unused (driver uses internal polling)
+IRQ_PIN = 16     # DIO1; the recv loop waits on its rising edge
 RESET_PIN = 18
 NSS_PIN = 21
 SPI_BUS = 0
@@ -100,7 +100,7 @@ async def main():
         cs=SPI_DEV,
         reset=RESET_PIN,
         busy=BUSY_PIN,
-        irq=-1,
+        irq=IRQ_PIN,
         txen=-1,
         rxen=-1,
         wake=-1,
@@ -110,22 +110,23 @@ async def main():
 
     print("Configuring radio…")
 
-    radio.set_sync_word(LORA_SYNC_WORD_PUBLIC)
-    radio.set_frequency(FREQUENCY_HZ)
-    radio.set_lora_modulation(
-        sf=SPREADING_FACTOR,
-        bw=BANDWIDTH_HZ,
-        cr=CODING_RATE,
-        ldro=False,
+    # One batched sequence; a later apply() only sends what changed
+    radio.apply(
+        RadioConfig(
+            frequency=FREQUENCY_HZ,
+            sf=SPREADING_FACTOR,
+            bw=BANDWIDTH_HZ,
+            cr=CODING_RATE,
+            ldro=False,
+            header_type=HEADER_EXPLICIT,
+            preamble_length=PREAMBLE_LENGTH,
+            payload_length=PAYLOAD_LENGTH,
+            crc=CRC_ENABLED,
+            invert_iq=INVERT_IQ,
+            sync_word=LORA_SYNC_WORD_PUBLIC,
+            rx_gain=RX_GAIN_BOOSTED,
+        )
     )
-    radio.set_lora_packet(
-        header_type=HEADER_EXPLICIT,
-        preamble_length=PREAMBLE_LENGTH,
-        payload_length=PAYLOAD_LENGTH,
-        crc_type=CRC_ENABLED,
-        invert_iq=INVERT_IQ,
-    )
-    radio.set_rx_gain(RX_GAIN_BOOSTED)
 
     # Register event handlers
     radio.on("rx_done", handle_rx_done)
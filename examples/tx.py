@@ -1,6 +1,4 @@
 #!/usr/bin/env python3
-import time
-
 from sx1262_driver import SX1262
 from sx1262_driver import *   # brings in LORA_SYNC_WORD_PUBLIC, HEADER_EXPLICIT, TX_SINGLE, etc.
 
@@ -25,18 +23,6 @@ PAYLOAD_LENGTH = 32
 CRC_ENABLED = True
 INVERT_IQ = False
 
-# ------------------------------------------------------------
-# Event Handlers
-# ------------------------------------------------------------
-
-async def handle_tx_done(transmit_time=None, irq_status=None):
-    print("\n--- TX COMPLETE ---")
-    print(f"Transmit time: {transmit_time*1000:.2f} ms")
-    print("-------------------")
-
-async def handle_timeout(irq_status=None):
-    print("TX timeout")
-
 # ------------------------------------------------------------
 # Main
 # ------------------------------------------------------------
@@ -80,24 +66,29 @@ def main():
         invert_iq=INVERT_IQ,
     )
 
-    radio.on("tx_done", handle_tx_done)
-    radio.on("timeout", handle_timeout)
-
     print("Transmitting packet…")
 
-    radio.begin_packet()
-    radio.put(b"Hello from SX1262!")
-    ok = radio.end_packet(TX_SINGLE)
+    # Queue the whole TX sequence; with IoctlTransport the writes leave in
+    # as few SPI_IOC_MESSAGE calls as the reads in between allow
+    with radio.batch():
+        radio.begin_packet()
+        radio.put(b"Hello from SX1262!")
+        ok = radio.end_packet(TX_SINGLE)
 
     if not ok:
         raise RuntimeError("Failed to start TX")
 
-    print("Packet sent, waiting for TX_DONE event…")
+    print("Packet sent, waiting for TX_DONE…")
 
+    # Sleeps through the time on air, then polls once per symbol
     try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
+        if radio.wait(5) and radio.status() == STATUS_TX_DONE:
+            print("\n--- TX COMPLETE ---")
+            print(f"Transmit time: {radio.transmit_time():.2f} ms")
+            print("-------------------")
+        else:
+            print("TX timeout")
+    finally:
         print("Shutting down…")
         radio.end()
 
@@ -1,15 +1,79 @@
 """
 SX1262 LoRa driver (lgpio + spidev, snake_case API)
 
+The constants load with the package; the classes below are imported on
+first use, and spidev/lgpio only when a hardware transport is created.
+
 Public API:
 - SX1262: main driver class
+- Packet: received packet record delivered by the RX pipeline
+- RadioConfig: immutable radio profile applied with SX1262.apply()
+- ChannelPlan: precomputed channel table used by SX1262.hop()
+- TxScheduler, SubBand: duty-cycle budgeted transmit queue
+- PacketFilter, LengthFilter, PrefixFilter, PredicateFilter: RX filter stages
+- MetricsRegistry, RadioTelemetry: OpenMetrics exporter for radio counters
+- Transport, LgpioTransport, IoctlTransport, EmulatorTransport: SPI/GPIO backends
 - Constants from sx1262_constants
 """
 
-from .sx1262 import SX1262
+import importlib
+
 from .sx1262_constants import *
 
+# Public name -> defining module, imported by __getattr__ on first access
+_LAZY = {
+    "SX1262": ".sx1262",
+    "Packet": ".sx1262_packet",
+    "RadioConfig": ".sx1262_config",
+    "ChannelPlan": ".sx1262_channels",
+    "TxScheduler": ".sx1262_scheduler",
+    "SubBand": ".sx1262_scheduler",
+    "EU868_SUB_BANDS": ".sx1262_scheduler",
+    "PacketFilter": ".sx1262_filter",
+    "LengthFilter": ".sx1262_filter",
+    "PrefixFilter": ".sx1262_filter",
+    "PredicateFilter": ".sx1262_filter",
+    "RadioTelemetry": ".sx1262_telemetry",
+    "MetricsRegistry": ".core.metrics_registry",
+    "Transport": ".transport",
+    "LgpioTransport": ".transport",
+    "IoctlTransport": ".transport",
+    "EmulatorTransport": ".transport",
+    "SX1262Emulator": ".transport",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
 __all__ = [
     "SX1262",
-    *[name for name in dir() if name.isupper()],
+    "Packet",
+    "RadioConfig",
+    "ChannelPlan",
+    "TxScheduler",
+    "SubBand",
+    "EU868_SUB_BANDS",
+    "PacketFilter",
+    "LengthFilter",
+    "PrefixFilter",
+    "PredicateFilter",
+    "RadioTelemetry",
+    "MetricsRegistry",
+    "Transport",
+    "LgpioTransport",
+    "IoctlTransport",
+    "EmulatorTransport",
+    "SX1262Emulator",
+    *[name for name in dir() if name.isupper() and name not in _LAZY],
 ]
@@ -1,10 +1,61 @@
 """
-Internal utilities for the SX1262 driver.
+Internal utilities for the SX1262 driver, each imported on first use.
 
 Currently exposes:
-- EventEmitter: async event dispatch system used by SX1262
+- EventEmitter: event dispatch system used by SX1262, with loop, inline
+  and thread-pool dispatch modes (DISPATCH_*)
+- BusyWaiter: spin-then-block wait on the BUSY line
+- PacketQueue: bounded packet FIFO with a drop policy
+- DutyCycleLedger: sliding-window airtime budget for one sub-band
+- BufferRing: bookkeeping for the chip's circular data buffer
+- DedupeCache: bounded, time-limited set of recent packet keys
+- SpiMetrics, Histogram: per-opcode SPI transaction statistics
+- MetricsRegistry: counters/gauges/histograms rendered as OpenMetrics
 """
 
-from .event_emitter import EventEmitter
+import importlib
 
-__all__ = ["EventEmitter"]
+# Public name -> defining module, imported by __getattr__ on first access
+_LAZY = {
+    "EventEmitter": ".event_emitter",
+    "DISPATCH_LOOP": ".event_emitter",
+    "DISPATCH_INLINE": ".event_emitter",
+    "DISPATCH_THREADPOOL": ".event_emitter",
+    "BusyWaiter": ".busy_wait",
+    "PacketQueue": ".packet_queue",
+    "DutyCycleLedger": ".duty_cycle",
+    "BufferRing": ".buffer_ring",
+    "DedupeCache": ".dedupe_cache",
+    "SpiMetrics": ".spi_metrics",
+    "Histogram": ".spi_metrics",
+    "MetricsRegistry": ".metrics_registry",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+__all__ = [
+    "EventEmitter",
+    "DISPATCH_LOOP",
+    "DISPATCH_INLINE",
+    "DISPATCH_THREADPOOL",
+    "BusyWaiter",
+    "PacketQueue",
+    "DutyCycleLedger",
+    "BufferRing",
+    "DedupeCache",
+    "SpiMetrics",
+    "Histogram",
+    "MetricsRegistry",
+]
@@ -0,0 +1,90 @@
+# src/core/buffer_ring.py
+
+from collections import deque
+
+BUFFER_SIZE = 256
+
+
+class BufferRing:
+    """
+    Bookkeeping for the SX1262's 256-byte circular data buffer.
+
+    In RX_CONTINUOUS the chip writes each packet right after the previous
+    one and wraps past offset 255. The ring records every received packet
+    as (offset, length) until it is read, tracks where the chip will write
+    next (write_index) and splits any access that crosses the end of the
+    buffer into at most two bursts. TX payloads are placed at write_index,
+    right after the newest packet, so they only overwrite the oldest unread
+    packets when the buffer is genuinely full; those packets are dropped
+    from the ring and counted instead of being returned corrupted.
+
+    Holds no data and does no I/O. Not thread-safe; callers hold the bus
+    lock or run on the IRQ thread.
+    """
+
+    def __init__(self):
+        self.write_index = 0
+        self.unread = 0
+        # Packets lost to the chip overwriting them (RX overrun) or to a
+        # TX payload placed over them
+        self.overruns = 0
+        self.overwritten = 0
+        # [offset, remaining] per unread packet, oldest first
+        self._packets = deque()
+
+    @staticmethod
+    def segments(offset: int, length: int) -> tuple:
+        """(offset, length) bursts covering 'length' bytes from 'offset'."""
+        first = BUFFER_SIZE - offset
+        if length <= first:
+            return ((offset, length),)
+        return ((offset, first), (0, length - first))
+
+    def clear(self, write_index: int = 0):
+        self._packets.clear()
+        self.unread = 0
+        self.write_index = write_index
+
+    def received(self, offset: int, length: int, consumed: bool = False):
+        """
+        Record a packet the chip stored at 'offset'. 'consumed' packets
+        (already captured by the RX pipeline) only move write_index.
+        """
+        self.write_index = (offset + length) % BUFFER_SIZE
+        if consumed or not length:
+            return
+        self._packets.append([offset, length])
+        self.unread += length
+        while self.unread > BUFFER_SIZE:
+            self.unread -= self._packets.popleft()[1]
+            self.overruns += 1
+
+    def head(self):
+        """(offset, remaining) of the oldest unread packet, or None."""
+        if not self._packets:
+            return None
+        offset, remaining = self._packets[0]
+        return (offset, remaining)
+
+    def consume(self, length: int):
+        """Mark 'length' bytes from the head of the ring as read."""
+        packets = self._packets
+        while length > 0 and packets:
+            packet = packets[0]
+            step = min(length, packet[1])
+            packet[0] = (packet[0] + step) % BUFFER_SIZE
+            packet[1] -= step
+            self.unread -= step
+            length -= step
+            if not packet[1]:
+                packets.popleft()
+
+    def reserve_tx(self, length: int) -> int:
+        """
+        Claim 'length' bytes at write_index for a TX payload and return the
+        offset. Unread packets the payload would overwrite are dropped.
+        """
+        while self._packets and self.unread + length > BUFFER_SIZE:
+            self.unread -= self._packets.popleft()[1]
+            self.overwritten += 1
+        return self.write_index
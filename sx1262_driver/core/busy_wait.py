@@ -0,0 +1,45 @@
+# src/core/busy_wait.py
+
+import time
+
+from ..sx1262_constants import BUSY_SPIN_US
+
+
+class BusyWaiter:
+    """
+    Two-phase wait for the SX1262 BUSY line to go low.
+
+    Most commands release BUSY within a microsecond or two, so the waiter
+    first spins on the pin for at most spin_us. If BUSY is still high after
+    that (calibration, wake from sleep, image calibration) it hands over to
+    the transport's wait_for_level(), which blocks on a GPIO edge on real
+    hardware instead of burning a core. All timing uses a monotonic clock.
+    """
+
+    def __init__(self, transport, pin: int, spin_us: float = BUSY_SPIN_US):
+        self.transport = transport
+        self.pin = pin
+        self.spin = spin_us * 1e-6
+        # Seconds spent waiting by the most recent call to wait()
+        self.waited = 0.0
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to 'timeout' seconds. Returns True if BUSY never dropped."""
+        read = self.transport.read_pin
+        pin = self.pin
+        if read(pin) == 0:
+            self.waited = 0.0
+            return False
+
+        clock = time.perf_counter
+        start = clock()
+        spin_end = start + min(self.spin, timeout)
+        while clock() < spin_end:
+            if read(pin) == 0:
+                self.waited = clock() - start
+                return False
+
+        remaining = timeout - (clock() - start)
+        ready = remaining > 0 and self.transport.wait_for_level(pin, 0, remaining)
+        self.waited = clock() - start
+        return not ready
@@ -0,0 +1,89 @@
+# src/core/dedupe_cache.py
+
+import time
+from collections import OrderedDict
+
+from ..sx1262_constants import DEDUPE_SIZE, DEDUPE_WINDOW
+
+
+class DedupeCache:
+    """
+    Bounded, time-limited set of recently delivered packet keys.
+
+    check() is O(1): a key seen less than 'window' seconds after its first
+    delivery is a duplicate and returns the value stored with that first
+    delivery; anything else is stored as a new delivery. Entries are kept
+    in least-recently-seen order, so once 'maxsize' is reached the entry
+    that has not been repeated for longest is evicted, and expired entries
+    at that end are dropped as new keys arrive.
+
+    Not thread-safe; only the IRQ thread calls check().
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEDUPE_SIZE,
+        window: float = DEDUPE_WINDOW,
+        clock=time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.window = window
+        self.clock = clock
+        self.lookups = 0
+        self.hits = 0
+        self.evictions = 0
+        # key -> (first delivery time, value)
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def check(self, key, value=True):
+        """
+        Return the first delivery's value if 'key' is a repeat within the
+        window, otherwise remember 'key' with 'value' and return None.
+        """
+        now = self.clock()
+        entries = self._entries
+        self.lookups += 1
+
+        entry = entries.get(key)
+        if entry is not None and now - entry[0] < self.window:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        entries[key] = (now, value)
+        entries.move_to_end(key)
+        self._expire(now)
+        return None
+
+    def replace(self, key, value):
+        """Swap the value stored for 'key', keeping its first delivery time."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries[key] = (entry[0], value)
+
+    def _expire(self, now: float):
+        entries = self._entries
+        while len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+        horizon = now - self.window
+        while entries:
+            first = next(iter(entries.values()))
+            if first[0] > horizon:
+                break
+            entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.lookups if self.lookups else 0.0,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,93 @@
+# src/core/duty_cycle.py
+
+import math
+from collections import deque
+
+from ..sx1262_constants import DUTY_CYCLE_WINDOW
+
+
+class DutyCycleLedger:
+    """
+    Sliding-window airtime ledger for one duty-cycle-limited sub-band.
+
+    Each transmission is recorded with its computed time on air. A new
+    transmission of 'airtime' seconds may start at t when the airtime of
+    every recorded transmission that ends inside (t + airtime - window,
+    t + airtime], plus its own, stays within duty_cycle * window. Whole
+    transmissions are counted even if they only partly overlap the window,
+    so the ledger errs on the safe side and never exceeds the limit.
+    used() and utilisation() report only the airtime inside the window.
+
+    Not thread-safe; TxScheduler serialises access.
+    """
+
+    def __init__(self, duty_cycle: float, window: float = DUTY_CYCLE_WINDOW):
+        self.duty_cycle = duty_cycle
+        self.window = window
+        self.budget = duty_cycle * window
+        self.transmissions = 0
+        self.airtime = 0.0
+        # (end time, airtime) per transmission, in end-time order
+        self._records = deque()
+        self._used = 0.0
+
+    def _expire(self, now: float):
+        horizon = now - self.window
+        records = self._records
+        while records and records[0][0] <= horizon:
+            self._used -= records.popleft()[1]
+
+    def used(self, now: float) -> float:
+        """
+        Airtime in seconds that falls inside the window [now - window, now]:
+        the part of a transmission before the window or still on air after
+        'now' is left out.
+        """
+        self._expire(now)
+        used = self._used
+        horizon = now - self.window
+        for end, airtime in self._records:
+            if end - airtime >= horizon:
+                break
+            used -= horizon - (end - airtime)
+        for end, airtime in reversed(self._records):
+            if end <= now:
+                break
+            used -= end - max(now, end - airtime)
+        return max(used, 0.0)
+
+    def utilisation(self, now: float) -> float:
+        return self.used(now) / self.budget if self.budget else 0.0
+
+    def earliest(self, airtime: float, now: float) -> float:
+        """
+        Earliest start time >= now for a transmission of 'airtime' seconds,
+        or math.inf if it can never fit in the budget.
+        """
+        if airtime > self.budget:
+            return math.inf
+        self._expire(now)
+        excess = self._used + airtime - self.budget
+        start = now
+        for end, used in self._records:
+            if excess <= 0:
+                break
+            excess -= used
+            start = max(start, end + self.window - airtime)
+        return start
+
+    def record(self, start: float, airtime: float):
+        self._records.append((start + airtime, airtime))
+        self._used += airtime
+        self.transmissions += 1
+        self.airtime += airtime
+
+    def started(self, start: float):
+        """
+        Move the newest transmission to its actual 'start', when that is
+        later than the one given to record(), so its airtime is counted
+        for the whole time it is really on air.
+        """
+        if self._records:
+            (end, airtime) = self._records[-1]
+            self._records[-1] = (max(end, start + airtime), airtime)
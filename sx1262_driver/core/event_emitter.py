@@ -1,61 +1,200 @@
 # src/core/event_emitter.py
 
 import asyncio
+import inspect
 import threading
-from collections import defaultdict
-from typing import Callable, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Tuple
+
+# Dispatch modes
+DISPATCH_LOOP = "loop"          # run callbacks on the attached asyncio loop
+DISPATCH_INLINE = "inline"      # run callbacks in the emitting thread
+DISPATCH_THREADPOOL = "threadpool"  # run callbacks on a worker pool
+
 
 class EventEmitter:
+    """
+    Event dispatch used by SX1262.
+
+    Listeners are compiled into an immutable per-event tuple of
+    (callback, once, is_coroutine, takes_timestamp) entries that is rebuilt
+    only by on(), once() and off(), so emit() reads it without taking a
+    lock. A 'timestamp' given to emit() is passed only to listeners that
+    declare a timestamp parameter, so other signatures are unaffected.
+
+    In DISPATCH_LOOP mode (the default once attach_loop() is called) plain
+    callbacks are called directly on the loop thread and only coroutine
+    callbacks get a Task. Events emitted from other threads are queued and
+    drained by a single call_soon_threadsafe() per burst. Without a loop,
+    or in DISPATCH_INLINE mode, callbacks run in the emitting thread;
+    DISPATCH_THREADPOOL hands them to a small thread pool.
+    """
+
     def __init__(self):
         super().__init__()
         self._loop = None
         self._loop_thread_id = None
-        self._event_listeners = defaultdict(list)
+        self._dispatch_mode = DISPATCH_LOOP
+        self._executor = None
+        self._event_listeners: Dict[str, Tuple[tuple, ...]] = {}
         self._lock = threading.Lock()
+        # Cross-thread emits waiting for the loop to drain them
+        self._pending = []
+        self._drain_scheduled = False
+        self._pending_lock = threading.Lock()
 
     def attach_loop(self, loop: asyncio.AbstractEventLoop):
         self._loop = loop
         # We *know* this is called from the loop’s own thread
         self._loop_thread_id = threading.get_ident()
 
+    def set_dispatch_mode(self, mode: str, max_workers: int = 2):
+        """Select DISPATCH_LOOP, DISPATCH_INLINE or DISPATCH_THREADPOOL."""
+        if mode not in (DISPATCH_LOOP, DISPATCH_INLINE, DISPATCH_THREADPOOL):
+            raise ValueError(f"unknown dispatch mode {mode!r}")
+        if mode == DISPATCH_THREADPOOL and self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="sx1262-events"
+            )
+        self._dispatch_mode = mode
+
+    # ---------------------------------------------------------------------
+    # REGISTRATION
+    # ---------------------------------------------------------------------
+
     def on(self, event: str, callback: Callable):
-        with self._lock:
-            if not any(cb["callback"] == callback for cb in self._event_listeners[event]):
-                self._event_listeners[event].append({"type": "on", "callback": callback})
+        self._add(event, callback, False)
 
     def once(self, event: str, callback: Callable):
-        with self._lock:
-            if not any(cb["callback"] == callback for cb in self._event_listeners[event]):
-                self._event_listeners[event].append({"type": "once", "callback": callback})
+        self._add(event, callback, True)
 
     def off(self, event: str, callback: Callable):
         with self._lock:
-            if event in self._event_listeners:
-                self._event_listeners[event] = [
-                    entry for entry in self._event_listeners[event]
-                    if entry["callback"] != callback
-                ]
+            entries = self._event_listeners.get(event)
+            if entries is None:
+                return
+            entries = tuple(entry for entry in entries if entry[0] != callback)
+            if entries:
+                self._event_listeners[event] = entries
+            else:
+                del self._event_listeners[event]
 
-    def emit(self, event: str, *args, **kwargs):
+    def _add(self, event: str, callback: Callable, once: bool):
         with self._lock:
-            listeners = list(self._event_listeners.get(event, []))
+            entries = self._event_listeners.get(event, ())
+            if any(entry[0] == callback for entry in entries):
+                return
+            entry = (
+                callback,
+                once,
+                asyncio.iscoroutinefunction(callback),
+                _takes_timestamp(callback),
+            )
+            self._event_listeners[event] = entries + (entry,)
+
+    def listener_count(self, event: str) -> int:
+        return len(self._event_listeners.get(event, ()))
+
+    # ---------------------------------------------------------------------
+    # DISPATCH
+    # ---------------------------------------------------------------------
+
+    def emit(self, event: str, *args, timestamp: int = None, **kwargs):
+        entries = self._event_listeners.get(event)
+        if not entries:
+            return
+
+        for entry in entries:
+            if entry[1] and not self._remove_once(event, entry):
+                # Another thread already fired this once-listener
+                continue
 
-        current_thread_id = threading.get_ident()
+            if timestamp is not None and entry[3]:
+                # Carried with the event, so a deferred callback still
+                # gets the time of the IRQ that caused it
+                self._dispatch(entry, args, {**kwargs, "timestamp": timestamp})
+            else:
+                self._dispatch(entry, args, kwargs)
+
+    def _dispatch(self, entry: tuple, args: tuple, kwargs: dict):
+        mode = self._dispatch_mode
+        if mode == DISPATCH_LOOP and self._loop is not None:
+            self._post(entry, args, kwargs)
+        elif mode == DISPATCH_THREADPOOL:
+            self._executor.submit(self._invoke, entry, args, kwargs)
+        else:
+            self._invoke(entry, args, kwargs)
 
-        for entry in listeners:
-            coro = self._safe_invoke(entry["callback"], *args, **kwargs)
-            if self._loop_thread_id and self._loop_thread_id == current_thread_id:
-                self._loop.create_task(coro)
+    def _remove_once(self, event: str, entry: tuple) -> bool:
+        with self._lock:
+            entries = self._event_listeners.get(event, ())
+            if entry not in entries:
+                return False
+            remaining = tuple(e for e in entries if e is not entry)
+            if remaining:
+                self._event_listeners[event] = remaining
             else:
-                self._loop.call_soon_threadsafe(asyncio.create_task, coro)
+                del self._event_listeners[event]
+            return True
+
+    def _post(self, entry: tuple, args: tuple, kwargs: dict):
+        with self._pending_lock:
+            self._pending.append((entry, args, kwargs))
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
 
-            if entry["type"] == "once":
-                self.off(event, entry["callback"])
+        if self._loop_thread_id == threading.get_ident():
+            self._loop.call_soon(self._drain)
+        else:
+            self._loop.call_soon_threadsafe(self._drain)
 
-    async def _safe_invoke(self, callback: Callable, *args, **kwargs):
+    def _drain(self):
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = []
+            self._drain_scheduled = False
+
+        for entry, args, kwargs in pending:
+            self._invoke(entry, args, kwargs)
+
+    def _invoke(self, entry: tuple, args: tuple, kwargs: dict):
+        callback, _, is_coroutine, _ = entry
         try:
             result = callback(*args, **kwargs)
-            if asyncio.iscoroutine(result):
-                await result
         except Exception as e:
             print(f"[EventEmitter] Error in event callback: {e}")
+            return
+
+        if is_coroutine or asyncio.iscoroutine(result):
+            self._run_coroutine(result)
+
+    def _run_coroutine(self, coro):
+        loop = self._loop
+        if loop is None:
+            try:
+                asyncio.get_running_loop().create_task(self._safe_await(coro))
+            except RuntimeError:
+                # Loop-less mode: run the coroutine to completion here
+                asyncio.run(self._safe_await(coro))
+        elif self._loop_thread_id == threading.get_ident():
+            loop.create_task(self._safe_await(coro))
+        else:
+            asyncio.run_coroutine_threadsafe(self._safe_await(coro), loop)
+
+    async def _safe_await(self, coro):
+        try:
+            await coro
+        except Exception as e:
+            print(f"[EventEmitter] Error in event callback: {e}")
+
+
+def _takes_timestamp(callback) -> bool:
+    try:
+        parameter = inspect.signature(callback).parameters.get("timestamp")
+    except (TypeError, ValueError):
+        return False
+    return parameter is not None and parameter.kind in (
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        inspect.Parameter.KEYWORD_ONLY,
+    )
@@ -0,0 +1,196 @@
+# src/core/metrics_registry.py
+
+import os
+import threading
+
+from .spi_metrics import Histogram
+
+
+class Counter:
+    """
+    Monotonic counter. inc() is a plain attribute update with no lock:
+    each counter must have a single writer (the driver's IRQ thread).
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def samples(self):
+        return (("_total", None, self.value),)
+
+
+class Gauge:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def set(self, value):
+        self.value = value
+
+    def samples(self):
+        return (("", None, self.value),)
+
+
+def histogram_samples(histogram: Histogram, labels: dict = None):
+    """
+    OpenMetrics _bucket/_count/_sum samples for a Histogram. A histogram
+    with a negative bucket bound (RSSI, SNR) must not carry _sum, and
+    _count only comes with _sum, so those expose _bucket alone: the +Inf
+    bucket holds the count.
+    """
+    samples = []
+    running = 0
+    for bound, n in zip((*histogram.bounds, float("inf")), histogram.counts):
+        running += n
+        le = "+Inf" if bound == float("inf") else repr(float(bound))
+        samples.append(("_bucket", {**(labels or {}), "le": le}, running))
+    if not histogram.bounds or histogram.bounds[0] >= 0:
+        samples.append(("_count", labels, histogram.count))
+        samples.append(("_sum", labels, histogram.total))
+    return samples
+
+
+class MetricsRegistry:
+    """
+    A set of named metrics rendered as OpenMetrics text on demand.
+
+    Counters, gauges and histograms created here are updated by their
+    owner with plain attribute writes; rendering reads them without
+    stopping the writers, so a scrape may see one update half applied
+    across two metrics but never a torn value. Collectors added with
+    add_collector() are called at render time and return extra families
+    as (name, type, help, samples) tuples, where samples are (suffix,
+    labels, value).
+
+    render() returns the text, write() replaces a file atomically and
+    serve() exposes /metrics over HTTP from a daemon thread.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+        self._server = None
+
+    # ---------------------------------------------------------------------
+    # METRICS
+    # ---------------------------------------------------------------------
+
+    def _get(self, name, kind, help_text, factory):
+        entry = self._metrics.get(name)
+        if entry is None:
+            entry = self._metrics[name] = (kind, help_text, factory())
+        elif entry[0] != kind:
+            raise ValueError(f"{name} is already registered as a {entry[0]}")
+        return entry[2]
+
+    def counter(self, name: str, help_text: str = "") -> Counter:
+        return self._get(name, "counter", help_text, Counter)
+
+    def gauge(self, name: str, help_text: str = "") -> Gauge:
+        return self._get(name, "gauge", help_text, Gauge)
+
+    def histogram(self, name: str, help_text: str = "", buckets=()) -> Histogram:
+        return self._get(name, "histogram", help_text, lambda: Histogram(buckets))
+
+    def add_collector(self, collector):
+        self._collectors.append(collector)
+
+    def remove_collector(self, collector):
+        self._collectors.remove(collector)
+
+    def families(self):
+        for name, (kind, help_text, metric) in list(self._metrics.items()):
+            if kind == "histogram":
+                yield (name, kind, help_text, histogram_samples(metric))
+            else:
+                yield (name, kind, help_text, metric.samples())
+        for collector in list(self._collectors):
+            yield from collector()
+
+    # ---------------------------------------------------------------------
+    # EXPOSITION
+    # ---------------------------------------------------------------------
+
+    def render(self) -> str:
+        lines = []
+        for name, kind, help_text, samples in self.families():
+            lines.append(f"# TYPE {name} {kind}")
+            if help_text:
+                lines.append(f"# HELP {name} {_escape(help_text)}")
+            for suffix, labels, value in samples:
+                lines.append(f"{name}{suffix}{_labels(labels)} {value}")
+        lines.append("# EOF\n")
+        return "\n".join(lines)
+
+    def write(self, path: str):
+        """Render to 'path' via a temporary file and rename, so readers never see a partial file."""
+        import tempfile
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".metrics-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self.render())
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def serve(self, port: int = 0, host: str = "127.0.0.1"):
+        """
+        Serve GET /metrics on host:port from a daemon thread and return
+        the server (its server_address holds the bound port).
+        """
+        if self._server is not None:
+            return self._server
+        # http.server pulls in email, socket and ssl: only load it when serving
+        import http.server
+
+        registry = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header(
+                    "Content-Type",
+                    "application/openmetrics-text; version=1.0.0; charset=utf-8",
+                )
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self._server = server
+        return server
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def _escape(text) -> str:
+    return str(text).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
@@ -0,0 +1,70 @@
+# src/core/packet_queue.py
+
+import threading
+from collections import deque
+
+from ..sx1262_constants import DROP_OLDEST, DROP_NEWEST, RX_QUEUE_SIZE
+
+
+class PacketQueue:
+    """
+    Bounded, thread-safe FIFO between the IRQ thread and packet consumers.
+
+    put() never blocks: when the queue is full, DROP_OLDEST discards the
+    oldest queued item to make room and DROP_NEWEST discards the incoming
+    one. Either way the loss is counted in 'dropped', so a slow consumer
+    can fall behind without stalling the radio or losing data silently.
+    """
+
+    def __init__(self, maxsize: int = RX_QUEUE_SIZE, drop_policy: int = DROP_OLDEST):
+        if drop_policy not in (DROP_OLDEST, DROP_NEWEST):
+            raise ValueError("drop_policy must be DROP_OLDEST or DROP_NEWEST")
+        self.maxsize = maxsize
+        self.drop_policy = drop_policy
+        self.received = 0
+        self.dropped = 0
+        self._items = deque()
+        self._not_empty = threading.Condition(threading.Lock())
+        # Optional callable run (outside the lock) after every put(), used
+        # to wake an asyncio consumer
+        self.wakeup = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, item) -> bool:
+        """Queue 'item'. Returns False if an item had to be dropped."""
+        with self._not_empty:
+            self.received += 1
+            kept = True
+            if len(self._items) >= self.maxsize:
+                self.dropped += 1
+                kept = False
+                if self.drop_policy == DROP_NEWEST:
+                    return kept
+                self._items.popleft()
+            self._items.append(item)
+            self._not_empty.notify()
+        wakeup = self.wakeup
+        if wakeup is not None:
+            wakeup()
+        return kept
+
+    def get(self, timeout: float = None):
+        """Remove and return the oldest item, or None after 'timeout' seconds."""
+        with self._not_empty:
+            if not self._items and not self._not_empty.wait_for(
+                lambda: self._items, timeout
+            ):
+                return None
+            return self._items.popleft()
+
+    def get_nowait(self):
+        with self._not_empty:
+            if not self._items:
+                return None
+            return self._items.popleft()
+
+    def clear(self):
+        with self._not_empty:
+            self._items.clear()
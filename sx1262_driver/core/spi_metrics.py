@@ -0,0 +1,130 @@
+# src/core/spi_metrics.py
+
+from bisect import bisect_left
+
+from ..sx1262_constants import SPI_LATENCY_BUCKETS
+
+# Opcode -> command name, for readable metrics
+OPCODE_NAMES = {
+    0x84: "SetSleep",
+    0x80: "SetStandby",
+    0xC1: "SetFs",
+    0x83: "SetTx",
+    0x82: "SetRx",
+    0x9F: "StopTimerOnPreamble",
+    0x94: "SetRxDutyCycle",
+    0xC5: "SetCad",
+    0xD1: "SetTxContinuousWave",
+    0xD2: "SetTxInfinitePreamble",
+    0x96: "SetRegulatorMode",
+    0x89: "Calibrate",
+    0x98: "CalibrateImage",
+    0x95: "SetPaConfig",
+    0x93: "SetRxTxFallbackMode",
+    0x0D: "WriteRegister",
+    0x1D: "ReadRegister",
+    0x0E: "WriteBuffer",
+    0x1E: "ReadBuffer",
+    0x08: "SetDioIrqParams",
+    0x12: "GetIrqStatus",
+    0x02: "ClearIrqStatus",
+    0x9D: "SetDio2AsRfSwitchCtrl",
+    0x97: "SetDio3AsTcxoCtrl",
+    0x86: "SetRfFrequency",
+    0x8A: "SetPacketType",
+    0x11: "GetPacketType",
+    0x8E: "SetTxParams",
+    0x8B: "SetModulationParams",
+    0x8C: "SetPacketParams",
+    0x88: "SetCadParams",
+    0x8F: "SetBufferBaseAddress",
+    0xA0: "SetLoRaSymbNumTimeout",
+    0xC0: "GetStatus",
+    0x15: "GetRssiInst",
+    0x13: "GetRxBufferStatus",
+    0x14: "GetPacketStatus",
+    0x17: "GetDeviceErrors",
+    0x07: "ClearDeviceErrors",
+    0x10: "GetStats",
+    0x00: "ResetStats",
+}
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram. counts[i] holds observations <= bounds[i]
+    (and > bounds[i - 1]); the last count is the overflow bucket.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds=SPI_LATENCY_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def snapshot(self) -> dict:
+        """Count, sum, max and cumulative counts per upper bound ('+Inf' last)."""
+        buckets = {}
+        running = 0
+        for bound, n in zip((*self.bounds, float("inf")), self.counts):
+            running += n
+            buckets[bound] = running
+        return {
+            "count": self.count,
+            "sum_s": self.total,
+            "max_s": self.max,
+            "buckets": buckets,
+        }
+
+
+class SpiMetrics:
+    """
+    Per-opcode SPI transaction statistics: calls, bytes clocked, and
+    histograms of the BUSY wait before each command and of the transfer
+    itself (CS toggling included). Not thread-safe; the driver records
+    under its bus lock.
+    """
+
+    def __init__(self, bounds=SPI_LATENCY_BUCKETS):
+        self.bounds = tuple(bounds)
+        # opcode -> [calls, bytes, busy Histogram, transfer Histogram]
+        self._opcodes = {}
+
+    def record(self, opcode: int, n_bytes: int, busy_s: float, transfer_s: float):
+        stats = self._opcodes.get(opcode)
+        if stats is None:
+            stats = self._opcodes[opcode] = [
+                0,
+                0,
+                Histogram(self.bounds),
+                Histogram(self.bounds),
+            ]
+        stats[0] += 1
+        stats[1] += n_bytes
+        stats[2].observe(busy_s)
+        stats[3].observe(transfer_s)
+
+    def snapshot(self) -> dict:
+        return {
+            opcode: {
+                "name": OPCODE_NAMES.get(opcode, f"0x{opcode:02X}"),
+                "calls": calls,
+                "bytes": n_bytes,
+                "busy": busy.snapshot(),
+                "transfer": transfer.snapshot(),
+            }
+            for opcode, (calls, n_bytes, busy, transfer) in self._opcodes.items()
+        }
+
+    def reset(self):
+        self._opcodes.clear()
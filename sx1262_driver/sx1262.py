@@ -1,19 +1,21 @@
 
-import spidev
-import lgpio
 import time
 
 from .core.event_emitter import EventEmitter
+from .transport import LgpioTransport
 from .base_lora import BaseLoRa
 from .sx1262_vars import SX1262Vars
 from .sx1262_api import SX1262Api
 from .sx1262_common import SX1262Common
 from .sx1262_hardware import SX1262Hardware
 from .sx1262_modem import SX1262Modem
+from .sx1262_config import SX1262Config
 from .sx1262_receive import SX1262Receive
 from .sx1262_transmit import SX1262Transmit
 from .sx1262_status import SX1262Status
 from .sx1262_interrupt import SX1262Interrupt
+from .sx1262_async import SX1262Async
+from .sx1262_lbt import SX1262Lbt
 
 
 class SX1262(
@@ -23,17 +25,19 @@ class SX1262(
     SX1262Common,
     SX1262Hardware,
     SX1262Modem,
+    SX1262Config,
     SX1262Receive,
     SX1262Transmit,
     SX1262Status,
     SX1262Interrupt,
+    SX1262Async,
+    SX1262Lbt,
     BaseLoRa,
 ):
-    def __init__(self):
+    def __init__(self, transport=None):
         super().__init__()
 
-        self.spi = spidev.SpiDev()
-
-        # lgpio: open /dev/gpiochip0 explicitly and keep a handle
-        self.gpio_chip = lgpio.gpiochip_open(0)
-        
\ No newline at end of file
+        # SPI/GPIO backend; defaults to spidev + lgpio on /dev/gpiochip0
+        if transport is None:
+            transport = LgpioTransport()
+        self.transport = transport
@@ -0,0 +1,105 @@
+import math
+from functools import lru_cache
+
+from .sx1262_constants import *
+
+# LoRa bandwidth register values -> bandwidth in Hz
+BW_HZ = {
+    BW_7800: 7810,
+    BW_10400: 10420,
+    BW_15600: 15630,
+    BW_20800: 20830,
+    BW_31250: 31250,
+    BW_41700: 41670,
+    BW_62500: 62500,
+    BW_125000: 125000,
+    BW_250000: 250000,
+    BW_500000: 500000,
+}
+
+# Symbol time above which the datasheet requires LowDataRateOptimize
+LDRO_SYMBOL_TIME = 16.38e-3
+
+
+def lora_bandwidth(bw: int) -> int:
+    """SetModulationParams bandwidth value for a bandwidth in Hz."""
+    if bw < 9100:
+        return BW_7800
+    elif bw < 13000:
+        return BW_10400
+    elif bw < 18200:
+        return BW_15600
+    elif bw < 26000:
+        return BW_20800
+    elif bw < 36500:
+        return BW_31250
+    elif bw < 52100:
+        return BW_41700
+    elif bw < 93800:
+        return BW_62500
+    elif bw < 187500:
+        return BW_125000
+    elif bw < 375000:
+        return BW_250000
+    return BW_500000
+
+
+def symbol_time(sf: int, bw_hz: int) -> float:
+    """Duration of one LoRa symbol in seconds."""
+    return (1 << sf) / bw_hz
+
+
+def ldro_required(sf: int, bw_hz: int) -> bool:
+    return symbol_time(sf, bw_hz) >= LDRO_SYMBOL_TIME
+
+
+def time_on_air(
+    payload_length: int,
+    sf: int,
+    bw_hz: int,
+    cr: int,
+    preamble_length: int,
+    implicit_header: bool,
+    crc: bool,
+    ldro: bool,
+) -> float:
+    """
+    LoRa time on air in seconds (SX1261/2 datasheet, section 6.1.4).
+    'cr' is the coding rate denominator, 5..8 for 4/5..4/8.
+    """
+    table = airtime_table(sf, bw_hz, cr, preamble_length, implicit_header, crc, ldro)
+    return table[payload_length]
+
+
+@lru_cache(maxsize=32)
+def airtime_table(
+    sf: int,
+    bw_hz: int,
+    cr: int,
+    preamble_length: int,
+    implicit_header: bool,
+    crc: bool,
+    ldro: bool,
+) -> tuple:
+    """
+    Time on air in seconds for every payload length 0..255 under one modem
+    configuration. Tables are cached, so lookups after the first are a
+    tuple index.
+    """
+    t_sym = symbol_time(sf, bw_hz)
+    crc_bits = 16 if crc else 0
+    header_bits = 0 if implicit_header else 20
+
+    if sf < 7:
+        fixed = preamble_length + 6.25 + 8
+        offset = crc_bits - 4 * sf + header_bits
+        divisor = 4 * sf
+    else:
+        fixed = preamble_length + 4.25 + 8
+        offset = crc_bits - 4 * sf + 8 + header_bits
+        divisor = 4 * (sf - 2) if ldro else 4 * sf
+
+    return tuple(
+        (fixed + math.ceil(max(8 * length + offset, 0) / divisor) * cr) * t_sym
+        for length in range(256)
+    )
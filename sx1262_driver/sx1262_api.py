@@ -1,19 +1,86 @@
-import lgpio
+import threading
+import time
+from contextlib import contextmanager
+
 from .sx1262_constants import *
 
+# Longest command frame: opcode + 2 address bytes + status NOP + 256 data bytes
+SPI_FRAME_SIZE = 260
+
+_ZEROS = memoryview(bytes(SPI_FRAME_SIZE))
+
+# Registers the chip changes on its own; never served from the shadow cache
+_VOLATILE_REGISTERS = frozenset((REG_RTC_CONTROL, REG_EVENT_MASK))
+
+# Configuration commands whose last frame restore() re-sends after reset or
+# cold sleep, in bring-up order: regulator and TCXO before calibration,
+# packet type before the parameters that depend on it
+_RESTORE_ORDER = (
+    0x96,  # SetRegulatorMode
+    0x97,  # SetDio3AsTcxoCtrl
+    0x89,  # Calibrate
+    0x9D,  # SetDio2AsRfSwitchCtrl
+    0x8A,  # SetPacketType
+    0x98,  # CalibrateImage
+    0x86,  # SetRfFrequency
+    0x95,  # SetPaConfig
+    0x8E,  # SetTxParams
+    0x8F,  # SetBufferBaseAddress
+    0x8B,  # SetModulationParams
+    0x8C,  # SetPacketParams
+    0x88,  # SetCadParams
+    0x08,  # SetDioIrqParams
+    0x93,  # SetRxTxFallbackMode
+    0xA0,  # SetLoRaSymbNumTimeout
+    0x9F,  # StopTimerOnPreamble
+)
+_RETAINED_OPCODES = frozenset(_RESTORE_ORDER)
+
+
 class SX1262Api:
     def __init__(self):
         super().__init__()
+        # Reusable scratch frame for command encoding; guarded by _bus_lock
+        # together with the BUSY wait so IRQ and user threads never interleave
+        self._frame = bytearray(SPI_FRAME_SIZE)
+        self._frame_view = memoryview(self._frame)
+        self._bus_lock = threading.RLock()
+        # Frames queued by batch(); None when not batching
+        self._batch = None
+        # Callbacks to run once the outermost batch has been sent
+        self._batch_hooks = []
+        # Shadow of register bytes the driver has read or written
+        # (address -> value) and the last packet type set; see
+        # _invalidate_registers()
+        self._reg_cache = {}
+        self._packet_type = None
+        # What the chip should hold, kept across reset and cold sleep for
+        # restore(): the last frame of each configuration command and every
+        # register byte written (address -> value)
+        self._retained_frames = {}
+        self._retained_registers = {}
 
     # OPERATIONAL MODES COMMANDS
 
     def set_sleep(self, sleep_config: int):
+        self._mode = STATUS_MODE_SLEEP
+        if not sleep_config & SLEEP_WARM_START:
+            # Cold start: configuration, registers and buffer are lost
+            self._lose_config()
         self._write_bytes(0x84, (sleep_config,), 1)
+        self._sleep_config = sleep_config
+        self._slept_at = time.perf_counter()
+        self._wake_started = None
 
     def set_standby(self, stby_config: int):
+        if stby_config == STANDBY_XOSC:
+            self._mode = STATUS_MODE_STDBY_XOSC
+        else:
+            self._mode = STATUS_MODE_STDBY_RC
         self._write_bytes(0x80, (stby_config,), 1)
 
     def set_fs(self):
+        self._mode = STATUS_MODE_FS
         self._write_bytes(0xC1, (), 0)
 
     def set_tx(self, timeout: int):
@@ -22,7 +89,11 @@ class SX1262Api:
             (timeout >> 8) & 0xFF,
             timeout & 0xFF,
         )
+        self._mode = STATUS_MODE_TX
         self._write_bytes(0x83, buf, 3)
+        if self._wake_started is not None:
+            self._wake_to_tx.observe(time.perf_counter() - self._wake_started)
+            self._wake_started = None
 
     def set_rx(self, timeout: int):
         buf = (
@@ -30,7 +101,9 @@ class SX1262Api:
             (timeout >> 8) & 0xFF,
             timeout & 0xFF,
         )
+        self._mode = STATUS_MODE_RX
         self._write_bytes(0x82, buf, 3)
+        self._wake_started = None
 
     def set_timer_on_preamble(self, enable: int):
         self._write_bytes(0x9F, (enable,), 1)
@@ -44,21 +117,31 @@ class SX1262Api:
             (sleep_period >> 8) & 0xFF,
             sleep_period & 0xFF,
         )
+        self._mode = STATUS_MODE_RX
         self._write_bytes(0x94, buf, 6)
 
     def set_cad(self):
+        # GetStatus reports RX mode while CAD runs
+        self._mode = STATUS_MODE_RX
         self._write_bytes(0xC5, (), 0)
 
     def set_tx_continuous_wave(self):
+        self._mode = STATUS_MODE_TX
         self._write_bytes(0xD1, (), 0)
 
     def set_tx_infinite_preamble(self):
+        self._mode = STATUS_MODE_TX
         self._write_bytes(0xD2, (), 0)
 
     def set_regulator_mode(self, mode_param: int):
         self._write_bytes(0x96, (mode_param,), 1)
 
     def calibrate(self, calib_param: int):
+        # Calibration rewrites trim registers
+        self._reg_cache.clear()
+        if calib_param & 0x40:
+            # Image calibration returns to the default band
+            self._image_band = None
         self._write_bytes(0x89, (calib_param,), 1)
 
     def calibrate_image(self, freq1: int, freq2: int):
@@ -72,30 +155,121 @@ class SX1262Api:
         self._write_bytes(0x95, buf, 4)
 
     def set_rx_tx_fallback_mode(self, fallback_mode: int):
+        self._fallback_mode = fallback_mode
         self._write_bytes(0x93, (fallback_mode,), 1)
 
     # REGISTER AND BUFFER ACCESS COMMANDS
 
-    def write_register(self, address: int, data: tuple, n_data: int):
-        buf = (
+    def write_register(self, address: int, data, n_data: int):
+        addr = (
             (address >> 8) & 0xFF,
             address & 0xFF,
-        ) + tuple(data)
-        self._write_bytes(0x0D, buf, n_data + 2)
+        )
+        # Cache first: a write dropped on BUSY timeout clears the cache
+        cache = self._reg_cache
+        retained = self._retained_registers
+        for i, value in enumerate(data[:n_data]):
+            if address + i not in _VOLATILE_REGISTERS:
+                cache[address + i] = value
+                retained[address + i] = value
+        self._write_bytes(0x0D, data, n_data, addr, 2)
+
+    def read_register(self, address: int, n_data: int) -> memoryview:
+        """
+        Read n_data register bytes. Served from the shadow cache when every
+        byte is known; otherwise read from the chip and cached.
+        """
+        cache = self._reg_cache
+        try:
+            known = [cache[a] for a in range(address, address + n_data)]
+            return memoryview(bytes(known))
+        except KeyError:
+            pass
 
-    def read_register(self, address: int, n_data: int) -> tuple:
         addr = (
             (address >> 8) & 0xFF,
             address & 0xFF,
         )
-        buf = self._read_bytes(0x1D, n_data + 1, addr, 2)
-        return buf[1:]
-
-    def write_buffer(self, offset: int, data: tuple, n_data: int):
-        buf = (offset,) + tuple(data)
-        self._write_bytes(0x0E, buf, n_data + 1)
-
-    def read_buffer(self, offset: int, n_data: int) -> tuple:
+        buf = self._read_bytes(0x1D, n_data + 1, addr, 2)[1:]
+        for i, value in enumerate(buf):
+            if address + i not in _VOLATILE_REGISTERS:
+                cache[address + i] = value
+        return buf
+
+    def update_register(self, address: int, value: int, mask: int = 0xFF) -> bool:
+        """
+        Set the bits of one register byte selected by 'mask' to 'value'.
+        Nothing is written when the register already holds that value.
+        Returns True if a write was issued.
+        """
+        current = self.read_register(address, 1)
+        if not current:
+            return False
+        new = (current[0] & ~mask & 0xFF) | (value & mask)
+        if new == current[0]:
+            return False
+        self.write_register(address, (new,), 1)
+        return True
+
+    def _invalidate_registers(self):
+        """Forget everything the shadow cache knows (reset, cold sleep)."""
+        self._reg_cache.clear()
+        self._packet_type = None
+        self._buffer_bases = None
+        # The chip lost its configuration too; the next apply() sends it all
+        self._applied_config = None
+        self._image_band = None
+
+    def _lose_config(self):
+        """
+        The chip lost its configuration and buffer (reset, cold sleep).
+        Keep the applied RadioConfig for restore() and forget the rest.
+        """
+        self._restore_config = self._applied_config
+        self._invalidate_registers()
+        self._ring.clear()
+
+    def restore(self) -> int:
+        """
+        Re-send the configuration the chip lost in reset() or cold sleep:
+        the last frame of each configuration command in bring-up order,
+        then every register byte the driver wrote, adjacent addresses
+        merged into one WriteRegister. All of it goes out in one batch.
+        Call in standby. Returns the number of commands sent.
+        """
+        frames = self._retained_frames
+        runs = []
+        for address in sorted(self._retained_registers):
+            value = self._retained_registers[address]
+            if runs and runs[-1][0] + len(runs[-1][1]) == address:
+                runs[-1][1].append(value)
+            else:
+                runs.append((address, [value]))
+
+        with self.batch():
+            for opcode in _RESTORE_ORDER:
+                frame = frames.get(opcode)
+                if frame is not None:
+                    self._write_bytes(opcode, frame[1:], len(frame) - 1)
+            for address, values in runs:
+                self.write_register(address, values, len(values))
+
+        # Shadow state of what was just put back
+        if 0x8A in frames:
+            self._packet_type = frames[0x8A][1]
+        if 0x8F in frames:
+            self._buffer_bases = tuple(frames[0x8F][1:3])
+        if 0x98 in frames:
+            self._image_band = tuple(frames[0x98][1:3])
+        if 0x93 in frames:
+            self._fallback_mode = frames[0x93][1]
+        self._applied_config = self._restore_config
+        return sum(opcode in frames for opcode in _RESTORE_ORDER) + len(runs)
+
+    def write_buffer(self, offset: int, data, n_data: int):
+        self._write_bytes(0x0E, data, n_data, (offset,), 1)
+
+    def read_buffer(self, offset: int, n_data: int) -> memoryview:
         buf = self._read_bytes(0x1E, n_data + 1, (offset,), 1)
         return buf[1:]
 
@@ -151,10 +325,16 @@ class SX1262Api:
         self._write_bytes(0x86, buf, 4)
 
     def set_packet_type(self, packet_type: int):
+        self._packet_type = packet_type
         self._write_bytes(0x8A, (packet_type,), 1)
 
     def get_packet_type(self) -> int:
+        if self._packet_type is not None:
+            return self._packet_type
         buf = self._read_bytes(0x11, 2)
+        if len(buf) < 2:
+            return 0
+        self._packet_type = buf[1]
         return buf[1]
 
     def set_tx_params(self, power: int, ramp_time: int):
@@ -242,10 +422,12 @@ class SX1262Api:
             (cad_timeout >> 8) & 0xFF,
             cad_timeout & 0xFF,
         )
+        self._cad_exit_mode = cad_exit_mode
         self._write_bytes(0x88, buf, 7)
 
     def set_buffer_base_address(self, tx_base_address: int, rx_base_address: int):
         buf = (tx_base_address, rx_base_address)
+        self._buffer_bases = buf
         self._write_bytes(0x8F, buf, 2)
 
     def set_lora_symb_num_timeout(self, symbnum: int):
@@ -258,13 +440,10 @@ class SX1262Api:
         return buf[0]
 
     def get_chip_status(self):
-        if self.busy_check():
-            return None
-
-        lgpio.gpio_write(self.gpio_chip, self._cs_define, 0)
-        resp = self.spi.xfer2([0xC0, 0])
-        lgpio.gpio_write(self.gpio_chip, self._cs_define, 1)
-        return resp
+        with self._bus_lock:
+            if self.busy_check(opcode=0xC0):
+                return None
+            return self._transfer(b"\xc0\x00")
 
     def get_rx_buffer_status(self) -> tuple:
         buf = self._read_bytes(0x13, 3)
@@ -299,9 +478,9 @@ class SX1262Api:
     def get_stats(self) -> tuple:
         buf = self._read_bytes(0x10, 7)
         return (
-            (buf[1] >> 8) | buf[2],
-            (buf[3] >> 8) | buf[4],
-            (buf[5] >> 8) | buf[6],
+            (buf[1] << 8) | buf[2],
+            (buf[3] << 8) | buf[4],
+            (buf[5] << 8) | buf[6],
         )
 
     def reset_stats(self):
@@ -309,8 +488,8 @@ class SX1262Api:
         self._write_bytes(0x00, buf, 6)
 
     def get_device_errors(self) -> int:
-        buf = self._read_bytes(0x17, 2)
-        return buf[1]
+        buf = self._read_bytes(0x17, 3)
+        return (buf[1] << 8) | buf[2]
 
     def clear_device_errors(self):
         buf = (0, 0)
@@ -320,41 +499,169 @@ class SX1262Api:
 
     def _fix_lora_bw500(self, bw: int):
         packet_type = self.get_packet_type()
-        buf = self.read_register(REG_TX_MODULATION, 1)
-        value = buf[0] | 0x04
+        value = 0x04
         if packet_type == LORA_MODEM and bw == BW_500000:
-            value = buf[0] & 0xFB
-        self.write_register(REG_TX_MODULATION, (value,), 1)
+            value = 0x00
+        self.update_register(REG_TX_MODULATION, value, 0x04)
 
     def _fix_resistance_antenna(self):
-        buf = self.read_register(REG_TX_CLAMP_CONFIG, 1)
-        value = buf[0] | 0x1E
-        self.write_register(REG_TX_CLAMP_CONFIG, (value,), 1)
+        self.update_register(REG_TX_CLAMP_CONFIG, 0x1E, 0x1E)
 
     def _fix_rx_timeout(self):
+        # Both registers are volatile, so this always goes to the chip
         self.write_register(REG_RTC_CONTROL, (0,), 1)
         buf = self.read_register(REG_EVENT_MASK, 1)
         value = buf[0] | 0x02
         self.write_register(REG_EVENT_MASK, (value,), 1)
 
     def _fix_inverted_iq(self, invert_iq: bool):
-        buf = self.read_register(REG_IQ_POLARITY_SETUP, 1)
-        value = buf[0] & 0xFB
-        if invert_iq:
-            value = buf[0] | 0x04
-        self.write_register(REG_IQ_POLARITY_SETUP, (value,), 1)
+        value = 0x04 if invert_iq else 0x00
+        self.update_register(REG_IQ_POLARITY_SETUP, value, 0x04)
+
+    # COMMAND BATCHING
+
+    @contextmanager
+    def batch(self):
+        """
+        Queue write commands issued inside the block and send them together
+        when it exits. With a transport that supports_batch the whole block
+        goes out in one bus operation (one ioctl on IoctlTransport); other
+        transports send the frames one by one as before. A read inside the
+        block flushes the queue first, so ordering is always preserved.
+        The bus lock is held for the duration of the block.
+        """
+        with self._bus_lock:
+            outer = self._batch is None
+            if outer:
+                self._batch = []
+            try:
+                yield self
+                if outer:
+                    self._flush_batch()
+            finally:
+                if outer:
+                    self._batch = None
+                    self._batch_hooks = []
+
+    def _after_flush(self, hook):
+        """
+        Call hook() once the frames queued so far have gone out: at the
+        next flush (the outermost batch() exiting, or a read inside it),
+        or at once outside a batch. Hooks run with the bus lock held.
+        """
+        if self._batch is None:
+            hook()
+        else:
+            self._batch_hooks.append(hook)
+
+    def _flush_batch(self):
+        frames = self._batch
+        if frames:
+            self._batch = []
+            self._send_batch(frames)
+        hooks = self._batch_hooks
+        if hooks:
+            self._batch_hooks = []
+            for hook in hooks:
+                hook()
+
+    def _send_batch(self, frames):
+        if self.busy_check(opcode=frames[0][0]):
+            self._mode = STATUS_MODE_UNKNOWN
+            self._invalidate_registers()
+            return
+        if self.transport.supports_batch:
+            if self._spi_metrics is None:
+                responses = self.transport.transfer_many(frames)
+            else:
+                responses = self._metered_transfer_many(frames)
+            if len(responses) < len(frames):
+                # BUSY stuck high mid-batch, as in busy_check()
+                self._mode = STATUS_MODE_UNKNOWN
+                self._invalidate_registers()
+            return
+        self._transfer(frames[0])
+        for frame in frames[1:]:
+            if self.busy_check(opcode=frame[0]):
+                self._mode = STATUS_MODE_UNKNOWN
+                self._invalidate_registers()
+                return
+            self._transfer(frame)
+
+    def _read_many(self, reads) -> list:
+        """
+        Issue several read commands, each given as (opcode, n_bytes,
+        address, n_address) like _read_bytes(), and return one memoryview
+        per command. With a batching transport all reads share one bus
+        operation; the caller must know they need no BUSY wait in between.
+        """
+        if not self.transport.supports_batch:
+            with self._bus_lock:
+                return [self._read_bytes(*read) for read in reads]
+
+        frames = [
+            bytes((opcode,)) + bytes(address[:n_address]) + bytes(n_bytes)
+            for opcode, n_bytes, address, n_address in reads
+        ]
+        with self._bus_lock:
+            if self._batch:
+                self._flush_batch()
+            if self.busy_check(opcode=frames[0][0]):
+                return [memoryview(b"")] * len(reads)
+            if self._spi_metrics is None:
+                responses = self.transport.transfer_many(frames)
+            else:
+                responses = self._metered_transfer_many(frames)
+        views = [memoryview(b"")] * len(reads)
+        for i, (resp, read) in enumerate(zip(responses, reads)):
+            views[i] = memoryview(resp)[1 + read[3] :]
+        return views
 
     # UTILITIES
 
-    def _write_bytes(self, opcode: int, data: tuple, n_bytes: int):
-        if self.busy_check():
-            return
-        lgpio.gpio_write(self.gpio_chip, self._cs_define, 0)
-        buf = [opcode]
-        for i in range(n_bytes):
-            buf.append(data[i])
-        self.spi.xfer2(buf)
-        lgpio.gpio_write(self.gpio_chip, self._cs_define, 1)
+    def _write_bytes(
+        self,
+        opcode: int,
+        data,
+        n_bytes: int,
+        address: tuple = (),
+        n_address: int = 0,
+    ):
+        """
+        Encode opcode, address and payload into the scratch frame and send
+        it. 'data' may be a tuple/list of ints or any bytes-like object;
+        bytes-like payloads are copied into the frame with a single memcpy.
+        Extra data bytes are ignored; missing ones raise ValueError.
+        """
+        if len(data) != n_bytes:
+            if len(data) < n_bytes:
+                raise ValueError(
+                    f"opcode {opcode:#04x} needs {n_bytes} data bytes, got {len(data)}"
+                )
+            data = data[:n_bytes]
+        end = 1 + n_address + n_bytes
+        if end > SPI_FRAME_SIZE:
+            raise ValueError(f"opcode {opcode:#04x} frame of {end} bytes is too long")
+        with self._bus_lock:
+            batch = self._batch
+            if batch is None and self.busy_check(opcode=opcode):
+                # The command was dropped; tracked state can't be trusted
+                self._mode = STATUS_MODE_UNKNOWN
+                self._invalidate_registers()
+                return
+            frame = self._frame
+            frame[0] = opcode
+            if n_address:
+                frame[1 : 1 + n_address] = address
+            frame[1 + n_address : end] = data
+            if opcode in _RETAINED_OPCODES:
+                self._retained_frames[opcode] = bytes(self._frame_view[:end])
+            if batch is not None:
+                batch.append(bytes(self._frame_view[:end]))
+            elif self._spi_metrics is None:
+                self.transport.transfer(self._frame_view[:end])
+            else:
+                self._metered_transfer(self._frame_view[:end])
 
     def _read_bytes(
         self,
@@ -362,15 +669,61 @@ class SX1262Api:
         n_bytes: int,
         address: tuple = (),
         n_address: int = 0,
-    ) -> tuple:
-        if self.busy_check():
-            return ()
-        lgpio.gpio_write(self.gpio_chip, self._cs_define, 0)
-        buf = [opcode]
-        for i in range(n_address):
-            buf.append(address[i])
-        for _ in range(n_bytes):
-            buf.append(0x00)
-        feedback = self.spi.xfer2(buf)
-        lgpio.gpio_write(self.gpio_chip, self._cs_define, 1)
-        return tuple(feedback[n_address + 1 :])
+    ) -> memoryview:
+        """
+        Send opcode and address followed by n_bytes NOPs and return a
+        zero-copy view of the bytes clocked in after the address.
+        """
+        start = 1 + n_address
+        end = start + n_bytes
+        with self._bus_lock:
+            if self._batch:
+                self._flush_batch()
+            if self.busy_check(opcode=opcode):
+                return memoryview(b"")
+            frame = self._frame
+            frame[0] = opcode
+            if n_address:
+                frame[1:start] = address
+            frame[start:end] = _ZEROS[:n_bytes]
+            if self._spi_metrics is None:
+                feedback = self.transport.transfer(self._frame_view[:end])
+            else:
+                feedback = self._metered_transfer(self._frame_view[:end])
+        return memoryview(feedback)[start:]
+
+    def _transfer(self, frame):
+        if self._spi_metrics is None:
+            return self.transport.transfer(frame)
+        return self._metered_transfer(frame)
+
+    def _metered_transfer(self, frame):
+        """transport.transfer() recording the frame in the SPI metrics."""
+        start = time.perf_counter()
+        response = self.transport.transfer(frame)
+        self._spi_metrics.record(
+            frame[0],
+            len(frame),
+            self._busy_waiter.waited,
+            time.perf_counter() - start,
+        )
+        return response
+
+    def _metered_transfer_many(self, frames):
+        """
+        transfer_many() with metrics. The bus operation is timed as a
+        whole and its duration shared out over the frames by length; only
+        the first frame had a BUSY wait.
+        """
+        start = time.perf_counter()
+        responses = self.transport.transfer_many(frames)
+        elapsed = time.perf_counter() - start
+        sent = frames[: len(responses)]
+        total = sum(len(frame) for frame in sent) or 1
+        busy = self._busy_waiter.waited
+        for frame in sent:
+            self._spi_metrics.record(
+                frame[0], len(frame), busy, elapsed * len(frame) / total
+            )
+            busy = 0.0
+        return responses
@@ -0,0 +1,155 @@
+import asyncio
+import time
+
+from .sx1262_constants import *
+
+
+class SX1262Async:
+    def __init__(self):
+        super().__init__()
+        # Pending transmit(): (loop, future) while a packet is on air
+        self._tx_waiter = None
+
+    # ---------------------------------------------------------------------
+    # ASYNCIO TRANSMIT
+    # ---------------------------------------------------------------------
+
+    async def transmit(self, data, timeout: float = None, lbt: bool = False) -> float:
+        """
+        Send 'data' and wait for TX_DONE. Returns the transmit time in
+        seconds. Raises asyncio.TimeoutError if the radio reports a TX
+        timeout or 'timeout' seconds pass first; when given, 'timeout' is
+        also programmed as the hardware TX timeout, otherwise the hardware
+        timeout is derived from the time on air.
+
+        Completion is delivered by resolving a future from the IRQ thread
+        with call_soon_threadsafe; no Task is created per packet. The recv
+        loop is started if it is not already running.
+
+        With lbt the channel is checked with CAD first (see
+        _listen_before_talk()); on a clear result the buffer write, packet
+        parameters and SetTx go out together in one batch. The SX126x has
+        no CAD exit mode that starts TX by itself. Results are counted in
+        lbt_stats().
+        """
+        if self._tx_waiter is not None:
+            raise RuntimeError("transmit already in progress")
+        # A TX started with end_packet() must not have its buffer
+        # overwritten, so check before anything is written
+        if self.get_mode() == STATUS_MODE_TX:
+            raise RuntimeError("radio is already transmitting")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if not self._recv_running:
+            self.start_recv_loop()
+
+        tx_timeout = TX_TIMEOUT_AUTO
+        if timeout is not None:
+            tx_timeout = int(timeout * 1000)
+
+        started = time.monotonic()
+        sent = False
+        self._tx_waiter = (loop, future)
+        try:
+            if lbt:
+                await self._listen_before_talk(self.time_on_air(len(data)))
+                if self.get_mode() == STATUS_MODE_TX:
+                    raise RuntimeError("radio is already transmitting")
+
+            with self.batch():
+                self.begin_packet()
+                self.put(data)
+                ok = self.end_packet(tx_timeout)
+            if not ok:
+                raise RuntimeError("radio is already transmitting")
+            if timeout is None:
+                result = await future
+            else:
+                result = await asyncio.wait_for(future, timeout)
+            sent = True
+            return result
+        finally:
+            self._tx_waiter = None
+            if lbt:
+                self._record_lbt(started, len(data), sent)
+
+    def _resolve_tx(self, transmit_time: float = None, error: Exception = None):
+        """Called from the IRQ thread when a transmit() completes or fails."""
+        waiter = self._tx_waiter
+        if waiter is None:
+            return
+        loop, future = waiter
+        try:
+            loop.call_soon_threadsafe(_settle, future, transmit_time, error)
+        except RuntimeError:
+            # Event loop already closed
+            pass
+
+    # ---------------------------------------------------------------------
+    # ASYNCIO RECEIVE STREAM
+    # ---------------------------------------------------------------------
+
+    async def packets(self, start_rx: bool = True):
+        """
+        Async iterator over received packets:
+
+            async for packet in radio.packets():
+                ...
+
+        Built on the RX pipeline queue (enabled on first use with its
+        default size and drop policy). The IRQ thread wakes the consumer
+        with at most one call_soon_threadsafe per burst, and the consumer
+        drains everything queued before awaiting again. With start_rx the
+        radio is put in RX_CONTINUOUS if it is not already.
+        """
+        queue = self._packet_queue
+        if queue is None:
+            queue = self.enable_rx_pipeline()
+
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+        wake_pending = [False]
+
+        def on_ready():
+            wake_pending[0] = False
+            ready.set()
+
+        def wakeup():
+            if wake_pending[0]:
+                return
+            wake_pending[0] = True
+            try:
+                loop.call_soon_threadsafe(on_ready)
+            except RuntimeError:
+                pass
+
+        queue.wakeup = wakeup
+        if not self._recv_running:
+            self.start_recv_loop()
+        if start_rx and self._status_wait != STATUS_RX_CONTINUOUS:
+            self.request(RX_CONTINUOUS)
+
+        try:
+            while True:
+                packet = queue.get_nowait()
+                if packet is None:
+                    ready.clear()
+                    # Re-check after clearing so a put() in between is not lost
+                    packet = queue.get_nowait()
+                    if packet is None:
+                        await ready.wait()
+                        continue
+                yield packet
+        finally:
+            if queue.wakeup is wakeup:
+                queue.wakeup = None
+
+
+def _settle(future, transmit_time, error):
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(transmit_time)
@@ -0,0 +1,71 @@
+from .sx1262_constants import *
+
+
+def image_calibration_band(frequency: int) -> tuple:
+    """CalibrateImage (freq1, freq2) pair for the band containing 'frequency'."""
+    if frequency < 446000000:
+        return (CAL_IMG_430, CAL_IMG_440)
+    elif frequency < 734000000:
+        return (CAL_IMG_470, CAL_IMG_510)
+    elif frequency < 828000000:
+        return (CAL_IMG_779, CAL_IMG_787)
+    elif frequency < 877000000:
+        return (CAL_IMG_863, CAL_IMG_870)
+    return (CAL_IMG_902, CAL_IMG_928)
+
+
+def frequency_word(frequency: int) -> bytes:
+    """SetRfFrequency payload: frequency * 2^25 / f_xtal, big endian."""
+    rf_freq = frequency * RF_FREQUENCY_NOM // RF_FREQUENCY_XTAL
+    return rf_freq.to_bytes(4, "big")
+
+
+class ChannelPlan:
+    """
+    A fixed list of channel frequencies with the SetRfFrequency payload and
+    image calibration band of each channel computed once, so that
+    SX1262.hop() is a single command when the band does not change.
+    """
+
+    def __init__(self, frequencies):
+        self.frequencies = tuple(int(f) for f in frequencies)
+        self.words = tuple(frequency_word(f) for f in self.frequencies)
+        self.bands = tuple(image_calibration_band(f) for f in self.frequencies)
+
+    @classmethod
+    def uniform(cls, first: int, spacing: int, count: int) -> "ChannelPlan":
+        return cls(first + spacing * n for n in range(count))
+
+    @classmethod
+    def us915(cls, sub_band: int = 0) -> "ChannelPlan":
+        """
+        US915 125 kHz uplink channels 0-63 (902.3 MHz + n * 200 kHz), or
+        the 8 channels of one sub-band when 'sub_band' is 1..8.
+        """
+        return cls._sub_band(cls.uniform(902300000, 200000, 64), sub_band)
+
+    @classmethod
+    def au915(cls, sub_band: int = 0) -> "ChannelPlan":
+        """
+        AU915 125 kHz uplink channels 0-63 (915.2 MHz + n * 200 kHz), or
+        the 8 channels of one sub-band when 'sub_band' is 1..8.
+        """
+        return cls._sub_band(cls.uniform(915200000, 200000, 64), sub_band)
+
+    @classmethod
+    def _sub_band(cls, plan: "ChannelPlan", sub_band: int) -> "ChannelPlan":
+        if not sub_band:
+            return plan
+        if not 1 <= sub_band <= 8:
+            raise ValueError("sub_band must be 1..8")
+        start = (sub_band - 1) * 8
+        return cls(plan.frequencies[start : start + 8])
+
+    def __len__(self) -> int:
+        return len(self.frequencies)
+
+    def __getitem__(self, channel: int) -> int:
+        return self.frequencies[channel]
+
+    def __repr__(self) -> str:
+        return f"ChannelPlan({len(self)} channels, {self.frequencies[0]}..{self.frequencies[-1]} Hz)"
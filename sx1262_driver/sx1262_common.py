@@ -2,11 +2,27 @@ import time
 import threading
 
 from .sx1262_constants import *
-import lgpio
+from .core.busy_wait import BusyWaiter
+from .core.spi_metrics import Histogram, SpiMetrics
+from .sx1262_telemetry import RadioTelemetry
+from .transport.trace import TraceTransport
 
 class SX1262Common:
     def __init__(self):
         super().__init__()
+        self._busy_waiter = None
+        # opcode -> [calls, calls that waited, total wait (s), max wait (s)]
+        self._busy_stats = {}
+        # SPI instrumentation; None (and free) until enable_metrics()
+        self._spi_metrics = None
+        # OpenMetrics telemetry; None until enable_telemetry()
+        self._telemetry = None
+        # Wake-ups by start type, commands re-sent by restore(), and the
+        # latency from wake() to STDBY_RC and to the next SetTx
+        self._wakes = {"warm": 0, "cold": 0, "restored_commands": 0}
+        self._wake_ready = Histogram(WAKE_LATENCY_BUCKETS)
+        self._wake_to_tx = Histogram(WAKE_LATENCY_BUCKETS)
+        self._wake_started = None
 
     def begin(
         self,
@@ -27,7 +43,8 @@ class SX1262Common:
         self.reset()
 
         self.set_standby(STANDBY_RC)
-        if self.get_mode() != STATUS_MODE_STDBY_RC:
+        # The one GetStatus read in bring-up: proves the chip is answering
+        if self.sync_mode() != STATUS_MODE_STDBY_RC:
             return False
 
         self.set_packet_type(LORA_MODEM)
@@ -43,9 +60,7 @@ class SX1262Common:
         self._stop_recv_loop()
 
         self.sleep(SLEEP_COLD_START)
-        self.spi.close()
-        # close gpio chip handle
-        lgpio.gpiochip_close(self.gpio_chip)
+        self.transport.close()
 
     def get_status(self):
         resp = self._read_bytes(0xC0, 1)
@@ -53,47 +68,295 @@ class SX1262Common:
             return None
         return resp[0]
     
-    def get_mode(self) -> int:
+    def get_mode(self, resync: bool = False) -> int:
+        """
+        Chip mode (STATUS_MODE_*) as tracked from the commands the driver
+        issued and the IRQs it handled, without touching the bus. The chip
+        is only read when 'resync' is set or the tracked mode is unknown.
+        """
+        if resync or self._mode == STATUS_MODE_UNKNOWN:
+            return self.sync_mode()
+        return self._mode
+
+    def sync_mode(self) -> int:
+        """Read the mode from GetStatus and make it the tracked mode."""
         status = self.get_status()
         if status is None:
+            self._mode = STATUS_MODE_UNKNOWN
             return 0
-        return status & 0x70
-    
+        self._mode = status & 0x70
+        return self._mode
+
+    def _track_irq_mode(self, irq: int):
+        """
+        Advance the tracked mode for a completed operation. An IRQ the
+        tracked mode can't explain marks it unknown so the next get_mode()
+        reads the chip.
+        """
+        mode = self._mode
+        if irq & IRQ_TX_DONE:
+            expected = mode == STATUS_MODE_TX
+            mode = self._fallback_mode
+        elif irq & (IRQ_RX_DONE | IRQ_TIMEOUT):
+            expected = mode == STATUS_MODE_RX or (
+                irq & IRQ_TIMEOUT and mode == STATUS_MODE_TX
+            )
+            if not (irq & IRQ_RX_DONE and self._status_wait == STATUS_RX_CONTINUOUS):
+                mode = self._fallback_mode
+        elif irq & IRQ_CAD_DONE:
+            expected = mode == STATUS_MODE_RX
+            if irq & IRQ_CAD_DETECTED and self._cad_exit_mode == CAD_EXIT_RX:
+                mode = STATUS_MODE_RX
+            else:
+                mode = STATUS_MODE_STDBY_RC
+        else:
+            return
+
+        if not expected:
+            self._mode_mismatches += 1
+            mode = STATUS_MODE_UNKNOWN
+        self._mode = mode
+
     def get_mode_and_control(self) -> int:
         status = self.get_status()
         if status is None:
             return 0
         return status & 0x7E
 
-    def reset(self) -> bool:
-        lgpio.gpio_write(self.gpio_chip, self._reset, 0)
+    def reset(self, restore: bool = True) -> bool:
+        """
+        Pulse NRESET. The configuration the driver sent before is re-sent
+        with restore() unless 'restore' is False.
+        """
+        self.transport.write_pin(self._reset, 0)
         time.sleep(0.001)
-        lgpio.gpio_write(self.gpio_chip, self._reset, 1)
-        return not self.busy_check()
+        self.transport.write_pin(self._reset, 1)
+        self._lose_config()
+        self._sleep_config = None
+        if self.busy_check():
+            self._mode = STATUS_MODE_UNKNOWN
+            return False
+        # The chip comes out of reset in STDBY_RC with default fallback
+        self._mode = STATUS_MODE_STDBY_RC
+        self._fallback_mode = FALLBACK_MODE
+        if restore:
+            self.restore()
+        return True
 
     def sleep(self, option=SLEEP_WARM_START):
-        self.standby()
+        """
+        Sleep until wake(). SLEEP_WARM_START keeps the configuration in
+        retention memory; a cold start loses it (wake() restores it).
+        """
+        # SetSleep is only accepted in standby
+        if self._mode not in (STATUS_MODE_STDBY_RC, STATUS_MODE_STDBY_XOSC):
+            self.standby()
         self.set_sleep(option)
-        time.sleep(0.0005)
 
-    def wake(self):
-        if self._wake != -1:
-            lgpio.gpio_claim_output(self.gpio_chip, self._wake)
-            lgpio.gpio_write(self.gpio_chip, self._wake, 0)
-            time.sleep(0.0005)
+    def wake(self, restore: bool = True) -> bool:
+        """
+        Wake the chip into STDBY_RC. After a warm start nothing else is
+        sent; after a cold start the recorded configuration is re-sent with
+        restore() unless 'restore' is False. From an unknown state the chip
+        is asked first: BUSY stays high only while it sleeps, and after
+        waking it the configuration is read back to tell a cold start.
+        Returns False if BUSY never dropped.
+        """
+        if self._mode == STATUS_MODE_UNKNOWN and not self.busy_check(WAKE_PROBE_TIMEOUT):
+            # Awake after all: track the mode it reports
+            self.sync_mode()
+        if self._mode not in (STATUS_MODE_SLEEP, STATUS_MODE_UNKNOWN):
+            self.set_standby(STANDBY_RC)
+            return True
 
-        self.set_standby(STANDBY_RC)
+        started = time.perf_counter()
+        sleep_config = self._sleep_config
+        with self._bus_lock:
+            # The chip ignores wake-up for 500 us after SetSleep
+            remaining = self._slept_at + 0.0005 - started
+            if remaining > 0:
+                time.sleep(remaining)
+            if self._wake != -1:
+                self.transport.write_pin(self._wake, 0)
+            else:
+                # An NSS falling edge wakes the chip. BUSY stays high until
+                # it is up, so this frame goes out without busy_check() and
+                # the chip does not execute it
+                self._transfer(bytes((0xC0, 0x00)))
+            if self.busy_check():
+                self._mode = STATUS_MODE_UNKNOWN
+                return False
+            self._mode = STATUS_MODE_STDBY_RC
+            self._sleep_config = None
+        self._wake_ready.observe(time.perf_counter() - started)
+        self._wake_started = started
+
+        if sleep_config is None:
+            cold = self._config_lost()
+        else:
+            cold = not sleep_config & SLEEP_WARM_START
+        if not cold:
+            self._wakes["warm"] += 1
+            return True
+
+        self._wakes["cold"] += 1
+        if sleep_config is None:
+            # Slept without the driver knowing; nothing was dropped yet
+            self._lose_config()
+        if restore:
+            self._wakes["restored_commands"] += self.restore()
+        # Lost in a cold start; a no-op when restore() put it back
         self._fix_resistance_antenna()
+        return True
+
+    def _config_lost(self) -> bool:
+        """
+        Whether the chip came out of a cold start, judged from what it
+        reports: a cold start resets the packet type to GFSK and every
+        register to its default. False if nothing was configured.
+        """
+        frame = self._retained_frames.get(0x8A)
+        if frame is not None and frame[1] != 0x00:
+            status = self._read_bytes(0x11, 2)
+            return len(status) < 2 or status[1] != frame[1]
+        if self._retained_registers:
+            (address, value) = next(iter(self._retained_registers.items()))
+            addr = ((address >> 8) & 0xFF, address & 0xFF)
+            status = self._read_bytes(0x1D, 2, addr, 2)
+            return len(status) < 2 or status[1] != value
+        return False
 
     def standby(self, option=STANDBY_RC):
         self.set_standby(option)
 
-    def busy_check(self, timeout: int = BUSY_TIMEOUT) -> bool:
-        start = time.time()
-        while lgpio.gpio_read(self.gpio_chip, self._busy) == 1:
-            if (time.time() - start) > (timeout / 1000.0):
-                return True
-        return False
+    def busy_check(self, timeout: int = BUSY_TIMEOUT, opcode: int = -1) -> bool:
+        """
+        Wait for BUSY to drop before a command. Returns True on timeout.
+        When 'opcode' is given the wait is recorded in busy_stats().
+        """
+        waiter = self._busy_waiter
+        if waiter is None or waiter.pin != self._busy:
+            waiter = self._busy_waiter = BusyWaiter(self.transport, self._busy)
+
+        timed_out = waiter.wait(timeout / 1000.0)
+
+        if opcode != -1:
+            stats = self._busy_stats.get(opcode)
+            if stats is None:
+                stats = self._busy_stats[opcode] = [0, 0, 0.0, 0.0]
+            stats[0] += 1
+            waited = waiter.waited
+            if waited:
+                stats[1] += 1
+                stats[2] += waited
+                if waited > stats[3]:
+                    stats[3] = waited
+        return timed_out
+
+    def busy_stats(self) -> dict:
+        """
+        Per-opcode BUSY wait counters: {opcode: {"calls", "waits",
+        "total_s", "max_s"}}. 'waits' counts calls that found BUSY high.
+        """
+        return {
+            opcode: {
+                "calls": calls,
+                "waits": waits,
+                "total_s": total,
+                "max_s": longest,
+            }
+            for opcode, (calls, waits, total, longest) in self._busy_stats.items()
+        }
+
+    def reset_busy_stats(self):
+        self._busy_stats.clear()
+
+    def enable_metrics(self, buckets=SPI_LATENCY_BUCKETS):
+        """
+        Record every SPI transaction per opcode: calls, bytes, BUSY wait
+        and transfer time histograms ('buckets' are upper bounds in s).
+        Disabled, the cost is one None check per transfer.
+        """
+        with self._bus_lock:
+            self._spi_metrics = SpiMetrics(buckets)
+
+    def disable_metrics(self):
+        with self._bus_lock:
+            self._spi_metrics = None
+
+    def reset_metrics(self):
+        with self._bus_lock:
+            if self._spi_metrics is not None:
+                self._spi_metrics.reset()
+
+    def metrics(self) -> dict:
+        """
+        Snapshot of the driver's counters: per-opcode SPI statistics (empty
+        unless enable_metrics() was called), tracked mode mismatches, RX
+        buffer overruns, filtered packets, packets dropped on a short read,
+        dedupe statistics and wake-ups (warm/cold counts, wake() to standby
+        and to SetTx latency).
+        """
+        with self._bus_lock:
+            spi = {} if self._spi_metrics is None else self._spi_metrics.snapshot()
+        return {
+            "spi": spi,
+            "mode_mismatches": self._mode_mismatches,
+            "rx_overruns": self._ring.overruns,
+            "rx_overwritten": self._ring.overwritten,
+            "rx_filtered": self._rx_filtered,
+            "rx_short_reads": self._rx_short_reads,
+            "dedupe": self.dedupe_stats(),
+            "wake": {
+                **self._wakes,
+                "ready": self._wake_ready.snapshot(),
+                "to_tx": self._wake_to_tx.snapshot(),
+            },
+        }
+
+    def start_trace(self, path: str = None, capacity: int = TRACE_BUFFER_SIZE):
+        """
+        Record every SPI transaction (timestamp, opcode, MOSI, MISO, BUSY
+        wait) by wrapping the transport in a TraceTransport, streamed to
+        'path' or kept as an in-memory flight recorder (see dump()).
+        Replay with ReplayTransport or python -m sx1262_driver.transport.replay.
+        """
+        with self._bus_lock:
+            if isinstance(self.transport, TraceTransport):
+                return self.transport
+            if self._busy_waiter is None:
+                self._busy_waiter = BusyWaiter(self.transport, self._busy)
+            tracer = TraceTransport(self.transport, path, capacity)
+            tracer.busy_waiter = self._busy_waiter
+            self.transport = tracer
+            return tracer
+
+    def stop_trace(self):
+        """Restore the traced transport and flush the trace; returns the recorder."""
+        with self._bus_lock:
+            tracer = self.transport
+            if not isinstance(tracer, TraceTransport):
+                return None
+            self.transport = tracer.inner
+            tracer.flush()
+            return tracer
+
+    def enable_telemetry(self, registry=None, chip_stats: bool = False):
+        """
+        Feed packet, error, IRQ-lag and RSSI/SNR metrics into a
+        MetricsRegistry (a new one unless given) and return the registry:
+
+            registry = radio.enable_telemetry()
+            registry.serve(METRICS_PORT)      # or registry.write(path)
+        """
+        self._telemetry = RadioTelemetry(self, registry, chip_stats)
+        return self._telemetry.registry
+
+    def disable_telemetry(self):
+        telemetry = self._telemetry
+        self._telemetry = None
+        if telemetry is not None:
+            telemetry.registry.remove_collector(telemetry.collect)
 
     def set_fallback_mode(self, fallback_mode):
         self.set_rx_tx_fallback_mode(fallback_mode)
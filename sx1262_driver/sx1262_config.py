@@ -0,0 +1,121 @@
+from dataclasses import dataclass, fields, replace
+from typing import Optional
+
+from .sx1262_constants import *
+
+# RadioConfig fields grouped by the command that carries them
+_MODULATION_FIELDS = ("sf", "bw", "cr", "ldro")
+_PACKET_FIELDS = ("header_type", "preamble_length", "payload_length", "crc", "invert_iq")
+# Fields apply() leaves alone when they are None
+_OPTIONAL_FIELDS = ("frequency", "sync_word", "tx_power", "rx_gain")
+
+
+@dataclass(frozen=True)
+class RadioConfig:
+    """
+    Complete LoRa radio profile, applied with SX1262.apply().
+
+    Values use the same units as the individual setters (frequency and bw
+    in Hz, cr as 5..8 for 4/5..4/8, ldro None for automatic). frequency,
+    sync_word, tx_power and rx_gain left as None are not managed by apply()
+    and keep whatever the radio has.
+    """
+
+    frequency: Optional[int] = None
+    sf: int = SF
+    bw: int = BW
+    cr: int = CR
+    ldro: Optional[bool] = LDRO
+    header_type: int = HEADER_TYPE
+    preamble_length: int = PREAMBLE_LENGTH
+    payload_length: int = PAYLOAD_LENGTH
+    crc: bool = CRC_TYPE
+    invert_iq: bool = INVERT_IQ
+    sync_word: Optional[int] = None
+    tx_power: Optional[int] = None
+    rx_gain: Optional[int] = None
+
+    def replace(self, **changes) -> "RadioConfig":
+        """Return a copy with the given fields changed."""
+        return replace(self, **changes)
+
+    def diff(self, other: Optional["RadioConfig"]) -> frozenset:
+        """
+        Names of the fields that differ from 'other' and that this config
+        manages. Every managed field differs when 'other' is None.
+        """
+        changed = []
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if value is None and field.name in _OPTIONAL_FIELDS:
+                continue
+            if other is None or getattr(other, field.name) != value:
+                changed.append(field.name)
+        return frozenset(changed)
+
+
+class SX1262Config:
+    def __init__(self):
+        super().__init__()
+
+    # ---------------------------------------------------------------------
+    # DECLARATIVE CONFIGURATION
+    # ---------------------------------------------------------------------
+
+    def apply(self, config: RadioConfig, force: bool = False) -> frozenset:
+        """
+        Bring the radio to 'config', sending only the commands whose
+        parameters differ from the last applied config, in one batch.
+        Everything is sent on the first call, after reset() or cold sleep,
+        or when 'force' is set. Returns the names of the fields that were
+        changed.
+        """
+        changed = config.diff(None if force else self._applied_config)
+        if not changed:
+            return changed
+
+        with self.batch():
+            if "frequency" in changed:
+                self.set_frequency(config.frequency)
+
+            if not changed.isdisjoint(_MODULATION_FIELDS):
+                self.set_lora_modulation(config.sf, config.bw, config.cr, config.ldro)
+
+            if not changed.isdisjoint(_PACKET_FIELDS):
+                self.set_lora_packet(
+                    config.header_type,
+                    config.preamble_length,
+                    config.payload_length,
+                    config.crc,
+                    config.invert_iq,
+                )
+
+            if "sync_word" in changed:
+                self.set_sync_word(config.sync_word)
+            if "tx_power" in changed:
+                self.set_tx_power(config.tx_power)
+            if "rx_gain" in changed:
+                self.set_rx_gain(config.rx_gain)
+
+        previous = self._applied_config
+        if previous is not None:
+            # Keep fields this config leaves unmanaged as they were
+            config = replace(
+                config,
+                **{
+                    name: getattr(previous, name)
+                    for name in _OPTIONAL_FIELDS
+                    if getattr(config, name) is None
+                },
+            )
+        self._applied_config = config
+        return changed
+
+    def config(self) -> Optional[RadioConfig]:
+        """The last applied config, kept current by the individual setters."""
+        return self._applied_config
+
+    def _note_config(self, **values):
+        """Record a change made through an individual setter."""
+        if self._applied_config is not None:
+            self._applied_config = replace(self._applied_config, **values)
@@ -26,6 +26,10 @@ STANDBY_XOSC = 0x01
 
 # SetTx
 TX_SINGLE = 0x000000
+# end_packet(): derive the hardware timeout from the packet's time on air
+TX_TIMEOUT_AUTO = -1
+TX_TIMEOUT_MARGIN = 1.25
+TX_TIMEOUT_GUARD_MS = 10
 
 # SetRx
 RX_SINGLE = 0x000000
@@ -209,6 +213,10 @@ STATUS_MODE_STDBY_XOSC = 0x30
 STATUS_MODE_FS = 0x40
 STATUS_MODE_RX = 0x50
 STATUS_MODE_TX = 0x60
+# Tracked in software only: GetStatus cannot be read while asleep, and
+# UNKNOWN forces the next get_mode() to read the chip
+STATUS_MODE_SLEEP = 0x00
+STATUS_MODE_UNKNOWN = -1
 
 # GetDeviceErrors
 RC64K_CALIB_ERR = 0x0001
@@ -245,6 +253,90 @@ STATUS_CAD_WAIT = 10
 STATUS_CAD_DETECTED = 11
 STATUS_CAD_DONE = 12
 
+# Typical BUSY high time after each opcode (us)
+BUSY_TIME_US = {
+    0x80: 5,       # SetStandby
+    0xC1: 50,      # SetFs
+    0x83: 100,     # SetTx
+    0x82: 100,     # SetRx
+    0x94: 100,     # SetRxDutyCycle
+    0xC5: 100,     # SetCad
+    0x89: 3500,    # Calibrate (all blocks)
+    0x98: 1000,    # CalibrateImage
+    0x8A: 10,      # SetPacketType
+    0x86: 10,      # SetRfFrequency
+    0x8B: 10,      # SetModulationParams
+    0x8C: 10,      # SetPacketParams
+}
+BUSY_TIME_DEFAULT_US = 2
+BUSY_TIME_RESET_US = 3500
+BUSY_TIME_WAKE_WARM_US = 340
+BUSY_TIME_WAKE_COLD_US = 3500
+
+# Opcodes whose BUSY time fits inside an SPI cs_change gap: buffer and
+# register access, status reads and parameter writes. A batching transport
+# waits for BUSY after any other opcode (calibration, mode changes, sleep,
+# TCXO, ...) before sending the next frame.
+SHORT_BUSY_OPCODES = frozenset(
+    (
+        0x0D, 0x1D, 0x0E, 0x1E,  # Write/ReadRegister, Write/ReadBuffer
+        0x02, 0x07, 0x00,  # ClearIrqStatus, ClearDeviceErrors, ResetStats
+        0x08, 0x8F, 0x8E, 0x95, 0x88, 0xA0, 0x9F, 0x93,  # parameter writes
+        0x86, 0x8A, 0x8B, 0x8C,  # frequency, packet type, modulation, packet
+        0xC0, 0x12, 0x13, 0x14, 0x15, 0x17, 0x10, 0x11,  # status reads
+    )
+)
+
+# RX packet queue drop policy
+DROP_OLDEST = 0
+DROP_NEWEST = 1
+RX_QUEUE_SIZE = 64
+
+# TX scheduler: lower priority values are sent first
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+DUTY_CYCLE_WINDOW = 3600.0  # seconds
+
+# Listen before talk: CAD attempts per packet and the cap on the backoff
+# exponent (backoff is uniform in 0..2^n time-on-air slots)
+LBT_MAX_ATTEMPTS = 8
+LBT_MAX_BACKOFF_EXP = 5
+
+# Duplicate suppression: entries kept and how long a payload counts as
+# a repeat after it was first delivered
+DEDUPE_SIZE = 256
+DEDUPE_WINDOW = 30.0  # seconds
+
+# wait() poll interval bounds (seconds) when no recv loop is running; the
+# interval follows the LoRa symbol time in between
+WAIT_POLL_MIN = 0.0002
+WAIT_POLL_MAX = 0.005
+
+# SPI instrumentation histogram bucket upper bounds (seconds)
+SPI_LATENCY_BUCKETS = (
+    10e-6,
+    25e-6,
+    50e-6,
+    100e-6,
+    250e-6,
+    500e-6,
+    1e-3,
+    2.5e-3,
+    5e-3,
+    10e-3,
+)
+
+# Telemetry histogram bucket upper bounds and default exporter port
+IRQ_LAG_BUCKETS = (100e-6, 250e-6, 500e-6, 1e-3, 2.5e-3, 5e-3, 10e-3, 25e-3, 50e-3, 0.1)
+RSSI_BUCKETS = (-130, -120, -110, -100, -90, -80, -70, -60, -50, -40, -30)
+SNR_BUCKETS = (-20, -15, -10, -5, 0, 5, 10, 15)
+WAKE_LATENCY_BUCKETS = (250e-6, 500e-6, 1e-3, 2e-3, 4e-3, 8e-3, 16e-3, 32e-3, 64e-3)
+METRICS_PORT = 9110
+
+# SPI trace recorder buffer (bytes); flushed to the trace file when full
+TRACE_BUFFER_SIZE = 64 * 1024
+
 # SPI and GPIO pin setting
 BUS = 0
 CS = 0
@@ -256,6 +348,9 @@ TXEN = -1
 RXEN = -1
 WAKE = -1
 BUSY_TIMEOUT = 5000
+# wake() from an unknown state: longer than any command's BUSY time (ms)
+WAKE_PROBE_TIMEOUT = 10
+BUSY_SPIN_US = 50
 SPI_SPEED = 7800000
 
 # lgpio uses 0/1 for levels
@@ -268,7 +363,7 @@ MODEM = LORA_MODEM
 SF = 7
 BW = 125000
 CR = 5
-LDRO = False
+LDRO = None  # automatic, see SX1262Modem.set_lora_modulation()
 HEADER_TYPE = HEADER_EXPLICIT
 PREAMBLE_LENGTH = 12
 PAYLOAD_LENGTH = 32
@@ -281,6 +376,9 @@ PAYLOAD_TX_RX = 32
 STATUS_WAIT = STATUS_DEFAULT
 STATUS_IRQ = STATUS_DEFAULT
 TRANSMIT_TIME = 0.0
+MODE = STATUS_MODE_UNKNOWN
+FALLBACK_MODE = FALLBACK_STDBY_RC
+CAD_EXIT_MODE = CAD_EXIT_STDBY
 
 # callback functions
 ON_TRANSMIT = None
@@ -0,0 +1,95 @@
+class PacketFilter:
+    """
+    One stage of the RX filter chain, run in the IRQ thread before a
+    packet's payload is read or any event is emitted.
+
+    A filter sees the payload length from GetRxBufferStatus and the first
+    'prefix_length' bytes of the payload (fewer if the packet is shorter);
+    filters with prefix_length 0 run before any buffer read at all. Every
+    call is counted in 'passed' or 'dropped'.
+    """
+
+    prefix_length = 0
+
+    def __init__(self, name: str = None):
+        self.name = name or type(self).__name__
+        self.passed = 0
+        self.dropped = 0
+
+    def accepts(self, length: int, prefix: bytes) -> bool:
+        raise NotImplementedError
+
+    def __call__(self, length: int, prefix: bytes) -> bool:
+        if self.accepts(length, prefix):
+            self.passed += 1
+            return True
+        self.dropped += 1
+        return False
+
+    def stats(self) -> dict:
+        return {"passed": self.passed, "dropped": self.dropped}
+
+    def reset_stats(self):
+        self.passed = 0
+        self.dropped = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, passed={self.passed}, dropped={self.dropped})"
+
+
+class LengthFilter(PacketFilter):
+    """Accept payload lengths in 'lengths', or within [min_length, max_length]."""
+
+    def __init__(
+        self,
+        lengths=None,
+        min_length: int = 0,
+        max_length: int = 255,
+        name: str = None,
+    ):
+        super().__init__(name)
+        self.lengths = frozenset(lengths) if lengths is not None else None
+        self.min_length = min_length
+        self.max_length = max_length
+
+    def accepts(self, length: int, prefix: bytes) -> bool:
+        if self.lengths is not None:
+            return length in self.lengths
+        return self.min_length <= length <= self.max_length
+
+
+class PrefixFilter(PacketFilter):
+    """
+    Accept payloads that carry one of 'prefixes' at 'offset', e.g. a
+    destination address in a fixed header position:
+
+        radio.add_filter(PrefixFilter((b"\\x12\\x34", b"\\xff\\xff"), offset=1))
+    """
+
+    def __init__(self, prefixes, offset: int = 0, name: str = None):
+        super().__init__(name)
+        if isinstance(prefixes, (bytes, bytearray)):
+            prefixes = (prefixes,)
+        self.prefixes = tuple(bytes(p) for p in prefixes)
+        if not self.prefixes:
+            raise ValueError("PrefixFilter needs at least one prefix")
+        self.offset = offset
+        self.prefix_length = offset + max(len(p) for p in self.prefixes)
+
+    def accepts(self, length: int, prefix: bytes) -> bool:
+        return prefix.startswith(self.prefixes, self.offset)
+
+
+class PredicateFilter(PacketFilter):
+    """
+    Accept packets for which predicate(length, prefix) is true. It runs in
+    the IRQ thread, so it must be quick and must not touch the radio.
+    """
+
+    def __init__(self, predicate, prefix_length: int = 0, name: str = None):
+        super().__init__(name or getattr(predicate, "__name__", None))
+        self.predicate = predicate
+        self.prefix_length = prefix_length
+
+    def accepts(self, length: int, prefix: bytes) -> bool:
+        return bool(self.predicate(length, prefix))
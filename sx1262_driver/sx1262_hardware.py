@@ -1,5 +1,3 @@
-import lgpio
-
 from .sx1262_constants import *
 
 class SX1262Hardware:
@@ -11,10 +9,7 @@ class SX1262Hardware:
         self._cs = cs
         self._spi_speed = speed
 
-        self.spi.open(bus, cs)
-        self.spi.max_speed_hz = speed
-        self.spi.lsbfirst = False
-        self.spi.mode = 0
+        self.transport.open(bus, cs, speed)
 
     def set_pins(
         self,
@@ -32,17 +27,9 @@ class SX1262Hardware:
         self._rxen = rxen
         self._wake = wake
 
-        lgpio.gpio_claim_output(self.gpio_chip, reset)
-        lgpio.gpio_claim_input(self.gpio_chip, busy)
-
-        lgpio.gpio_claim_output(self.gpio_chip, self._cs_define)
-
-        if irq != -1:
-            lgpio.gpio_claim_input(self.gpio_chip, irq)
-        if txen != -1:
-            lgpio.gpio_claim_output(self.gpio_chip, txen)
-        if rxen != -1:
-            lgpio.gpio_claim_output(self.gpio_chip, rxen)
+        self.transport.setup_pins(
+            reset, busy, self._cs_define, irq, txen, rxen, wake
+        )
 
     def set_rf_irq_pin(self, dio_pin_select: int):
         if dio_pin_select in (2, 3):
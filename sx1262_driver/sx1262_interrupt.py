@@ -1,14 +1,22 @@
+import asyncio
 import time
 import threading
 
 from .sx1262_constants import *
+from .sx1262_packet import Packet
+from .core.buffer_ring import BufferRing
 
 class SX1262Interrupt:
     def __init__(self):
         super().__init__()
         self._recv_thread =  None
         self._recv_running = False
-        
+        # Edge-driven mode: DIO edge callback handle, wakeup event and the
+        # kernel timestamp of the most recent edge
+        self._irq_watch = None
+        self._irq_event = threading.Event()
+        self._irq_timestamp = 0
+
     # INTERRUPT HANDLER METHODS
 
     def _irq_setup(self, irq_mask):
@@ -27,7 +35,7 @@ class SX1262Interrupt:
 
         self.set_dio_irq_params(irq_mask, dio1_mask, dio2_mask, dio3_mask)
 
-    def _interrupt_tx(self, irq, _channel=None):
+    def _interrupt_tx(self, irq, timestamp):
         """
         Internal TX-done handler. Called from _handle_irq().
         Restores TXEN and emits a 'tx_done' event.
@@ -36,8 +44,10 @@ class SX1262Interrupt:
 
         # restore TXEN
         if self._txen != -1:
-            from lgpio import gpio_write
-            gpio_write(self.gpio_chip, self._txen, self._tx_state)
+            self.transport.write_pin(self._txen, self._tx_state)
+
+        # Resolve a pending transmit() future, if any
+        self._resolve_tx(self._transmit_time)
 
         # EventEmitter: notify listeners
         # Transmit time in seconds, plus raw IRQ status for those who care.
@@ -45,81 +55,181 @@ class SX1262Interrupt:
             "tx_done",
             transmit_time=self._transmit_time,
             irq_status=irq,
+            timestamp=timestamp,
         )
 
-    def _interrupt_rx(self, irq, _channel=None):
+    def _interrupt_rx(self, irq, timestamp) -> bool:
         """
         Internal RX handler for single-shot and timeout cases.
         Restores TXEN (if used), applies _fix_rx_timeout(), reads RX buffer
-        status, and emits 'rx_done' (or error events via _handle_irq()).
+        status, runs the filter chain, and emits 'rx_done' (or error events
+        via _handle_irq()). Returns False if the packet was dropped.
         """
         if self._status_wait != STATUS_RX_CONTINUOUS:
             if self._txen != -1:
-                from lgpio import gpio_write
-                gpio_write(self.gpio_chip, self._txen, self._tx_state)
+                self.transport.write_pin(self._txen, self._tx_state)
 
             # Apply RTC / timeout errata workaround
             self._fix_rx_timeout()
-        else:
-            self.clear_irq_status(IRQ_ALL)
 
         (payload_length, buffer_index) = self.get_rx_buffer_status()
+
+        # Filter stage: drop packets not meant for us before reading them
+        if (
+            self._filters
+            and not irq & IRQ_CRC_ERR
+            and not self._filter_packet(payload_length, buffer_index)
+        ):
+            self._rx_buffer_status(payload_length, buffer_index, True)
+            return False
+
         print(f"got rx_done, buffer status payload lenght is {payload_length} buffer offset is {buffer_index} irq is {irq}")
 
+        # RX pipeline: capture payload and packet status now, before the
+        # next packet in RX_CONTINUOUS can overwrite the buffer
+        pipeline = self._packet_queue is not None
+        if pipeline and not irq & IRQ_CRC_ERR:
+            delivered = self._capture_packet(
+                payload_length, buffer_index, irq, timestamp
+            )
+        elif self._dedupe is not None and not irq & IRQ_CRC_ERR:
+            payload = self._read_ring(buffer_index, payload_length)
+            delivered = self._dedupe.check(self._dedupe_key(bytes(payload))) is None
+        else:
+            delivered = True
+
+        if not delivered:
+            # Repeat of a packet already delivered, or unreadable: drop it
+            self._rx_buffer_status(payload_length, buffer_index, True)
+            return False
+
+        # With the pipeline on nothing is left to read from the buffer
+        self._rx_buffer_status(payload_length, buffer_index, pipeline)
+
         # EventEmitter: notify listeners of RX completion
         self.emit(
             "rx_done",
             payload_length,
             buffer_index,
-            irq_status=irq
+            irq_status=irq,
+            timestamp=timestamp,
+        )
+        return True
+
+    def _capture_packet(self, payload_length, buffer_index, irq, timestamp) -> bool:
+        """
+        Read payload and GetPacketStatus together (one bus operation on a
+        batching transport) and queue a Packet for consumers. Returns False
+        if the packet was a duplicate or the read came back short, and has
+        been dropped.
+        """
+        reads = [
+            (0x1E, n + 1, (start,), 1)
+            for start, n in BufferRing.segments(buffer_index, payload_length)
+        ]
+        reads.append((0x14, 4, (), 0))
+        responses = self._read_many(reads)
+        # A short response (transport error or truncated transfer) would
+        # make a corrupt Packet: drop it and keep the recv thread alive
+        short = len(responses) < len(reads) or any(
+            len(response) < read[1] for read, response in zip(reads, responses)
+        )
+        if short:
+            self._rx_short_reads += 1
+            return False
+        data = b"".join(bytes(segment[1:]) for segment in responses[:-1])
+        packet = Packet.from_status(
+            data,
+            responses[-1][1:4],
+            timestamp,
+            irq,
         )
+        if self._dedupe is not None:
+            key = self._dedupe_key(data)
+            first = self._dedupe.check(key, packet)
+            if first is not None:
+                if self._dedupe_merge:
+                    # The queued Packet may already be with a consumer:
+                    # publish the merged values as a new Packet instead
+                    merged = first.merge(packet)
+                    self._dedupe.replace(key, merged)
+                    self.emit("rx_duplicate", merged)
+                return False
+        if self._telemetry is not None:
+            self._telemetry.packet(packet)
+        if not self._packet_queue.put(packet):
+            self.emit("rx_dropped", dropped=self._packet_queue.dropped)
+        self.emit("rx_packet", packet)
+        return True
 
     # -------------------------------------------------------------------------
     # Central IRQ decoder used by the recv_loop in SX1262Common
     # -------------------------------------------------------------------------
 
-    def _handle_irq(self, irq: int):
+    def _handle_irq(self, irq: int, timestamp: int = None):
         """
         Decode IRQ bits and invoke internal handlers and/or emit events.
-        This is called by the internal recv_loop.
+        This is called by the internal recv_loop. 'timestamp' is the kernel
+        edge time in ns (edge-driven mode) or the monotonic time the IRQ
+        status was polled; it goes with each event to listeners that take
+        a 'timestamp' argument.
         """
-        # Keep legacy status() path in sync
-        self._status_irq = irq
-
         if (irq & 0x2000):
-            print(f".../handle_irq got spurious IRQ {hex(irq)}, mode is {hex(self.get_mode_and_control())}")
+            # Spurious status: clear it so DIO1 drops, and publish it to
+            # status()/wait() as before
+            self.clear_irq_status(irq)
+            self._notify_irq(irq)
             return
-        
+
+        # Clear the bits read before handling them: a packet that arrives
+        # while this one is processed latches RX_DONE again and raises a
+        # fresh edge instead of being cleared along with it
+        self.clear_irq_status(irq)
+
+        self._track_irq_mode(irq)
+
+        telemetry = self._telemetry
+        if telemetry is not None:
+            telemetry.irq(irq, timestamp)
+        timestamp = timestamp or time.monotonic_ns()
+
         # TX done
         if irq & IRQ_TX_DONE:
-            self._interrupt_tx(irq)
+            self._interrupt_tx(irq, timestamp)
+
+        # Status for status()/wait(), published once handling is done
+        status_irq = irq
 
         # RX done (single or continuous)
-        if irq & IRQ_RX_DONE:
-            self._interrupt_rx(irq)
+        if irq & IRQ_RX_DONE and not self._interrupt_rx(irq, timestamp):
+            status_irq &= ~IRQ_RX_DONE
 
         # Timeout
         if irq & IRQ_TIMEOUT:
+            if self._status_wait == STATUS_TX_WAIT:
+                self._resolve_tx(error=asyncio.TimeoutError("TX timeout"))
             # Emit an explicit timeout event
-            self.emit("timeout", irq_status=irq)
+            self.emit("timeout", irq_status=irq, timestamp=timestamp)
 
         # Header error
         if irq & IRQ_HEADER_ERR:
-            self.emit("header_error", irq_status=irq)
+            self.emit("header_error", irq_status=irq, timestamp=timestamp)
 
         # CRC error
         if irq & IRQ_CRC_ERR:
-            self.emit("crc_error", irq_status=irq)
+            self.emit("crc_error", irq_status=irq, timestamp=timestamp)
 
         # CAD events (if/when you use them)
         if irq & IRQ_CAD_DETECTED:
-            self.emit("cad_detected", irq_status=irq)
+            self.emit("cad_detected", irq_status=irq, timestamp=timestamp)
 
         if irq & IRQ_CAD_DONE:
-            self.emit("cad_done", irq_status=irq)
+            self._resolve_cad(bool(irq & IRQ_CAD_DETECTED))
+            self.emit("cad_done", irq_status=irq, timestamp=timestamp)
 
-        # Clear IRQs at the end to release the latch
-        self.clear_irq_status(irq) 
+        # Keep legacy status() path in sync and wake threads blocked in
+        # wait(), now that the buffer status and events are in place
+        self._notify_irq(status_irq)
 
     # -------------------------------------------------------------------------
     # Back-compat helpers for existing callback-based code
@@ -157,37 +267,88 @@ class SX1262Interrupt:
 
     def start_recv_loop(self, interval: float = 0.01):
         """
-        Start a background thread that polls get_irq_status() and dispatches
-        events via _handle_irq(). Safe to call multiple times.
+        Start a background thread that dispatches IRQ events via
+        _handle_irq(). Safe to call multiple times.
+
+        If an IRQ pin was passed to begin()/set_pins() and the transport
+        supports edge alerts, the thread sleeps until the radio raises the
+        DIO line and only then reads the IRQ status. Otherwise (irq == -1)
+        it polls get_irq_status() every 'interval' seconds.
         """
         if self._recv_thread and self._recv_running:
             return
-        print(f"Initiating Recv Loop {hex(self.get_mode_and_control())}")
+        print(f"Initiating Recv Loop {hex(self.get_mode())}")
         self._recv_interval = interval
         self._recv_running = True
 
-
-        def loop():
-            print(f"Recv Loop Started {self._recv_running}")
-            while self._recv_running:
-                if (self.get_mode_and_control() != 0x52):
-                    print(f"loop: status is {hex(self.get_mode_and_control())}")
-                irq = self.get_irq_status()
-                if irq:
-                    # Let SX1262Interrupt decode and emit events
-                    self._handle_irq(irq)
-                time.sleep(self._recv_interval)
+        loop = self._poll_loop
+        if self._irq != -1:
+            self._irq_event.clear()
+            try:
+                self._irq_watch = self.transport.add_edge_callback(
+                    self._irq, self._on_irq_edge
+                )
+                loop = self._edge_loop
+            except NotImplementedError:
+                self._irq_watch = None
 
         self._recv_thread = threading.Thread(target=loop, daemon=True)
         self._recv_thread.start()
 
+    def _poll_loop(self):
+        print(f"Recv Loop Started {self._recv_running}")
+        while self._recv_running:
+            # Reading the status would wake a sleeping chip
+            if self._mode == STATUS_MODE_SLEEP:
+                time.sleep(self._recv_interval)
+                continue
+            irq = self.get_irq_status()
+            if irq:
+                # Let SX1262Interrupt decode and emit events
+                self._handle_irq(irq, time.monotonic_ns())
+            time.sleep(self._recv_interval)
+
+    def _on_irq_edge(self, timestamp: int):
+        """
+        Transport edge callback. Runs on the GPIO library's callback thread,
+        so it only records the edge and wakes the recv thread; SPI work
+        happens there.
+        """
+        self._irq_timestamp = timestamp
+        self._irq_event.set()
+
+    def _edge_loop(self):
+        print(f"Recv Loop Started (edge-driven) {self._recv_running}")
+        while self._recv_running:
+            # The timeout is a watchdog for an edge lost while the line
+            # was already high; the pin is re-read before sleeping again
+            self._irq_event.wait(1.0)
+            self._irq_event.clear()
+            if not self._recv_running:
+                break
+
+            # Every pass clears what it read, so keep going while the line
+            # is high: an IRQ latched while handling keeps it up
+            timestamp = self._irq_timestamp
+            while self._recv_running and self.transport.read_pin(self._irq):
+                irq = self.get_irq_status()
+                if not irq:
+                    # Line high with nothing latched: leave it to the watchdog
+                    break
+                self._handle_irq(irq, timestamp or time.monotonic_ns())
+                timestamp = 0
+
     def _stop_recv_loop(self):
         """
-        Stop the background IRQ polling loop.
+        Stop the background IRQ loop.
         """
         if not self._recv_running:
             return
 
         self._recv_running = False
+        if self._irq_watch is not None:
+            self._irq_watch.cancel()
+            self._irq_watch = None
+        self._irq_event.set()
         # Thread is daemon=True; we don't strictly need to join here.
         self._recv_thread = None
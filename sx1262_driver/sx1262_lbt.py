@@ -0,0 +1,166 @@
+import asyncio
+import random
+import time
+
+from .sx1262_constants import *
+
+# Semtech AN1200.48 recommended CAD settings, tabulated for 125 and
+# 500 kHz: (SF, bandwidth) -> (symbol count, cad_det_peak, cad_det_min).
+# SF5/6 use the SF7 row. Shorter symbols at 500 kHz need more of them.
+_CAD_TABLE = {
+    (5, 125000): (CAD_ON_2_SYMB, 22, 10),
+    (6, 125000): (CAD_ON_2_SYMB, 22, 10),
+    (7, 125000): (CAD_ON_2_SYMB, 22, 10),
+    (8, 125000): (CAD_ON_2_SYMB, 22, 10),
+    (9, 125000): (CAD_ON_4_SYMB, 23, 10),
+    (10, 125000): (CAD_ON_4_SYMB, 24, 10),
+    (11, 125000): (CAD_ON_4_SYMB, 25, 10),
+    (12, 125000): (CAD_ON_4_SYMB, 28, 10),
+    (5, 500000): (CAD_ON_4_SYMB, 21, 10),
+    (6, 500000): (CAD_ON_4_SYMB, 21, 10),
+    (7, 500000): (CAD_ON_4_SYMB, 21, 10),
+    (8, 500000): (CAD_ON_4_SYMB, 22, 10),
+    (9, 500000): (CAD_ON_4_SYMB, 22, 10),
+    (10, 500000): (CAD_ON_4_SYMB, 23, 10),
+    (11, 500000): (CAD_ON_4_SYMB, 25, 10),
+    (12, 500000): (CAD_ON_8_SYMB, 29, 10),
+}
+
+
+def _cad_settings(sf: int, bw_hz: int) -> tuple:
+    """
+    CAD parameters for 'sf' at 'bw_hz'. Bandwidths of 250 kHz and up use
+    the 500 kHz rows, narrower ones the 125 kHz rows.
+    """
+    return _CAD_TABLE[(sf, 500000 if bw_hz >= 250000 else 125000)]
+
+
+class SX1262Lbt:
+    def __init__(self):
+        super().__init__()
+        # Pending cad(): (loop, future) while CAD runs
+        self._cad_waiter = None
+        # (SF, bandwidth) the CAD parameters were last programmed for
+        self._cad_modem = None
+        self._lbt_stats = {
+            "cad": 0,
+            "busy": 0,
+            "backoffs": 0,
+            "backoff_s": 0.0,
+            "backoff_max_s": 0.0,
+            "gave_up": 0,
+            "sent": 0,
+            "failed": 0,
+            "bytes": 0,
+            "elapsed_s": 0.0,
+        }
+
+    # ---------------------------------------------------------------------
+    # CHANNEL ACTIVITY DETECTION
+    # ---------------------------------------------------------------------
+
+    def set_cad_auto(self):
+        """
+        Program CAD symbol count and detection thresholds for the current
+        SF and bandwidth.
+        """
+        modem = (self._lora_sf(), self._lora_bw_hz())
+        symbols, det_peak, det_min = _cad_settings(*modem)
+        self.set_cad_params(symbols, det_peak, det_min, CAD_EXIT_STDBY, 0)
+        self._cad_modem = modem
+
+    async def cad(self) -> bool:
+        """
+        Run one CAD and return True if LoRa activity was detected. CAD
+        parameters are derived from the SF and bandwidth on first use and
+        whenever either changes.
+        """
+        if self._cad_waiter is not None:
+            raise RuntimeError("CAD already in progress")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if not self._recv_running:
+            self.start_recv_loop()
+
+        self._cad_waiter = (loop, future)
+        try:
+            with self.batch():
+                if self._cad_modem != (self._lora_sf(), self._lora_bw_hz()):
+                    self.set_cad_auto()
+                self._status_wait = STATUS_CAD_WAIT
+                self._status_irq = 0x0000
+                self._irq_setup(IRQ_CAD_DONE | IRQ_CAD_DETECTED)
+                self.set_cad()
+            # CAD lasts a few symbols; allow for a missed IRQ
+            return await asyncio.wait_for(future, 32 * self.symbol_time() + 0.1)
+        finally:
+            self._cad_waiter = None
+
+    def _resolve_cad(self, detected: bool):
+        """Called from the IRQ thread on CAD_DONE."""
+        waiter = self._cad_waiter
+        if waiter is None:
+            return
+        loop, future = waiter
+        try:
+            loop.call_soon_threadsafe(_settle_cad, future, detected)
+        except RuntimeError:
+            # Event loop already closed
+            pass
+
+    async def _listen_before_talk(self, slot: float):
+        """
+        Wait until CAD finds the channel clear, backing off a random
+        0..2^n slots (n capped at LBT_MAX_BACKOFF_EXP) after each busy
+        CAD. Raises RuntimeError after LBT_MAX_ATTEMPTS busy results.
+        """
+        stats = self._lbt_stats
+        for attempt in range(LBT_MAX_ATTEMPTS):
+            stats["cad"] += 1
+            if not await self.cad():
+                return
+            stats["busy"] += 1
+
+            window = 1 << min(attempt + 1, LBT_MAX_BACKOFF_EXP)
+            backoff = random.uniform(0, window) * slot
+            stats["backoffs"] += 1
+            stats["backoff_s"] += backoff
+            stats["backoff_max_s"] = max(stats["backoff_max_s"], backoff)
+            await asyncio.sleep(backoff)
+
+        stats["gave_up"] += 1
+        raise RuntimeError(f"channel busy after {LBT_MAX_ATTEMPTS} CAD attempts")
+
+    def _record_lbt(self, started: float, length: int, ok: bool):
+        stats = self._lbt_stats
+        stats["elapsed_s"] += time.monotonic() - started
+        if ok:
+            stats["sent"] += 1
+            stats["bytes"] += length
+        else:
+            stats["failed"] += 1
+
+    def lbt_stats(self) -> dict:
+        """
+        Listen-before-talk counters for transmit(..., lbt=True): CADs run,
+        busy results and busy rate, backoff total/max (s), packets sent,
+        failed (TX timeout or channel never clear) and goodput in bit/s
+        over the time spent inside transmit().
+        """
+        stats = dict(self._lbt_stats)
+        stats["busy_rate"] = stats["busy"] / stats["cad"] if stats["cad"] else 0.0
+        attempts = stats["sent"] + stats["failed"]
+        stats["failure_rate"] = stats["failed"] / attempts if attempts else 0.0
+        elapsed = stats["elapsed_s"]
+        stats["goodput_bps"] = stats["bytes"] * 8 / elapsed if elapsed else 0.0
+        return stats
+
+    def reset_lbt_stats(self):
+        for key, value in self._lbt_stats.items():
+            self._lbt_stats[key] = type(value)()
+
+
+def _settle_cad(future, detected):
+    if not future.done():
+        future.set_result(detected)
@@ -1,6 +1,14 @@
 import time
 
 from .sx1262_constants import *
+from .sx1262_channels import ChannelPlan, frequency_word, image_calibration_band
+from .sx1262_airtime import (
+    BW_HZ,
+    airtime_table,
+    ldro_required,
+    lora_bandwidth,
+    symbol_time,
+)
 
 class SX1262Modem:
     def __init__(self):
@@ -14,30 +22,40 @@ class SX1262Modem:
         self.set_packet_type(modem)
 
     def set_frequency(self, frequency: int):
-        # perform image calibration before set frequency
-        if frequency < 446000000:
-            cal_freq_min = CAL_IMG_430
-            cal_freq_max = CAL_IMG_440
-        elif frequency < 734000000:
-            cal_freq_min = CAL_IMG_470
-            cal_freq_max = CAL_IMG_510
-        elif frequency < 828000000:
-            cal_freq_min = CAL_IMG_779
-            cal_freq_max = CAL_IMG_787
-        elif frequency < 877000000:
-            cal_freq_min = CAL_IMG_863
-            cal_freq_max = CAL_IMG_870
-        else:
-            cal_freq_min = CAL_IMG_902
-            cal_freq_max = CAL_IMG_928
-
-        self.calibrate_image(cal_freq_min, cal_freq_max)
+        # perform image calibration before set frequency, unless the chip
+        # is already calibrated for this band
+        band = image_calibration_band(frequency)
+        if band != self._image_band:
+            self.calibrate_image(*band)
+            self._image_band = band
 
         # calculate frequency and set frequency setting
-        rf_freq = int(frequency * RF_FREQUENCY_NOM / RF_FREQUENCY_XTAL)
-        self.set_rf_frequency(rf_freq)
+        self._write_bytes(0x86, frequency_word(frequency), 4)
+        self._frequency = frequency
+        self._note_config(frequency=frequency)
+
+    def set_channel_plan(self, plan: ChannelPlan):
+        self._channel_plan = plan
+
+    def hop(self, channel: int):
+        """
+        Retune to 'channel' of the plan given to set_channel_plan(). Within
+        one image calibration band this is a single SetRfFrequency command.
+        """
+        plan = self._channel_plan
+        if plan is None:
+            raise ValueError("hop() needs a channel plan, see set_channel_plan()")
+
+        band = plan.bands[channel]
+        if band != self._image_band:
+            self.calibrate_image(*band)
+            self._image_band = band
+        self._write_bytes(0x86, plan.words[channel], 4)
+        self._frequency = plan.frequencies[channel]
+        self._note_config(frequency=self._frequency)
 
     def set_tx_power(self, tx_power: int, version=TX_POWER_SX1262):
+        requested = tx_power
         # maximum TX power is 22 dBm and 15 dBm for SX1261
         if tx_power > 22:
             tx_power = 22
@@ -89,6 +107,7 @@ class SX1262Modem:
 
         self.set_pa_config(pa_duty_cycle, hp_max, device_sel, 0x01)
         self.set_tx_params(power, PA_RAMP_800U)
+        self._note_config(tx_power=requested)
 
     def set_rx_gain(self, rx_gain):
         gain = POWER_SAVING_GAIN
@@ -98,8 +117,13 @@ class SX1262Modem:
             self.write_register(0x029F, (0x01, 0x08, 0xAC), 3)
         else:
             self.write_register(REG_RX_GAIN, (gain,), 1)
+        self._note_config(rx_gain=rx_gain)
 
-    def set_lora_modulation(self, sf: int, bw: int, cr: int, ldro: bool = False):
+    def set_lora_modulation(self, sf: int, bw: int, cr: int, ldro: bool = None):
+        """
+        'ldro' None enables LowDataRateOptimize exactly when the symbol
+        time requires it.
+        """
         self._sf = sf
         self._bw = bw
         self._cr = cr
@@ -110,26 +134,9 @@ class SX1262Modem:
         elif sf < 5:
             sf = 5
 
-        if bw < 9100:
-            bw = BW_7800
-        elif bw < 13000:
-            bw = BW_10400
-        elif bw < 18200:
-            bw = BW_15600
-        elif bw < 26000:
-            bw = BW_20800
-        elif bw < 36500:
-            bw = BW_31250
-        elif bw < 52100:
-            bw = BW_41700
-        elif bw < 93800:
-            bw = BW_62500
-        elif bw < 187500:
-            bw = BW_125000
-        elif bw < 375000:
-            bw = BW_250000
-        else:
-            bw = BW_500000
+        bw = lora_bandwidth(bw)
+        if ldro is None:
+            ldro = ldro_required(sf, BW_HZ[bw])
 
         cr = cr - 4
         if cr > 4:
@@ -141,6 +148,7 @@ class SX1262Modem:
             ldro = LDRO_OFF
 
         self.set_modulation_params_lora(sf, bw, cr, ldro)
+        self._note_config(sf=self._sf, bw=self._bw, cr=self._cr, ldro=self._ldro)
 
     def set_lora_packet(
         self,
@@ -173,6 +181,13 @@ class SX1262Modem:
             preamble_length, header_type, payload_length, crc_type_val, invert_iq_val
         )
         self._fix_inverted_iq(invert_iq_val)
+        self._note_config(
+            header_type=self._header_type,
+            preamble_length=preamble_length,
+            payload_length=payload_length,
+            crc=crc_type,
+            invert_iq=invert_iq,
+        )
 
     def set_spreading_factor(self, sf: int):
         self.set_lora_modulation(sf, self._bw, self._cr, self._ldro)
@@ -186,6 +201,44 @@ class SX1262Modem:
     def set_ldro_enable(self, ldro: bool = True):
         self.set_lora_modulation(self._sf, self._bw, self._cr, ldro)
 
+    # TIME ON AIR
+
+    def time_on_air(self, length: int = None) -> float:
+        """
+        Seconds a LoRa packet of 'length' payload bytes (default: the
+        configured payload length) spends on air with the current
+        modulation and packet parameters.
+        """
+        if length is None:
+            length = self._payload_length
+        return self._airtime_table()[length]
+
+    def symbol_time(self) -> float:
+        return symbol_time(self._lora_sf(), self._lora_bw_hz())
+
+    def _lora_sf(self) -> int:
+        return min(max(self._sf, 5), 12)
+
+    def _lora_bw_hz(self) -> int:
+        return BW_HZ[lora_bandwidth(self._bw)]
+
+    def _airtime_table(self) -> tuple:
+        sf = self._lora_sf()
+        bw_hz = self._lora_bw_hz()
+        ldro = self._ldro
+        if ldro is None:
+            ldro = ldro_required(sf, bw_hz)
+        cr = self._cr if 5 <= self._cr <= 8 else 5
+        return airtime_table(
+            sf,
+            bw_hz,
+            cr,
+            self._preamble_length,
+            self._header_type == HEADER_IMPLICIT,
+            bool(self._crc_type),
+            bool(ldro),
+        )
+
     def set_header_type(self, header_type):
         self.set_lora_packet(
             header_type,
@@ -239,9 +292,10 @@ class SX1262Modem:
         if sync_word <= 0xFF:
             buf = (
                 (sync_word & 0xF0) | 0x04,
-                (sync_word << 4) | 0x04,
+                ((sync_word << 4) & 0xF0) | 0x04,
             )
         self.write_register(REG_LORA_SYNC_WORD_MSB, buf, 2)
+        self._note_config(sync_word=sync_word)
 
     def set_fsk_modulation(self, br: int, pulse_shape: int, bandwidth: int, fdev: int):
         self.set_modulation_params_fsk(br, pulse_shape, bandwidth, fdev)
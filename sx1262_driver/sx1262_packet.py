@@ -0,0 +1,78 @@
+class Packet:
+    """
+    A received LoRa packet, captured in the IRQ thread.
+
+    rssi, snr and signal_rssi are decoded from GetPacketStatus read right
+    after the payload; timestamp is the IRQ edge (or poll) time in ns.
+    A Packet is not changed once queued; with duplicate suppression
+    merging, merge() builds a new Packet with the best values seen across
+    'copies' receptions.
+    """
+
+    __slots__ = (
+        "payload",
+        "rssi",
+        "snr",
+        "signal_rssi",
+        "timestamp",
+        "irq_status",
+        "copies",
+    )
+
+    def __init__(
+        self,
+        payload: bytes,
+        rssi: float,
+        snr: float,
+        signal_rssi: float,
+        timestamp: int,
+        irq_status: int,
+    ):
+        self.payload = payload
+        self.rssi = rssi
+        self.snr = snr
+        self.signal_rssi = signal_rssi
+        self.timestamp = timestamp
+        self.irq_status = irq_status
+        # Copies received, including repeats merged in by the dedupe stage
+        self.copies = 1
+
+    @classmethod
+    def from_status(cls, payload: bytes, status, timestamp: int, irq_status: int):
+        """Build a packet from the 3 GetPacketStatus bytes."""
+        rssi_pkt, snr_pkt, signal_rssi_pkt = status[0], status[1], status[2]
+        if snr_pkt > 127:
+            snr_pkt = snr_pkt - 256
+        return cls(
+            payload,
+            rssi_pkt / -2.0,
+            snr_pkt / 4.0,
+            signal_rssi_pkt / -2.0,
+            timestamp,
+            irq_status,
+        )
+
+    def merge(self, other: "Packet") -> "Packet":
+        """
+        Return a new Packet for this one plus a repeat, keeping the best
+        RSSI and SNR and the first timestamp. Neither packet is changed.
+        """
+        merged = Packet(
+            self.payload,
+            max(self.rssi, other.rssi),
+            max(self.snr, other.snr),
+            max(self.signal_rssi, other.signal_rssi),
+            self.timestamp,
+            self.irq_status,
+        )
+        merged.copies = self.copies + other.copies
+        return merged
+
+    def __len__(self) -> int:
+        return len(self.payload)
+
+    def __repr__(self) -> str:
+        return (
+            f"Packet({self.payload.hex(' ')}, rssi={self.rssi:.1f}, "
+            f"snr={self.snr:.2f}, timestamp={self.timestamp})"
+        )
@@ -1,11 +1,27 @@
+import hashlib
 import time
-import lgpio
 
 from .sx1262_constants import *
+from .core.packet_queue import PacketQueue
+from .core.buffer_ring import BufferRing
+from .core.dedupe_cache import DedupeCache
 
 class SX1262Receive:
     def __init__(self):
         super().__init__()
+        # RX pipeline queue; None until enable_rx_pipeline()
+        self._packet_queue = None
+        # Packets the pipeline dropped because a read came back short
+        self._rx_short_reads = 0
+        # Model of the chip's circular data buffer
+        self._ring = BufferRing()
+        # RX filter chain, ordered by prefix_length (see add_filter())
+        self._filters = ()
+        self._rx_filtered = 0
+        # Duplicate suppression; None until enable_dedupe()
+        self._dedupe = None
+        self._dedupe_key = None
+        self._dedupe_merge = False
     # ---------------------------------------------------------------------
     # RECEIVE REQUESTS
     # ---------------------------------------------------------------------
@@ -20,9 +36,6 @@ class SX1262Receive:
         if self.get_mode() == STATUS_MODE_RX:
             return False
 
-        # Configure IRQ mask for RX events
-        self._irq_setup(IRQ_RX_DONE | IRQ_TIMEOUT | IRQ_HEADER_ERR | IRQ_CRC_ERR)
-
         # Update internal state
         self._status_wait = STATUS_RX_WAIT
         self._status_irq = 0x0000
@@ -41,11 +54,19 @@ class SX1262Receive:
 
         # Handle TXEN pin if present
         if self._txen != -1:
-            self._tx_state = lgpio.gpio_read(self.gpio_chip, self._txen)
-            lgpio.gpio_write(self.gpio_chip, self._txen, 1)
+            self._tx_state = self.transport.read_pin(self._txen)
+            self.transport.write_pin(self._txen, 1)
+
+        # IRQ setup and SetRx go out as one batch
+        with self.batch():
+            # Configure IRQ mask for RX events
+            self._irq_setup(IRQ_RX_DONE | IRQ_TIMEOUT | IRQ_HEADER_ERR | IRQ_CRC_ERR)
 
-        # Issue the RX command
-        self.set_rx(rx_timeout)
+            # New packets go right after the newest one still unread
+            self._set_buffer_bases(self._ring.write_index)
+
+            # Issue the RX command
+            self.set_rx(rx_timeout)
 
         # No callbacks here — events will be emitted by _handle_irq()
         return True
@@ -62,9 +83,6 @@ class SX1262Receive:
         if self.get_mode() == STATUS_MODE_RX:
             return False
 
-        # Configure IRQ mask for RX events
-        self._irq_setup(IRQ_RX_DONE | IRQ_TIMEOUT | IRQ_HEADER_ERR | IRQ_CRC_ERR)
-
         # Update internal state
         self._status_wait = STATUS_RX_WAIT
         self._status_irq = 0x0000
@@ -81,11 +99,16 @@ class SX1262Receive:
 
         # Handle TXEN pin if present
         if self._txen != -1:
-            self._tx_state = lgpio.gpio_read(self.gpio_chip, self._txen)
-            lgpio.gpio_write(self.gpio_chip, self._txen, 1)
+            self._tx_state = self.transport.read_pin(self._txen)
+            self.transport.write_pin(self._txen, 1)
 
-        # Issue the duty-cycle RX command
-        self.set_rx_duty_cycle(rx_period, sleep_period)
+        with self.batch():
+            # Configure IRQ mask for RX events
+            self._irq_setup(IRQ_RX_DONE | IRQ_TIMEOUT | IRQ_HEADER_ERR | IRQ_CRC_ERR)
+            self._set_buffer_bases(self._ring.write_index)
+
+            # Issue the duty-cycle RX command
+            self.set_rx_duty_cycle(rx_period, sleep_period)
 
         return True
 
@@ -109,14 +132,8 @@ class SX1262Receive:
             length = 1
             single = True
 
-        buf = self.read_buffer(self._buffer_index, length)
-        self._buffer_index = (self._buffer_index + length) % 256
-
-        # Update remaining payload count
-        if self._payload_tx_rx > length:
-            self._payload_tx_rx -= length
-        else:
-            self._payload_tx_rx = 0
+        buf = self._read_ring(self._buffer_index, length)
+        self._advance(length)
 
         return buf[0] if single else buf
 
@@ -124,24 +141,182 @@ class SX1262Receive:
         """
         Read 'length' bytes and return them as a bytes object.
         """
-        buf = self.read_buffer(self._buffer_index, length)
-        self._buffer_index = (self._buffer_index + length) % 256
-
-        # Update remaining payload count
-        if self._payload_tx_rx > length:
-            self._payload_tx_rx -= length
-        else:
-            self._payload_tx_rx = 0
+        buf = self._read_ring(self._buffer_index, length)
+        self._advance(length)
 
         return bytes(buf)
 
     def purge(self, length: int = 0):
         """
-        Discard 'length' bytes from the RX buffer.
+        Discard 'length' bytes from the RX buffer, or the rest of the
+        current packet if length == 0.
+        """
+        if length == 0 or length > self._payload_tx_rx:
+            length = self._payload_tx_rx
+        self._advance(length)
+
+    # ---------------------------------------------------------------------
+    # BUFFER RING
+    # ---------------------------------------------------------------------
+
+    def _read_ring(self, offset: int, length: int):
+        """
+        Read 'length' bytes from 'offset', splitting a payload that wraps
+        past offset 255 into two ReadBuffer bursts (one bus operation on a
+        batching transport).
+        """
+        segments = BufferRing.segments(offset, length)
+        if len(segments) == 1:
+            return self.read_buffer(offset, length)
+        (head, tail) = self._read_many(
+            [(0x1E, n + 1, (start,), 1) for start, n in segments]
+        )
+        return bytes(head[1:]) + bytes(tail[1:])
+
+    def _write_ring(self, offset: int, data, length: int):
+        """WriteBuffer counterpart of _read_ring()."""
+        segments = BufferRing.segments(offset, length)
+        if len(segments) == 1:
+            self.write_buffer(offset, data, length)
+            return
+        data = memoryview(bytes(data[:length]))
+        split = segments[0][1]
+        self.write_buffer(offset, data[:split], split)
+        self.write_buffer(0, data[split:], length - split)
+
+    def _set_buffer_bases(self, tx_base: int, rx_base: int = None):
+        """SetBufferBaseAddress, skipped when the chip already has these."""
+        if rx_base is None:
+            rx_base = tx_base
+        if self._buffer_bases != (tx_base, rx_base):
+            self.set_buffer_base_address(tx_base, rx_base)
+
+    def _rx_buffer_status(self, payload_length: int, buffer_index: int, consumed=False):
+        """
+        Record a received packet in the ring. The read cursor
+        (_buffer_index, _payload_tx_rx) follows the oldest unread packet,
+        so back-to-back packets in RX_CONTINUOUS are read in order.
+        """
+        self._ring.received(buffer_index, payload_length, consumed)
+        head = self._ring.head()
+        if head is not None:
+            (self._buffer_index, self._payload_tx_rx) = head
+
+    def _advance(self, length: int):
+        """Move the read cursor 'length' bytes on (to the next packet at its end)."""
+        self._ring.consume(length)
+        head = self._ring.head()
+        if head is not None:
+            (self._buffer_index, self._payload_tx_rx) = head
+            return
+        self._buffer_index = (self._buffer_index + length) % 256
+        self._payload_tx_rx = max(self._payload_tx_rx - length, 0)
+
+    # ---------------------------------------------------------------------
+    # RX PIPELINE
+    # ---------------------------------------------------------------------
+
+    def enable_rx_pipeline(
+        self, maxsize: int = RX_QUEUE_SIZE, drop_policy: int = DROP_OLDEST
+    ):
+        """
+        Capture every received packet in the IRQ thread. The payload, RSSI,
+        SNR and signal RSSI are read as soon as RX_DONE fires and queued as
+        Packet objects in a bounded queue; when it is full the drop policy
+        decides which packet is discarded and an 'rx_dropped' event is
+        emitted. An 'rx_packet' event is emitted for every capture, and
+        'rx_done' is still emitted as before.
+        """
+        self._packet_queue = PacketQueue(maxsize, drop_policy)
+        return self._packet_queue
+
+    def disable_rx_pipeline(self):
+        self._packet_queue = None
+
+    def get_packet(self, timeout: float = None):
+        """
+        Return the oldest captured Packet, waiting up to 'timeout' seconds
+        (forever if None). Returns None on timeout or if the pipeline is off.
+        """
+        if self._packet_queue is None:
+            return None
+        return self._packet_queue.get(timeout)
+
+    # ---------------------------------------------------------------------
+    # RX FILTERS
+    # ---------------------------------------------------------------------
+
+    def add_filter(self, packet_filter):
+        """
+        Add a PacketFilter to the RX path. Packets any filter rejects are
+        dropped in the IRQ thread: no payload read beyond the filters'
+        prefix, no 'rx_done'/'rx_packet' event and no pipeline entry.
+        Filters needing no payload bytes (e.g. LengthFilter) run first.
+        """
+        filters = [*self._filters, packet_filter]
+        filters.sort(key=lambda f: f.prefix_length)
+        self._filters = tuple(filters)
+        return packet_filter
+
+    def remove_filter(self, packet_filter):
+        self._filters = tuple(f for f in self._filters if f is not packet_filter)
+
+    def clear_filters(self):
+        self._filters = ()
+
+    def filter_stats(self) -> dict:
+        """Per-filter passed/dropped counters plus the total dropped."""
+        stats = {f.name: f.stats() for f in self._filters}
+        stats["filtered"] = self._rx_filtered
+        return stats
+
+    def _filter_packet(self, payload_length: int, buffer_index: int) -> bool:
+        """Run the filter chain; the prefix is read at most once, and only if needed."""
+        prefix = None
+        for packet_filter in self._filters:
+            if prefix is None and packet_filter.prefix_length:
+                n = min(self._filters[-1].prefix_length, payload_length)
+                prefix = bytes(self._read_ring(buffer_index, n)) if n else b""
+            if not packet_filter(payload_length, prefix or b""):
+                self._rx_filtered += 1
+                return False
+        return True
+
+    # ---------------------------------------------------------------------
+    # DUPLICATE SUPPRESSION
+    # ---------------------------------------------------------------------
+
+    def enable_dedupe(
+        self,
+        window: float = DEDUPE_WINDOW,
+        maxsize: int = DEDUPE_SIZE,
+        key=None,
+        merge: bool = False,
+    ):
+        """
+        Suppress repeats of a packet received within 'window' seconds of
+        its first delivery, e.g. mesh rebroadcasts arriving from several
+        relays. Repeats get no 'rx_done'/'rx_packet' event and no pipeline
+        entry. 'key' maps a payload to the identity to compare (default: a
+        64-bit BLAKE2b digest of the whole payload). With 'merge' and the RX
+        pipeline on, each repeat emits 'rx_duplicate' with a new Packet
+        holding the best RSSI/SNR so far and the copy count (see
+        Packet.merge()); the Packet first delivered is left as it was.
         """
-        if self._buffer_index > length:
-            self._payload_tx_rx -= length
-        else:
-            self._payload_tx_rx = 0
+        self._dedupe_key = key or _payload_digest
+        self._dedupe_merge = merge
+        self._dedupe = DedupeCache(maxsize, window)
+        return self._dedupe
+
+    def disable_dedupe(self):
+        self._dedupe = None
+
+    def dedupe_stats(self) -> dict:
+        """Size, lookups, hits, hit_rate and evictions of the dedupe cache."""
+        if self._dedupe is None:
+            return {}
+        return self._dedupe.stats()
+
 
-        self._buffer_index += self._payload_tx_rx
+def _payload_digest(payload: bytes) -> bytes:
+    return hashlib.blake2b(payload, digest_size=8).digest()
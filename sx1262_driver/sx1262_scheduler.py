@@ -0,0 +1,268 @@
+import heapq
+import itertools
+import math
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+from .sx1262_constants import *
+from .core.duty_cycle import DutyCycleLedger
+
+
+@dataclass(frozen=True)
+class SubBand:
+    """A frequency range [low, high) in Hz with its duty-cycle limit (0..1)."""
+
+    name: str
+    low: int
+    high: int
+    duty_cycle: float
+
+    def __contains__(self, frequency: int) -> bool:
+        return self.low <= frequency < self.high
+
+
+# ETSI EN 300 220 sub-bands used by EU868 LoRaWAN
+EU868_SUB_BANDS = (
+    SubBand("g", 863000000, 868000000, 0.01),
+    SubBand("g1", 868000000, 868600000, 0.01),
+    SubBand("g2", 868700000, 869200000, 0.001),
+    SubBand("g3", 869400000, 869650000, 0.10),
+    SubBand("g4", 869700000, 870000000, 0.01),
+)
+
+
+class _TxRequest:
+    __slots__ = ("data", "frequency", "band", "airtime", "submitted", "future")
+
+    def __init__(self, data, frequency, band, airtime, submitted):
+        self.data = data
+        self.frequency = frequency
+        self.band = band
+        self.airtime = airtime
+        self.submitted = submitted
+        self.future = Future()
+
+
+class TxScheduler:
+    """
+    Airtime-budgeted transmit queue on top of an SX1262.
+
+    Every sub-band has a DutyCycleLedger charged with the computed time on
+    air of each packet (radio.time_on_air()), not the measured transmit
+    time. A worker thread releases the highest-priority queued packet
+    whose sub-band budget allows it to start now, and otherwise sleeps
+    until the earliest instant any queued packet fits. Packets on
+    different sub-bands therefore never wait for each other.
+
+        scheduler = TxScheduler(radio)
+        scheduler.start()
+        future = scheduler.submit(b"payload", priority=PRIORITY_HIGH)
+        transmit_time = future.result()
+
+    submit() returns a concurrent.futures.Future resolved with the transmit
+    time once TX_DONE arrives (use asyncio.wrap_future() from a coroutine).
+    """
+
+    def __init__(
+        self,
+        radio,
+        sub_bands=EU868_SUB_BANDS,
+        window: float = DUTY_CYCLE_WINDOW,
+        clock=time.monotonic,
+    ):
+        self.radio = radio
+        self.sub_bands = tuple(sub_bands)
+        self.clock = clock
+        self._ledgers = {
+            band.name: DutyCycleLedger(band.duty_cycle, window)
+            for band in self.sub_bands
+        }
+        self._queue = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = False
+
+        # Completion of the packet on air, set from the radio's events
+        self._done = threading.Event()
+        self._sending = False
+        self._timed_out = False
+        self._transmit_time = 0.0
+
+        self.sent = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+
+    # ---------------------------------------------------------------------
+    # LIFECYCLE
+    # ---------------------------------------------------------------------
+
+    def start(self):
+        if self._running:
+            return
+        self.radio.on("tx_done", self._on_tx_done)
+        self.radio.on("timeout", self._on_timeout)
+        if not self.radio._recv_running:
+            self.radio.start_recv_loop()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the worker. Packets still queued are cancelled."""
+        with self._cond:
+            self._running = False
+            pending = [entry[2] for entry in self._queue]
+            self._queue.clear()
+            self._cond.notify()
+        for request in pending:
+            request.future.cancel()
+        self.radio.off("tx_done", self._on_tx_done)
+        self.radio.off("timeout", self._on_timeout)
+        self._done.set()
+
+    # ---------------------------------------------------------------------
+    # SUBMISSION
+    # ---------------------------------------------------------------------
+
+    def sub_band(self, frequency: int):
+        for band in self.sub_bands:
+            if frequency in band:
+                return band
+        return None
+
+    def submit(
+        self, data, priority: int = PRIORITY_NORMAL, frequency: int = None
+    ) -> Future:
+        """
+        Queue 'data' for transmission on 'frequency' (default: the radio's
+        current frequency). Lower priority values are sent first; equal
+        priorities go out in submission order.
+        """
+        if frequency is None:
+            frequency = self.radio._frequency
+        if frequency is None:
+            raise ValueError("no frequency: call set_frequency() or pass one")
+        band = self.sub_band(frequency)
+        if band is None:
+            raise ValueError(f"{frequency} Hz is outside every configured sub-band")
+
+        airtime = self.radio.time_on_air(len(data))
+        if airtime > self._ledgers[band.name].budget:
+            raise ValueError(f"{airtime:.3f} s on air exceeds the {band.name} budget")
+
+        request = _TxRequest(bytes(data), frequency, band, airtime, self.clock())
+        with self._cond:
+            heapq.heappush(self._queue, (priority, next(self._seq), request))
+            self._cond.notify()
+        return request.future
+
+    # ---------------------------------------------------------------------
+    # WORKER
+    # ---------------------------------------------------------------------
+
+    def _next_request(self):
+        """Pop the packet to send now, waiting until one fits a budget."""
+        with self._cond:
+            while self._running:
+                now = self.clock()
+                wake = math.inf
+                for entry in sorted(self._queue):
+                    request = entry[2]
+                    ledger = self._ledgers[request.band.name]
+                    start = ledger.earliest(request.airtime, now)
+                    if start <= now:
+                        self._queue.remove(entry)
+                        heapq.heapify(self._queue)
+                        # Reserve the airtime now; _started() moves it to
+                        # the moment SetTx actually goes out
+                        ledger.record(now, request.airtime)
+                        self.wait_total += now - request.submitted
+                        return request
+                    wake = min(wake, start)
+                self._cond.wait(None if wake == math.inf else wake - now)
+        return None
+
+    def _run(self):
+        while True:
+            request = self._next_request()
+            if request is None:
+                return
+            if request.future.set_running_or_notify_cancel():
+                self._send(request)
+
+    def _send(self, request: _TxRequest):
+        radio = self.radio
+        try:
+            if request.frequency != radio._frequency:
+                radio.set_frequency(request.frequency)
+
+            self._done.clear()
+            self._timed_out = False
+            self._sending = True
+            with radio.batch():
+                radio.begin_packet()
+                radio.put(request.data)
+                ok = radio.end_packet()
+                radio._after_flush(lambda: self._started(request))
+            if not ok:
+                raise RuntimeError("radio is already transmitting")
+
+            # Backstop in case the TX timeout IRQ itself is lost
+            limit = request.airtime * TX_TIMEOUT_MARGIN + 1.0
+            if not self._done.wait(limit) or self._timed_out:
+                self.timeouts += 1
+                raise TimeoutError("TX timeout")
+        except Exception as e:
+            request.future.set_exception(e)
+        else:
+            self.sent += 1
+            request.future.set_result(self._transmit_time)
+        finally:
+            self._sending = False
+
+    def _started(self, request: _TxRequest):
+        with self._cond:
+            self._ledgers[request.band.name].started(self.clock())
+
+    def _on_tx_done(self, transmit_time=None, **kwargs):
+        if self._sending:
+            self._transmit_time = transmit_time
+            self._done.set()
+
+    def _on_timeout(self, **kwargs):
+        if self._sending:
+            self._timed_out = True
+            self._done.set()
+
+    # ---------------------------------------------------------------------
+    # METRICS
+    # ---------------------------------------------------------------------
+
+    def metrics(self) -> dict:
+        """
+        Scheduler counters plus, per sub-band, the budget (s), airtime
+        currently counted in the window (s) and utilisation (0..1).
+        """
+        with self._cond:
+            now = self.clock()
+            bands = {
+                name: {
+                    "duty_cycle": ledger.duty_cycle,
+                    "budget_s": ledger.budget,
+                    "used_s": ledger.used(now),
+                    "utilisation": ledger.utilisation(now),
+                    "transmissions": ledger.transmissions,
+                    "airtime_s": ledger.airtime,
+                }
+                for name, ledger in self._ledgers.items()
+            }
+            return {
+                "queued": len(self._queue),
+                "sent": self.sent,
+                "timeouts": self.timeouts,
+                "wait_s_total": self.wait_total,
+                "sub_bands": bands,
+            }
@@ -1,3 +1,4 @@
+import threading
 import time
 
 from .sx1262_constants import *
@@ -5,49 +6,101 @@ from .sx1262_constants import *
 class SX1262Status:
     def __init__(self):
         super().__init__()
+        # Notified by _handle_irq() once an IRQ has been decoded
+        self._irq_cond = threading.Condition()
 
     # WAIT, OPERATION STATUS, AND PACKET STATUS METHODS
 
-    def wait(self, timeout: int = 0) -> bool:
+    def wait(self, timeout: float = 0) -> bool:
+        """
+        Block until the pending TX/RX operation raises an IRQ, or for at
+        most 'timeout' seconds (0 waits forever). With the recv loop
+        running this sleeps on a condition the IRQ path notifies; without
+        it the IRQ status is polled at an interval derived from the
+        modulation (see _poll_irq()).
+        """
         if self._status_irq:
             return True
 
-        irq_stat = 0x0000
-        start = time.time()
+        deadline = time.time() + timeout if timeout > 0 else None
 
-        while irq_stat == 0x0000 and self._status_irq == 0x0000:
-            if self._irq == -1:
-                irq_stat = self.get_irq_status()
+        if self._recv_running:
+            # _handle_irq() does the TX/RX bookkeeping below itself
+            with self._irq_cond:
+                return bool(
+                    self._irq_cond.wait_for(
+                        lambda: self._status_irq, timeout if timeout > 0 else None
+                    )
+                )
 
-            if timeout > 0 and (time.time() - start) > timeout:
-                return False
+        irq_stat = self._poll_irq(deadline)
+        if irq_stat == 0x0000:
+            return False
 
-        if self._status_irq:
-            return True
-        elif self._status_wait == STATUS_TX_WAIT:
+        self._track_irq_mode(irq_stat)
+        if self._status_wait == STATUS_TX_WAIT:
             self._transmit_time = time.time() - self._transmit_time
             if self._txen != -1:
                 # restore TXEN pin
                 # value already in self._tx_state
-                from lgpio import gpio_write
-
-                gpio_write(self.gpio_chip, self._txen, self._tx_state)
+                self.transport.write_pin(self._txen, self._tx_state)
 
         elif self._status_wait == STATUS_RX_WAIT:
-            (self._payload_tx_rx, self._buffer_index) = self.get_rx_buffer_status()
+            self._wait_rx_buffer_status(irq_stat)
             if self._txen != -1:
-                from lgpio import gpio_write
-
-                gpio_write(self.gpio_chip, self._txen, self._tx_state)
+                self.transport.write_pin(self._txen, self._tx_state)
             self._fix_rx_timeout()
 
         elif self._status_wait == STATUS_RX_CONTINUOUS:
-            (self._payload_tx_rx, self._buffer_index) = self.get_rx_buffer_status()
+            self._wait_rx_buffer_status(irq_stat)
             self.clear_irq_status(IRQ_ALL)
 
         self._status_irq = irq_stat
         return True
 
+    def _wait_rx_buffer_status(self, irq_stat: int):
+        """
+        Record the packet wait() saw arrive. On TIMEOUT or a header error
+        GetRxBufferStatus still describes the previous packet, so nothing
+        is recorded; a CRC-failed packet only moves the write pointer.
+        """
+        if irq_stat & IRQ_RX_DONE:
+            self._rx_buffer_status(
+                *self.get_rx_buffer_status(), consumed=bool(irq_stat & IRQ_CRC_ERR)
+            )
+
+    def _poll_irq(self, deadline: float = None) -> int:
+        """
+        Poll GetIrqStatus until it is non-zero or 'deadline' passes. The
+        interval is one LoRa symbol (clamped to WAIT_POLL_MIN..MAX), which
+        bounds the added latency, and a TX sleeps through most of its
+        computed time on air before the first poll.
+        """
+        interval = min(max(self.symbol_time(), WAIT_POLL_MIN), WAIT_POLL_MAX)
+
+        if self._status_wait == STATUS_TX_WAIT:
+            # _transmit_time holds the time SetTx was issued
+            done = self._transmit_time + self.time_on_air(self._payload_tx_rx)
+            if deadline is not None:
+                done = min(done, deadline)
+            delay = done - interval - time.time()
+            if delay > 0:
+                time.sleep(delay)
+
+        while True:
+            irq_stat = self.get_irq_status()
+            if irq_stat:
+                return irq_stat
+            if deadline is not None and time.time() > deadline:
+                return 0x0000
+            time.sleep(interval)
+
+    def _notify_irq(self, irq: int):
+        """Publish 'irq' as the operation status and wake wait()."""
+        with self._irq_cond:
+            self._status_irq = irq
+            self._irq_cond.notify_all()
+
     def status(self) -> int:
         status_irq = self._status_irq
         if self._status_wait == STATUS_RX_CONTINUOUS:
@@ -0,0 +1,204 @@
+import time
+
+from .sx1262_constants import *
+from .core.metrics_registry import MetricsRegistry
+
+
+class RadioTelemetry:
+    """
+    Radio metrics fed from the IRQ path into a MetricsRegistry.
+
+    _handle_irq() calls irq() for every decoded IRQ (packet, error, timeout
+    and CAD counters, plus the lag from the IRQ edge or poll to decoding)
+    and the RX pipeline calls packet() for every captured packet (RSSI and
+    SNR histograms; without the pipeline the packet status is never read,
+    so those stay empty). Each update is a few attribute writes.
+
+    Everything else is collected at render time: the driver counters from
+    radio.metrics(), the per-opcode SPI statistics when enable_metrics() is
+    on, and with 'chip_stats' the chip's own GetStats/GetDeviceErrors
+    (two SPI reads per scrape).
+    """
+
+    def __init__(self, radio, registry: MetricsRegistry = None, chip_stats: bool = False):
+        self.radio = radio
+        self.chip_stats = chip_stats
+        r = self.registry = registry if registry is not None else MetricsRegistry()
+
+        self.irqs = r.counter("sx1262_irqs", "IRQs decoded by the driver")
+        self.tx_packets = r.counter("sx1262_tx_packets", "Packets transmitted (TX_DONE)")
+        self.tx_airtime = r.counter(
+            "sx1262_tx_airtime_seconds", "Computed time on air of transmitted packets"
+        )
+        self.rx_packets = r.counter("sx1262_rx_packets", "Packets received (RX_DONE)")
+        self.crc_errors = r.counter("sx1262_rx_crc_errors", "Packets received with a CRC error")
+        self.header_errors = r.counter("sx1262_rx_header_errors", "LoRa header errors")
+        self.timeouts = r.counter("sx1262_timeouts", "TX or RX timeouts")
+        self.cad_done = r.counter("sx1262_cad", "Channel activity detections run")
+        self.cad_detected = r.counter("sx1262_cad_detected", "CAD runs that found activity")
+        self.irq_lag = r.histogram(
+            "sx1262_irq_lag_seconds",
+            "Delay from the IRQ edge (or status poll) to decoding",
+            IRQ_LAG_BUCKETS,
+        )
+        self.rssi = r.histogram("sx1262_rx_rssi_dbm", "RSSI of captured packets", RSSI_BUCKETS)
+        self.snr = r.histogram("sx1262_rx_snr_db", "SNR of captured packets", SNR_BUCKETS)
+        r.add_collector(self.collect)
+
+    # ---------------------------------------------------------------------
+    # UPDATES (IRQ thread)
+    # ---------------------------------------------------------------------
+
+    def irq(self, irq: int, timestamp: int = None):
+        self.irqs.inc()
+        if timestamp is not None:
+            self.irq_lag.observe((time.monotonic_ns() - timestamp) * 1e-9)
+        if irq & IRQ_TX_DONE:
+            self.tx_packets.inc()
+            self.tx_airtime.inc(self.radio.time_on_air(self.radio._payload_tx_rx))
+        if irq & IRQ_RX_DONE:
+            self.rx_packets.inc()
+        if irq & IRQ_CRC_ERR:
+            self.crc_errors.inc()
+        if irq & IRQ_HEADER_ERR:
+            self.header_errors.inc()
+        if irq & IRQ_TIMEOUT:
+            self.timeouts.inc()
+        if irq & IRQ_CAD_DONE:
+            self.cad_done.inc()
+            if irq & IRQ_CAD_DETECTED:
+                self.cad_detected.inc()
+
+    def packet(self, packet):
+        self.rssi.observe(packet.rssi)
+        self.snr.observe(packet.snr)
+
+    # ---------------------------------------------------------------------
+    # RENDER-TIME COLLECTION
+    # ---------------------------------------------------------------------
+
+    def collect(self):
+        metrics = self.radio.metrics()
+
+        yield (
+            "sx1262_mode_mismatches",
+            "counter",
+            "IRQs that disagreed with the tracked chip mode",
+            (("_total", None, metrics["mode_mismatches"]),),
+        )
+        yield (
+            "sx1262_rx_overruns",
+            "counter",
+            "Unread packets overwritten in the chip buffer",
+            (
+                ("_total", {"cause": "rx"}, metrics["rx_overruns"]),
+                ("_total", {"cause": "tx"}, metrics["rx_overwritten"]),
+            ),
+        )
+        yield (
+            "sx1262_rx_filtered",
+            "counter",
+            "Packets dropped by the RX filter chain",
+            (("_total", None, metrics["rx_filtered"]),),
+        )
+        yield (
+            "sx1262_rx_short_reads",
+            "counter",
+            "Packets dropped because the SPI read came back short",
+            (("_total", None, metrics["rx_short_reads"]),),
+        )
+        dedupe = metrics["dedupe"]
+        if dedupe:
+            yield (
+                "sx1262_rx_duplicates",
+                "counter",
+                "Repeated packets suppressed by the dedupe stage",
+                (("_total", None, dedupe["hits"]),),
+            )
+
+        wake = metrics["wake"]
+        yield (
+            "sx1262_wakes",
+            "counter",
+            "Wake-ups from sleep by start type",
+            (
+                ("_total", {"start": "warm"}, wake["warm"]),
+                ("_total", {"start": "cold"}, wake["cold"]),
+            ),
+        )
+        yield (
+            "sx1262_restored_commands",
+            "counter",
+            "Commands re-sent to restore the configuration after cold sleep",
+            (("_total", None, wake["restored_commands"]),),
+        )
+        yield (
+            "sx1262_wake_seconds",
+            "histogram",
+            "Time from wake() to the chip in standby",
+            _snapshot_samples(wake["ready"], None),
+        )
+        yield (
+            "sx1262_wake_to_tx_seconds",
+            "histogram",
+            "Time from wake() to the next SetTx",
+            _snapshot_samples(wake["to_tx"], None),
+        )
+
+        spi = metrics["spi"]
+        if spi:
+            yield from self._spi_families(spi)
+
+        if self.chip_stats:
+            (received, crc_errors, header_errors) = self.radio.get_stats()
+            yield (
+                "sx1262_chip_packets",
+                "gauge",
+                "GetStats counters since the last ResetStats",
+                (
+                    ("", {"kind": "received"}, received),
+                    ("", {"kind": "crc_error"}, crc_errors),
+                    ("", {"kind": "header_error"}, header_errors),
+                ),
+            )
+            yield (
+                "sx1262_device_errors",
+                "gauge",
+                "GetDeviceErrors bit field",
+                (("", None, self.radio.get_device_errors()),),
+            )
+
+    def _spi_families(self, spi: dict):
+        calls, moved, busy, transfer = [], [], [], []
+        for stats in spi.values():
+            labels = {"command": stats["name"]}
+            calls.append(("_total", labels, stats["calls"]))
+            moved.append(("_total", labels, stats["bytes"]))
+            busy.extend(_snapshot_samples(stats["busy"], labels))
+            transfer.extend(_snapshot_samples(stats["transfer"], labels))
+        yield ("sx1262_spi_commands", "counter", "SPI commands sent", calls)
+        yield ("sx1262_spi_bytes", "counter", "Bytes clocked over SPI", moved)
+        yield (
+            "sx1262_spi_busy_wait_seconds",
+            "histogram",
+            "BUSY wait before each SPI command",
+            busy,
+        )
+        yield (
+            "sx1262_spi_transfer_seconds",
+            "histogram",
+            "SPI transfer time including chip select",
+            transfer,
+        )
+
+
+def _snapshot_samples(snapshot: dict, labels: dict):
+    """histogram_samples() for a Histogram.snapshot() dict."""
+    samples = []
+    for bound, running in snapshot["buckets"].items():
+        le = "+Inf" if bound == float("inf") else repr(float(bound))
+        samples.append(("_bucket", {**(labels or {}), "le": le}, running))
+    if min(snapshot["buckets"]) >= 0:
+        samples.append(("_count", labels, snapshot["count"]))
+        samples.append(("_sum", labels, snapshot["sum_s"]))
+    return samples
@@ -1,5 +1,4 @@
 import time
-import lgpio
 
 from .sx1262_constants import *
 
@@ -20,57 +19,73 @@ class SX1262Transmit:
         # Reset payload counter
         self._payload_tx_rx = 0
 
-        # Set TX and RX base addresses (TX at current index)
-        self.set_buffer_base_address(
-            self._buffer_index,
-            (self._buffer_index + 0xFF) % 0xFF
-        )
+        # The payload goes right after the newest received packet, and the
+        # next RX starts there again once it has been sent
+        self._tx_index = self._ring.write_index
+        self._set_buffer_bases(self._tx_index)
 
         # Handle TXEN pin if present
         if self._txen != -1:
-            self._tx_state = lgpio.gpio_read(self.gpio_chip, self._txen)
-            lgpio.gpio_write(self.gpio_chip, self._txen, 0)
+            self._tx_state = self.transport.read_pin(self._txen)
+            self.transport.write_pin(self._txen, 0)
 
         # Apply Semtech BW500 workaround if needed
         self._fix_lora_bw500(self._bw)
 
-    def end_packet(self, timeout: int = TX_SINGLE) -> bool:
+    def end_packet(self, timeout: int = TX_TIMEOUT_AUTO) -> bool:
         """
         Finalize the packet and start transmission.
         TX completion will be delivered via the 'tx_done' event.
+
+        'timeout' is the hardware TX timeout in ms, TX_SINGLE for none, or
+        TX_TIMEOUT_AUTO to derive it from the packet's time on air so a
+        stuck transmission raises a timeout IRQ.
         """
         # If already transmitting, reject
         if self.get_mode() == STATUS_MODE_TX:
             return False
 
-        # Configure IRQ mask for TX_DONE and TIMEOUT
-        self._irq_setup(IRQ_TX_DONE | IRQ_TIMEOUT)
-
-        # Update packet parameters (payload length, CRC, IQ, etc.)
-        self.set_packet_params_lora(
-            self._preamble_length,
-            self._header_type,
-            self._payload_tx_rx,
-            self._crc_type,
-            self._invert_iq,
-        )
-
         # Update internal state
         self._status_wait = STATUS_TX_WAIT
         self._status_irq = 0x0000
 
-        # Convert timeout to SX1262 units
-        tx_timeout = timeout << 6
+        # Convert timeout to SX1262 units (15.625 us, 64 per ms)
+        if timeout == TX_TIMEOUT_AUTO:
+            airtime_ms = self.time_on_air(self._payload_tx_rx) * 1000
+            tx_timeout = int((airtime_ms * TX_TIMEOUT_MARGIN + TX_TIMEOUT_GUARD_MS) * 64)
+        else:
+            tx_timeout = timeout << 6
         if tx_timeout > 0x00FFFFFF:
             tx_timeout = TX_SINGLE
 
-        # Start TX
-        self.set_tx(tx_timeout)
-        self._transmit_time = time.time()
+        # Unread packets under the payload are gone; stop tracking them
+        self._ring.reserve_tx(self._payload_tx_rx)
+
+        # IRQ setup, packet parameters and SetTx go out as one batch
+        with self.batch():
+            # Configure IRQ mask for TX_DONE and TIMEOUT
+            self._irq_setup(IRQ_TX_DONE | IRQ_TIMEOUT)
+
+            # Update packet parameters (payload length, CRC, IQ, etc.)
+            self.set_packet_params_lora(
+                self._preamble_length,
+                self._header_type,
+                self._payload_tx_rx,
+                self._crc_type,
+                self._invert_iq,
+            )
+
+            # Start TX
+            self.set_tx(tx_timeout)
+            # In an outer batch SetTx only leaves when that one exits
+            self._after_flush(self._mark_tx_start)
 
         # No callbacks here — events will be emitted by _handle_irq()
         return True
 
+    def _mark_tx_start(self):
+        self._transmit_time = time.time()
+
     # ---------------------------------------------------------------------
     # BUFFER WRITE HELPERS
     # ---------------------------------------------------------------------
@@ -88,20 +103,22 @@ class SX1262Transmit:
         else:
             raise TypeError("input data must be list, tuple, integer or float")
 
-        self.write_buffer(self._buffer_index, data, length)
-        self._buffer_index = (self._buffer_index + length) % 256
+        self._write_ring(self._tx_index, data, length)
+        self._tx_index = (self._tx_index + length) % 256
         self._payload_tx_rx += length
 
     def put(self, data):
         """
-        Write a bytes or bytearray object into the TX buffer.
+        Write a bytes, bytearray or memoryview object into the TX buffer.
+        The payload is passed through to the SPI frame without copying it
+        into an intermediate tuple.
         """
-        if isinstance(data, (bytes, bytearray)):
-            data_list = tuple(data)
-            length = len(data_list)
-        else:
-            raise TypeError("input data must be bytes or bytearray")
-
-        self.write_buffer(self._buffer_index, data_list, length)
-        self._buffer_index = (self._buffer_index + length) % 256
+        if isinstance(data, memoryview):
+            data = data.cast("B")
+        elif not isinstance(data, (bytes, bytearray)):
+            raise TypeError("input data must be bytes, bytearray or memoryview")
+        length = len(data)
+
+        self._write_ring(self._tx_index, data, length)
+        self._tx_index = (self._tx_index + length) % 256
         self._payload_tx_rx += length
@@ -35,10 +35,37 @@ class SX1262Vars:
         # Operation properties
         self._buffer_index = BUFFER_INDEX
         self._payload_tx_rx = PAYLOAD_TX_RX
+        # TX write cursor, kept apart from the RX read cursor _buffer_index
+        self._tx_index = BUFFER_INDEX
+        # (tx, rx) base addresses last sent; None when unknown
+        self._buffer_bases = None
         self._status_wait = STATUS_WAIT
         self._status_irq = STATUS_IRQ
         self._transmit_time = TRANSMIT_TIME
 
+        # Chip mode tracked from issued commands and IRQs (see get_mode())
+        self._mode = MODE
+        self._fallback_mode = FALLBACK_MODE
+        self._cad_exit_mode = CAD_EXIT_MODE
+        self._mode_mismatches = 0
+
+        # Last RadioConfig applied; None until apply() or after the chip
+        # lost its configuration, which keeps it for restore()
+        self._applied_config = None
+        self._restore_config = None
+
+        # SetSleep parameter while asleep (None when awake) and when it was
+        # sent; wake() waits out the 500 us the chip ignores wake-up in
+        self._sleep_config = None
+        self._slept_at = 0.0
+
+        # CalibrateImage band the chip is calibrated for, and the channel
+        # plan used by hop()
+        self._image_band = None
+        self._channel_plan = None
+        # Last frequency set, in Hz
+        self._frequency = None
+
         # NOTE:
         # Legacy callback slots (_on_transmit, _on_receive) are no longer used.
         # Event delivery is handled via EventEmitter (self.on/emit).
@@ -0,0 +1,50 @@
+"""
+SPI/GPIO transports for the SX1262 driver.
+
+Currently exposes:
+- Transport: abstract backend interface
+- LgpioTransport: Raspberry Pi backend (spidev + lgpio)
+- IoctlTransport: Raspberry Pi backend batching frames via SPI_IOC_MESSAGE
+- EmulatorTransport / SX1262Emulator: in-process chip model, no hardware needed
+- TraceTransport / ReplayTransport: SPI trace recorder and trace-driven stand-in
+"""
+
+import importlib
+
+# Public name -> defining module, imported by __getattr__ on first access;
+# the Pi backends import spidev/lgpio only when instantiated
+_LAZY = {
+    "Transport": ".base",
+    "LgpioTransport": ".lgpio_spidev",
+    "IoctlTransport": ".spidev_ioctl",
+    "EmulatorTransport": ".emulator",
+    "SX1262Emulator": ".emulator",
+    "TraceTransport": ".trace",
+    "ReplayTransport": ".trace",
+    "read_trace": ".trace",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+__all__ = [
+    "Transport",
+    "LgpioTransport",
+    "IoctlTransport",
+    "EmulatorTransport",
+    "SX1262Emulator",
+    "TraceTransport",
+    "ReplayTransport",
+    "read_trace",
+]
@@ -0,0 +1,93 @@
+import time
+
+
+class Transport:
+    """
+    Abstract SPI/GPIO backend used by SX1262Api and SX1262Common.
+
+    A transport owns the SPI device and the GPIO lines wired to the radio.
+    The driver never talks to spidev or lgpio directly; every command frame
+    goes through transfer() and every pin access through read_pin() /
+    write_pin(), so the same driver stack can run against real hardware or
+    an in-process emulator.
+    """
+
+    # True when transfer_many() sends several frames in one bus operation
+    supports_batch = False
+
+    def __init__(self):
+        super().__init__()
+
+    def open(self, bus: int, cs: int, speed: int):
+        raise NotImplementedError
+
+    def close(self):
+        raise NotImplementedError
+
+    def setup_pins(
+        self,
+        reset: int,
+        busy: int,
+        cs: int,
+        irq: int = -1,
+        txen: int = -1,
+        rxen: int = -1,
+        wake: int = -1,
+    ):
+        """
+        Claim the GPIO lines used by the radio. 'cs' is the manually driven
+        chip-select line that transfer() asserts around each frame.
+        """
+        raise NotImplementedError
+
+    def write_pin(self, pin: int, level: int):
+        raise NotImplementedError
+
+    def read_pin(self, pin: int) -> int:
+        raise NotImplementedError
+
+    def wait_for_level(self, pin: int, level: int, timeout: float) -> bool:
+        """
+        Block until 'pin' reads 'level' or 'timeout' seconds pass. Returns
+        True if the level was reached. The default polls with sleeps that
+        back off from 50 us to 1 ms; hardware backends override it with an
+        edge-triggered wait.
+        """
+        deadline = time.monotonic() + timeout
+        delay = 50e-6
+        while self.read_pin(pin) != level:
+            now = time.monotonic()
+            if now >= deadline:
+                return False
+            time.sleep(min(delay, deadline - now))
+            delay = min(delay * 2, 1e-3)
+        return True
+
+    def add_edge_callback(self, pin: int, callback):
+        """
+        Call callback(timestamp_ns) on every rising edge of 'pin', where
+        timestamp_ns is the edge time reported by the kernel. Returns a
+        handle whose cancel() method removes the callback. Transports
+        without edge support raise NotImplementedError and the driver polls.
+        """
+        raise NotImplementedError
+
+    def transfer(self, data):
+        """
+        Clock one command frame out with chip select asserted and return the
+        bytes clocked in (same length as 'data'). 'data' is any bytes-like
+        object; it may be a view of a reused scratch buffer, so transports
+        must not keep a reference to it after returning. The result must be
+        a bytes-like object.
+        """
+        raise NotImplementedError
+
+    def transfer_many(self, frames) -> list:
+        """
+        Send several complete command frames back to back, releasing chip
+        select and allowing for each opcode's BUSY time between them, and
+        return one response per frame sent. If BUSY does not drop before a
+        frame, that frame and the rest are dropped and the list is short.
+        Only called when supports_batch is True.
+        """
+        raise NotImplementedError
@@ -0,0 +1,681 @@
+import threading
+import time
+from collections import deque
+
+from ..sx1262_constants import *
+from ..sx1262_airtime import BW_HZ, symbol_time, time_on_air
+from .base import Transport
+
+# Power-on register values the driver reads back before modifying
+_REGISTER_DEFAULTS = {
+    REG_IQ_POLARITY_SETUP: 0x0D,
+    REG_LORA_SYNC_WORD_MSB: 0x14,
+    REG_LORA_SYNC_WORD_MSB + 1: 0x24,
+    REG_TX_MODULATION: 0x04,
+    REG_RX_GAIN: POWER_SAVING_GAIN,
+    REG_TX_CLAMP_CONFIG: 0xC8,
+    REG_OCP_CONFIGURATION: 0x18,
+    REG_XTA_TRIM: 0x05,
+    REG_XTB_TRIM: 0x05,
+}
+
+_MODE_SLEEP = 0x00
+_REGISTER_SPACE = 0x1000
+
+
+class SX1262Emulator:
+    """
+    In-process model of the SX1262 command interface.
+
+    Models the opcodes issued by SX1262Api: the register file, the 256-byte
+    data buffer, IRQ status and masks, BUSY timing and the chip mode
+    reported by GetStatus. Time-dependent operations (TX airtime, RX and CAD
+    timeouts) complete lazily the next time the chip is accessed, so the
+    model needs no threads of its own.
+
+    busy_scale and airtime_scale multiply the modelled BUSY and on-air
+    durations; set them to 0 to run the driver at wire speed.
+    """
+
+    def __init__(
+        self,
+        busy_scale: float = 1.0,
+        airtime_scale: float = 1.0,
+        clock=time.monotonic,
+    ):
+        self.busy_scale = busy_scale
+        self.airtime_scale = airtime_scale
+        self.clock = clock
+        self._lock = threading.RLock()
+        # Notified whenever a command, reset or injected packet may have
+        # changed the IRQ line; used to emulate GPIO edge alerts
+        self.changed = threading.Condition(self._lock)
+
+        # Frames sent while BUSY was high; a real chip would drop them
+        self.busy_violations = 0
+        # Payloads that finished transmitting, oldest first
+        self.transmitted = deque(maxlen=64)
+        # Set True to make CAD report channel activity
+        self.channel_activity = False
+        # Instantaneous RSSI reported outside of packets (dBm)
+        self.noise_floor = -110.0
+
+        self._commands = {
+            0x84: self._cmd_set_sleep,
+            0x80: self._cmd_set_standby,
+            0xC1: self._cmd_set_fs,
+            0x83: self._cmd_set_tx,
+            0x82: self._cmd_set_rx,
+            0x94: self._cmd_set_rx_duty_cycle,
+            0xC5: self._cmd_set_cad,
+            0xD1: self._cmd_set_tx_infinite,
+            0xD2: self._cmd_set_tx_infinite,
+            0x93: self._cmd_set_fallback,
+            0x0D: self._cmd_write_register,
+            0x1D: self._cmd_read_register,
+            0x0E: self._cmd_write_buffer,
+            0x1E: self._cmd_read_buffer,
+            0x08: self._cmd_set_dio_irq_params,
+            0x12: self._cmd_get_irq_status,
+            0x02: self._cmd_clear_irq_status,
+            0x86: self._cmd_set_rf_frequency,
+            0x8A: self._cmd_set_packet_type,
+            0x11: self._cmd_get_packet_type,
+            0x8B: self._cmd_set_modulation_params,
+            0x8C: self._cmd_set_packet_params,
+            0x88: self._cmd_set_cad_params,
+            0x8F: self._cmd_set_buffer_base_address,
+            0xC0: self._cmd_get_status,
+            0x13: self._cmd_get_rx_buffer_status,
+            0x14: self._cmd_get_packet_status,
+            0x15: self._cmd_get_rssi_inst,
+            0x10: self._cmd_get_stats,
+            0x00: self._cmd_reset_stats,
+            0x17: self._cmd_get_device_errors,
+            0x07: self._cmd_clear_device_errors,
+            # Accepted without modelled side effects
+            0x9F: self._cmd_nop,
+            0x96: self._cmd_nop,
+            0x89: self._cmd_nop,
+            0x98: self._cmd_nop,
+            0x95: self._cmd_nop,
+            0x9D: self._cmd_nop,
+            0x97: self._cmd_nop,
+            0x8E: self._cmd_nop,
+            0xA0: self._cmd_nop,
+        }
+
+        self._in_reset = False
+        self._power_on()
+
+    # ---------------------------------------------------------------------
+    # STATE
+    # ---------------------------------------------------------------------
+
+    def _power_on(self):
+        self.registers = bytearray(_REGISTER_SPACE)
+        for address, value in _REGISTER_DEFAULTS.items():
+            self.registers[address] = value
+        self.buffer = bytearray(256)
+        self._reset_config()
+        self._mode = STATUS_MODE_STDBY_RC
+        self._busy_until = self._after_us(BUSY_TIME_RESET_US, self.busy_scale)
+
+    def _reset_config(self):
+        self.packet_type = FSK_MODEM
+        self.rf_frequency = 0
+        self.fallback_mode = STATUS_MODE_STDBY_RC
+        self.modulation = (SF, BW_125000, 1, LDRO_OFF)
+        self.packet_params = (PREAMBLE_LENGTH, HEADER_EXPLICIT, 0xFF, CRC_ON, IQ_STANDARD)
+        self.cad_params = (CAD_ON_2_SYMB, 24, 10, CAD_EXIT_STDBY, 0)
+        self.tx_base = 0
+        self.rx_base = 0
+        self.irq_mask = 0
+        self.dio_masks = (0, 0, 0)
+        self.irq_status = 0
+        self.irq_edges = 0
+        self.rx_payload_length = 0
+        self.rx_start = 0
+        self.packet_status = (0, 0, 0)
+        self.stats = [0, 0, 0]
+        self.device_errors = 0
+        self._cmd_status = 0
+        self._rx_pointer = 0
+        self._rx_continuous = False
+        self._sleep_config = None
+        self._pending = None
+        self._deadline = None
+
+    def _after_us(self, us: float, scale: float) -> float:
+        return self.clock() + us * 1e-6 * scale
+
+    def _advance(self):
+        """Complete any timed operation whose deadline has passed."""
+        if self._deadline is not None and self.clock() >= self._deadline:
+            pending = self._pending
+            self._pending = None
+            self._deadline = None
+            pending()
+
+    def _schedule(self, seconds: float, action):
+        self._pending = action
+        self._deadline = self.clock() + seconds
+
+    def _raise_irq(self, bits: int):
+        # Count DIO1 rising edges so a clear and re-raise between two
+        # samples of the line is still seen as an edge, as by a GPIO latch
+        dio1 = self.dio_masks[0]
+        was_low = not self.irq_status & dio1
+        self.irq_status |= bits & self.irq_mask
+        if was_low and self.irq_status & dio1:
+            self.irq_edges += 1
+
+    @property
+    def mode(self) -> int:
+        with self._lock:
+            self._advance()
+            return self._mode
+
+    def status_byte(self) -> int:
+        return self._mode | self._cmd_status
+
+    # ---------------------------------------------------------------------
+    # PIN LEVEL INTERFACE
+    # ---------------------------------------------------------------------
+
+    def busy(self) -> int:
+        with self._lock:
+            self._advance()
+            if self._in_reset or self._mode == _MODE_SLEEP:
+                return 1
+            return 1 if self.clock() < self._busy_until else 0
+
+    def busy_remaining(self):
+        """Seconds until BUSY drops, or None while asleep or held in reset."""
+        with self._lock:
+            self._advance()
+            if self._in_reset or self._mode == _MODE_SLEEP:
+                return None
+            return max(self._busy_until - self.clock(), 0.0)
+
+    def irq_line(self, dio: int = 1) -> int:
+        with self._lock:
+            self._advance()
+            return 1 if self.irq_status & self.dio_masks[dio - 1] else 0
+
+    def next_deadline(self):
+        """Clock value at which the pending timed operation completes."""
+        return self._deadline
+
+    def set_reset(self, level: int):
+        with self._lock:
+            if level == 0:
+                self._in_reset = True
+            elif self._in_reset:
+                self._in_reset = False
+                self._power_on()
+            self.changed.notify_all()
+
+    # ---------------------------------------------------------------------
+    # SPI INTERFACE
+    # ---------------------------------------------------------------------
+
+    def transfer(self, frame) -> bytearray:
+        with self._lock:
+            self._advance()
+            frame = bytes(frame)
+            resp = bytearray(len(frame))
+            if not frame or self._in_reset:
+                return resp
+
+            if self._mode == _MODE_SLEEP:
+                # NSS falling edge wakes the chip; the command itself is lost
+                self._wake()
+                return resp
+
+            if self.clock() < self._busy_until:
+                self.busy_violations += 1
+
+            opcode = frame[0]
+            handler = self._commands.get(opcode)
+            resp[:] = bytes((self.status_byte(),)) * len(frame)
+            if handler is None:
+                self._cmd_status = STATUS_CMD_ERROR
+            else:
+                handler(frame, resp)
+
+            self._busy_until = self._after_us(
+                BUSY_TIME_US.get(opcode, BUSY_TIME_DEFAULT_US), self.busy_scale
+            )
+            self.changed.notify_all()
+            return resp
+
+    def _wake(self):
+        cold = not (self._sleep_config & 0x04)
+        if cold:
+            self.registers = bytearray(_REGISTER_SPACE)
+            for address, value in _REGISTER_DEFAULTS.items():
+                self.registers[address] = value
+            self._reset_config()
+            wake_us = BUSY_TIME_WAKE_COLD_US
+        else:
+            wake_us = BUSY_TIME_WAKE_WARM_US
+        self._sleep_config = None
+        self._mode = STATUS_MODE_STDBY_RC
+        self._busy_until = self._after_us(wake_us, self.busy_scale)
+
+    # ---------------------------------------------------------------------
+    # RADIO SIMULATION
+    # ---------------------------------------------------------------------
+
+    def time_on_air(self, payload_length: int) -> float:
+        """LoRa time on air in seconds for the current modem settings."""
+        sf, bw, cr, ldro = self.modulation
+        preamble, header, _, crc, _ = self.packet_params
+        return time_on_air(
+            payload_length,
+            sf,
+            BW_HZ.get(bw, 125000),
+            cr + 4,
+            preamble,
+            header == HEADER_IMPLICIT,
+            bool(crc),
+            bool(ldro),
+        )
+
+    def inject_packet(
+        self,
+        payload,
+        rssi: float = -60.0,
+        snr: float = 10.0,
+        signal_rssi: float = None,
+        crc_error: bool = False,
+        header_error: bool = False,
+    ) -> bool:
+        """
+        Deliver a packet to the receiver. Returns False if the chip is not
+        in RX mode and the packet is therefore missed.
+        """
+        with self._lock:
+            self._advance()
+            if self._mode != STATUS_MODE_RX or self._pending == self._cad_done:
+                return False
+
+            if header_error:
+                self._raise_irq(IRQ_HEADER_ERR)
+                self.stats[2] = (self.stats[2] + 1) & 0xFFFF
+                self._end_rx()
+                self.changed.notify_all()
+                return True
+
+            payload = bytes(payload)
+            start = self._rx_pointer
+            for i, value in enumerate(payload):
+                self.buffer[(start + i) & 0xFF] = value
+            self.rx_start = start
+            self.rx_payload_length = len(payload)
+            if self._rx_continuous:
+                self._rx_pointer = (start + len(payload)) & 0xFF
+
+            if signal_rssi is None:
+                signal_rssi = rssi
+            self.packet_status = (
+                int(-rssi * 2) & 0xFF,
+                int(snr * 4) & 0xFF,
+                int(-signal_rssi * 2) & 0xFF,
+            )
+
+            bits = IRQ_RX_DONE
+            self.stats[0] = (self.stats[0] + 1) & 0xFFFF
+            if crc_error and self.packet_params[3]:
+                bits |= IRQ_CRC_ERR
+                self.stats[1] = (self.stats[1] + 1) & 0xFFFF
+            self._raise_irq(bits)
+            self._cmd_status = STATUS_DATA_AVAILABLE
+            self._end_rx()
+            self.changed.notify_all()
+            return True
+
+    def _end_rx(self):
+        if not self._rx_continuous:
+            self._pending = None
+            self._deadline = None
+            self._mode = self.fallback_mode
+
+    def _tx_done(self):
+        length = self.packet_params[2]
+        self.transmitted.append(
+            bytes(self.buffer[(self.tx_base + i) & 0xFF] for i in range(length))
+        )
+        self._raise_irq(IRQ_TX_DONE)
+        self._cmd_status = STATUS_CMD_TX_DONE
+        self._mode = self.fallback_mode
+
+    def _timeout(self):
+        self._raise_irq(IRQ_TIMEOUT)
+        self._cmd_status = STATUS_CMD_TIMEOUT
+        self._mode = self.fallback_mode
+
+    def _cad_done(self):
+        bits = IRQ_CAD_DONE
+        if self.channel_activity:
+            bits |= IRQ_CAD_DETECTED
+        self._raise_irq(bits)
+        if self.channel_activity and self.cad_params[3] == CAD_EXIT_RX:
+            self._enter_rx(self.cad_params[4])
+        else:
+            self._mode = STATUS_MODE_STDBY_RC
+
+    def _enter_rx(self, timeout: int):
+        self._mode = STATUS_MODE_RX
+        self._rx_pointer = self.rx_base
+        self._rx_continuous = timeout == RX_CONTINUOUS
+        self._pending = None
+        self._deadline = None
+        if timeout not in (RX_SINGLE, RX_CONTINUOUS):
+            self._schedule(timeout * 15.625e-6 * self.airtime_scale, self._timeout)
+
+    # ---------------------------------------------------------------------
+    # OPCODE HANDLERS
+    # ---------------------------------------------------------------------
+
+    @staticmethod
+    def _u24(frame, offset: int) -> int:
+        return (frame[offset] << 16) | (frame[offset + 1] << 8) | frame[offset + 2]
+
+    def _cmd_nop(self, frame, resp):
+        pass
+
+    def _cmd_set_sleep(self, frame, resp):
+        self._sleep_config = frame[1]
+        self._pending = None
+        self._deadline = None
+        self._mode = _MODE_SLEEP
+
+    def _cmd_set_standby(self, frame, resp):
+        self._pending = None
+        self._deadline = None
+        if frame[1] == STANDBY_XOSC:
+            self._mode = STATUS_MODE_STDBY_XOSC
+        else:
+            self._mode = STATUS_MODE_STDBY_RC
+
+    def _cmd_set_fs(self, frame, resp):
+        self._mode = STATUS_MODE_FS
+
+    def _cmd_set_tx(self, frame, resp):
+        timeout = self._u24(frame, 1)
+        airtime = self.time_on_air(self.packet_params[2]) * self.airtime_scale
+        self._mode = STATUS_MODE_TX
+        self._cmd_status = 0
+        limit = timeout * 15.625e-6 * self.airtime_scale
+        if timeout and limit < airtime:
+            self._schedule(limit, self._timeout)
+        else:
+            self._schedule(airtime, self._tx_done)
+
+    def _cmd_set_tx_infinite(self, frame, resp):
+        self._pending = None
+        self._deadline = None
+        self._mode = STATUS_MODE_TX
+
+    def _cmd_set_rx(self, frame, resp):
+        self._cmd_status = 0
+        self._enter_rx(self._u24(frame, 1))
+
+    def _cmd_set_rx_duty_cycle(self, frame, resp):
+        self._cmd_status = 0
+        self._enter_rx(RX_SINGLE)
+
+    def _cmd_set_cad(self, frame, resp):
+        sf, bw, _, _ = self.modulation
+        symbols = 1 << self.cad_params[0]
+        t_sym = symbol_time(sf, BW_HZ.get(bw, 125000))
+        self._mode = STATUS_MODE_RX
+        self._schedule(symbols * t_sym * self.airtime_scale, self._cad_done)
+
+    def _cmd_set_fallback(self, frame, resp):
+        self.fallback_mode = {
+            FALLBACK_FS: STATUS_MODE_FS,
+            FALLBACK_STDBY_XOSC: STATUS_MODE_STDBY_XOSC,
+        }.get(frame[1], STATUS_MODE_STDBY_RC)
+
+    def _cmd_write_register(self, frame, resp):
+        address = (frame[1] << 8) | frame[2]
+        for i, value in enumerate(frame[3:]):
+            self.registers[(address + i) % _REGISTER_SPACE] = value
+
+    def _cmd_read_register(self, frame, resp):
+        address = (frame[1] << 8) | frame[2]
+        for i in range(len(frame) - 4):
+            resp[4 + i] = self.registers[(address + i) % _REGISTER_SPACE]
+
+    def _cmd_write_buffer(self, frame, resp):
+        offset = frame[1]
+        for i, value in enumerate(frame[2:]):
+            self.buffer[(offset + i) & 0xFF] = value
+
+    def _cmd_read_buffer(self, frame, resp):
+        offset = frame[1]
+        for i in range(len(frame) - 3):
+            resp[3 + i] = self.buffer[(offset + i) & 0xFF]
+        if self._cmd_status == STATUS_DATA_AVAILABLE:
+            self._cmd_status = 0
+
+    def _cmd_set_dio_irq_params(self, frame, resp):
+        self.irq_mask = (frame[1] << 8) | frame[2]
+        self.dio_masks = (
+            (frame[3] << 8) | frame[4],
+            (frame[5] << 8) | frame[6],
+            (frame[7] << 8) | frame[8],
+        )
+
+    def _fill(self, resp, start: int, values):
+        for i, value in enumerate(values):
+            if start + i < len(resp):
+                resp[start + i] = value & 0xFF
+
+    def _cmd_get_irq_status(self, frame, resp):
+        self._fill(resp, 2, (self.irq_status >> 8, self.irq_status))
+
+    def _cmd_clear_irq_status(self, frame, resp):
+        self.irq_status &= ~((frame[1] << 8) | frame[2])
+
+    def _cmd_set_rf_frequency(self, frame, resp):
+        self.rf_frequency = (
+            (frame[1] << 24) | (frame[2] << 16) | (frame[3] << 8) | frame[4]
+        )
+
+    def _cmd_set_packet_type(self, frame, resp):
+        self.packet_type = frame[1]
+
+    def _cmd_get_packet_type(self, frame, resp):
+        self._fill(resp, 2, (self.packet_type,))
+
+    def _cmd_set_modulation_params(self, frame, resp):
+        if self.packet_type == LORA_MODEM:
+            self.modulation = (frame[1], frame[2], frame[3], frame[4])
+
+    def _cmd_set_packet_params(self, frame, resp):
+        if self.packet_type == LORA_MODEM:
+            self.packet_params = (
+                (frame[1] << 8) | frame[2],
+                frame[3],
+                frame[4],
+                frame[5],
+                frame[6],
+            )
+
+    def _cmd_set_cad_params(self, frame, resp):
+        self.cad_params = (frame[1], frame[2], frame[3], frame[4], self._u24(frame, 5))
+
+    def _cmd_set_buffer_base_address(self, frame, resp):
+        self.tx_base = frame[1]
+        self.rx_base = frame[2]
+
+    def _cmd_get_status(self, frame, resp):
+        pass
+
+    def _cmd_get_rx_buffer_status(self, frame, resp):
+        self._fill(resp, 2, (self.rx_payload_length, self.rx_start))
+
+    def _cmd_get_packet_status(self, frame, resp):
+        self._fill(resp, 2, self.packet_status)
+
+    def _cmd_get_rssi_inst(self, frame, resp):
+        self._fill(resp, 2, (int(-self.noise_floor * 2),))
+
+    def _cmd_get_stats(self, frame, resp):
+        values = []
+        for count in self.stats:
+            values += [count >> 8, count]
+        self._fill(resp, 2, values)
+
+    def _cmd_reset_stats(self, frame, resp):
+        self.stats = [0, 0, 0]
+
+    def _cmd_get_device_errors(self, frame, resp):
+        self._fill(resp, 2, (self.device_errors >> 8, self.device_errors))
+
+    def _cmd_clear_device_errors(self, frame, resp):
+        self.device_errors = 0
+
+
+class EmulatorTransport(Transport):
+    """
+    Transport backed by SX1262Emulator. Lets the whole driver stack run,
+    and be benchmarked, on a machine without SPI or GPIO hardware.
+    """
+
+    supports_batch = True
+
+    def __init__(self, chip: SX1262Emulator = None, **kwargs):
+        super().__init__()
+        self.chip = chip if chip is not None else SX1262Emulator(**kwargs)
+        self.is_open = False
+        self._levels = {}
+        self._reset = -1
+        self._busy = -1
+        self._irq = -1
+        self._edge_callbacks = []
+        self._alert_thread = None
+
+    def open(self, bus: int, cs: int, speed: int):
+        self.is_open = True
+
+    def close(self):
+        self.is_open = False
+
+    def setup_pins(
+        self,
+        reset: int,
+        busy: int,
+        cs: int,
+        irq: int = -1,
+        txen: int = -1,
+        rxen: int = -1,
+        wake: int = -1,
+    ):
+        self._reset = reset
+        self._busy = busy
+        self._irq = irq
+
+    def write_pin(self, pin: int, level: int):
+        self._levels[pin] = level
+        if pin == self._reset:
+            self.chip.set_reset(level)
+
+    def read_pin(self, pin: int) -> int:
+        if pin == self._busy:
+            return self.chip.busy()
+        if pin == self._irq:
+            return self.chip.irq_line()
+        return self._levels.get(pin, 0)
+
+    def wait_for_level(self, pin: int, level: int, timeout: float) -> bool:
+        if pin != self._busy or level != 0:
+            return super().wait_for_level(pin, level, timeout)
+        remaining = self.chip.busy_remaining()
+        if remaining is None or remaining > timeout:
+            time.sleep(timeout)
+            return not self.chip.busy()
+        time.sleep(remaining)
+        return True
+
+    def add_edge_callback(self, pin: int, callback):
+        """
+        Emulate an lgpio rising-edge alert on the IRQ line. Callbacks run
+        on a dedicated alert thread, like lgpio's callback thread.
+        """
+        watch = _EdgeWatch(self, pin, callback)
+        with self.chip.changed:
+            self._edge_callbacks.append(watch)
+            if self._alert_thread is None:
+                self._alert_thread = threading.Thread(
+                    target=self._alert_loop, daemon=True
+                )
+                self._alert_thread.start()
+            self.chip.changed.notify_all()
+        return watch
+
+    def _remove_edge_callback(self, watch):
+        with self.chip.changed:
+            if watch in self._edge_callbacks:
+                self._edge_callbacks.remove(watch)
+            self.chip.changed.notify_all()
+
+    def _alert_loop(self):
+        chip = self.chip
+        edges = chip.irq_edges
+        while True:
+            with chip.changed:
+                if not self._edge_callbacks:
+                    self._alert_thread = None
+                    return
+                chip.irq_line()  # advances pending operations
+                rising = chip.irq_edges != edges
+                edges = chip.irq_edges
+                if not rising:
+                    deadline = chip.next_deadline()
+                    timeout = None
+                    if deadline is not None:
+                        timeout = max(deadline - chip.clock(), 0.0)
+                    chip.changed.wait(timeout)
+                    continue
+                watchers = [w for w in self._edge_callbacks if w.pin == self._irq]
+            timestamp = time.monotonic_ns()
+            for watch in watchers:
+                watch.callback(timestamp)
+
+    def transfer(self, data):
+        return self.chip.transfer(data)
+
+    def transfer_many(self, frames) -> list:
+        # Pace frames like the ioctl backend: the cs_change gap covers a
+        # short-BUSY opcode, any other one ends the ioctl and BUSY is awaited
+        responses = []
+        previous = None
+        for frame in frames:
+            if previous is None:
+                pass
+            elif previous not in SHORT_BUSY_OPCODES:
+                if not self.wait_for_level(self._busy, 0, BUSY_TIMEOUT / 1000.0):
+                    break
+            elif self.chip.busy_scale:
+                settle = BUSY_TIME_US.get(previous, BUSY_TIME_DEFAULT_US)
+                time.sleep(settle * 1e-6 * self.chip.busy_scale)
+            responses.append(self.chip.transfer(frame))
+            previous = frame[0]
+        return responses
+
+
+class _EdgeWatch:
+    """Handle returned by EmulatorTransport.add_edge_callback()."""
+
+    def __init__(self, transport, pin, callback):
+        self.transport = transport
+        self.pin = pin
+        self.callback = callback
+
+    def cancel(self):
+        self.transport._remove_edge_callback(self)
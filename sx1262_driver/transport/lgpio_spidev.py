@@ -0,0 +1,122 @@
+import threading
+
+from .base import Transport
+
+# spidev and lgpio are native modules only present on the Pi; they are
+# imported by the first transport created, so the package (constants,
+# airtime math, emulator) loads on any host
+spidev = None
+lgpio = None
+
+
+def load_backends():
+    """Import spidev and lgpio into this module, once."""
+    global spidev, lgpio
+    if lgpio is not None:
+        return
+    try:
+        import spidev as _spidev
+        import lgpio as _lgpio
+    except ImportError as e:
+        raise ImportError(
+            f"{e.name} is required for the Raspberry Pi transports; "
+            "use EmulatorTransport on other hosts"
+        ) from e
+    (spidev, lgpio) = (_spidev, _lgpio)
+
+
+class LgpioTransport(Transport):
+    """
+    Raspberry Pi backend: spidev for the bus, lgpio for chip select, reset,
+    BUSY and the optional DIO/TXEN/RXEN/WAKE lines.
+    """
+
+    def __init__(self, gpio_chip: int = 0):
+        super().__init__()
+        load_backends()
+        self.spi = None
+
+        # lgpio: open /dev/gpiochipN explicitly and keep a handle
+        self.gpio_chip = lgpio.gpiochip_open(gpio_chip)
+        self._cs = -1
+        self._busy = -1
+
+    def open(self, bus: int, cs: int, speed: int):
+        self.spi = spidev.SpiDev()
+        self.spi.open(bus, cs)
+        self.spi.max_speed_hz = speed
+        self.spi.lsbfirst = False
+        self.spi.mode = 0
+
+    def close(self):
+        if self.spi is not None:
+            self.spi.close()
+        # close gpio chip handle
+        lgpio.gpiochip_close(self.gpio_chip)
+
+    def setup_pins(
+        self,
+        reset: int,
+        busy: int,
+        cs: int,
+        irq: int = -1,
+        txen: int = -1,
+        rxen: int = -1,
+        wake: int = -1,
+    ):
+        self._cs = cs
+        self._busy = busy
+
+        lgpio.gpio_claim_output(self.gpio_chip, cs)
+        self._claim_pins(reset, busy, irq, txen, rxen, wake)
+
+    def _claim_pins(self, reset, busy, irq, txen, rxen, wake):
+        lgpio.gpio_claim_output(self.gpio_chip, reset)
+        # BUSY is claimed for alerts so long waits can block on its edge
+        lgpio.gpio_claim_alert(self.gpio_chip, busy, lgpio.BOTH_EDGES)
+
+        if irq != -1:
+            lgpio.gpio_claim_alert(self.gpio_chip, irq, lgpio.RISING_EDGE)
+        if txen != -1:
+            lgpio.gpio_claim_output(self.gpio_chip, txen)
+        if rxen != -1:
+            lgpio.gpio_claim_output(self.gpio_chip, rxen)
+        if wake != -1:
+            lgpio.gpio_claim_output(self.gpio_chip, wake)
+
+    def write_pin(self, pin: int, level: int):
+        lgpio.gpio_write(self.gpio_chip, pin, level)
+
+    def read_pin(self, pin: int) -> int:
+        return lgpio.gpio_read(self.gpio_chip, pin)
+
+    def wait_for_level(self, pin: int, level: int, timeout: float) -> bool:
+        # The callback only exists for the duration of a slow wait, so the
+        # short BUSY pulse after every command costs no Python callbacks
+        edge = threading.Event()
+        cb = lgpio.callback(
+            self.gpio_chip, pin, lgpio.BOTH_EDGES, lambda *args: edge.set()
+        )
+        try:
+            while lgpio.gpio_read(self.gpio_chip, pin) != level:
+                if not edge.wait(timeout):
+                    return False
+                edge.clear()
+            return True
+        finally:
+            cb.cancel()
+
+    def add_edge_callback(self, pin: int, callback):
+        # lgpio passes the kernel line-event timestamp (ns) as 'tick'
+        return lgpio.callback(
+            self.gpio_chip,
+            pin,
+            lgpio.RISING_EDGE,
+            lambda chip, gpio, level, tick: callback(tick),
+        )
+
+    def transfer(self, data):
+        lgpio.gpio_write(self.gpio_chip, self._cs, 0)
+        resp = self.spi.xfer2(data)
+        lgpio.gpio_write(self.gpio_chip, self._cs, 1)
+        return bytes(resp)
@@ -0,0 +1,83 @@
+"""
+Inspect or replay an SPI trace recorded with SX1262.start_trace():
+
+    python -m sx1262_driver.transport.replay trace.bin --dump
+    python -m sx1262_driver.transport.replay trace.bin --repeat 100
+    python -m sx1262_driver.transport.replay trace.bin --emulator
+"""
+
+import argparse
+import time
+
+from ..core.spi_metrics import OPCODE_NAMES
+from .emulator import EmulatorTransport
+from .base import Transport
+from .trace import ReplayTransport, read_trace
+
+
+def replay(records, transport: Transport, repeat: int = 1) -> dict:
+    """
+    Feed every recorded frame through the driver's transfer path against
+    'transport' and compare responses with the trace. Returns counts and
+    the per-frame driver + transport time.
+    """
+    # Imported here: the driver package imports this transport package
+    from ..sx1262 import SX1262
+
+    radio = SX1262(transport=transport)
+    differences = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        if isinstance(transport, ReplayTransport):
+            transport.rewind()
+        for record in records:
+            with radio._bus_lock:
+                radio.busy_check(opcode=record.opcode)
+                response = radio._transfer(record.mosi)
+            if bytes(response) != record.miso:
+                differences += 1
+    elapsed = time.perf_counter() - start
+    frames = len(records) * repeat
+    return {
+        "frames": frames,
+        "differences": differences,
+        "us_per_frame": elapsed / frames * 1e6 if frames else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or replay an SX1262 SPI trace")
+    parser.add_argument("trace")
+    parser.add_argument("--dump", action="store_true", help="print the records")
+    parser.add_argument(
+        "--emulator",
+        action="store_true",
+        help="replay against the chip emulator instead of the trace itself",
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    records = list(read_trace(args.trace))
+    if args.dump:
+        start = records[0].timestamp if records else 0
+        for record in records:
+            name = OPCODE_NAMES.get(record.opcode, f"0x{record.opcode:02X}")
+            print(
+                f"{(record.timestamp - start) / 1e6:12.3f} ms  {name:<22}"
+                f" busy {record.busy * 1e6:8.1f} us  {record.mosi.hex()} -> {record.miso.hex()}"
+            )
+        return
+
+    if args.emulator:
+        transport = EmulatorTransport(busy_scale=0)
+    else:
+        transport = ReplayTransport(records)
+    result = replay(records, transport, args.repeat)
+    print(
+        f"{result['frames']} frames, {result['differences']} responses differ, "
+        f"{result['us_per_frame']:.2f} us per frame"
+    )
+
+
+if __name__ == "__main__":
+    main()
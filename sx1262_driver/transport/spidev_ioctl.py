@@ -0,0 +1,154 @@
+import ctypes
+import fcntl
+import os
+
+from ..sx1262_constants import *
+from . import lgpio_spidev
+from .lgpio_spidev import LgpioTransport
+
+# Frames per SPI_IOC_MESSAGE
+MAX_TRANSFERS = 32
+# Largest frame the driver builds (see SX1262Api)
+FRAME_SIZE = 260
+
+_SPI_IOC_MAGIC = ord("k")
+
+
+def _iow(nr: int, size: int) -> int:
+    return (1 << 30) | (size << 16) | (_SPI_IOC_MAGIC << 8) | nr
+
+
+SPI_IOC_WR_MODE = _iow(1, 1)
+SPI_IOC_WR_BITS_PER_WORD = _iow(3, 1)
+SPI_IOC_WR_MAX_SPEED_HZ = _iow(4, 4)
+
+
+class SpiIocTransfer(ctypes.Structure):
+    """struct spi_ioc_transfer from <linux/spi/spidev.h>."""
+
+    _fields_ = [
+        ("tx_buf", ctypes.c_uint64),
+        ("rx_buf", ctypes.c_uint64),
+        ("len", ctypes.c_uint32),
+        ("speed_hz", ctypes.c_uint32),
+        ("delay_usecs", ctypes.c_uint16),
+        ("bits_per_word", ctypes.c_uint8),
+        ("cs_change", ctypes.c_uint8),
+        ("tx_nbits", ctypes.c_uint8),
+        ("rx_nbits", ctypes.c_uint8),
+        ("word_delay_usecs", ctypes.c_uint8),
+        ("pad", ctypes.c_uint8),
+    ]
+
+
+def spi_ioc_message(n: int) -> int:
+    return _iow(0, n * ctypes.sizeof(SpiIocTransfer))
+
+
+class IoctlTransport(LgpioTransport):
+    """
+    Raspberry Pi backend that drives /dev/spidevB.C with raw SPI_IOC_MESSAGE
+    ioctls instead of spidev.xfer2.
+
+    Chip select is the kernel's CE line for the device (wire it to NSS), so
+    several command frames can go out in a single ioctl with cs_change
+    between them, as long as each frame but the last is in
+    SHORT_BUSY_OPCODES. After any other opcode the ioctl ends and the next
+    one waits for the BUSY line, so NSS is never asserted while the chip
+    is busy; if BUSY never drops, the remaining frames are not sent. All
+    transfer structs and tx/rx buffers are allocated once at construction.
+    """
+
+    supports_batch = True
+
+    def __init__(self, gpio_chip: int = 0):
+        super().__init__(gpio_chip)
+        self._fd = -1
+        self._speed = SPI_SPEED
+
+        self._xfers = (SpiIocTransfer * MAX_TRANSFERS)()
+        self._tx_arena = (ctypes.c_ubyte * (MAX_TRANSFERS * FRAME_SIZE))()
+        self._rx_arena = (ctypes.c_ubyte * (MAX_TRANSFERS * FRAME_SIZE))()
+        self._tx_view = memoryview(self._tx_arena).cast("B")
+        self._rx_view = memoryview(self._rx_arena).cast("B")
+        self._tx_addr = ctypes.addressof(self._tx_arena)
+        self._rx_addr = ctypes.addressof(self._rx_arena)
+        self._requests = [0] + [spi_ioc_message(n) for n in range(1, MAX_TRANSFERS + 1)]
+
+    def open(self, bus: int, cs: int, speed: int):
+        self._fd = os.open(f"/dev/spidev{bus}.{cs}", os.O_RDWR)
+        self._speed = speed
+        fcntl.ioctl(self._fd, SPI_IOC_WR_MODE, bytes((0,)))
+        fcntl.ioctl(self._fd, SPI_IOC_WR_BITS_PER_WORD, bytes((8,)))
+        fcntl.ioctl(self._fd, SPI_IOC_WR_MAX_SPEED_HZ, speed.to_bytes(4, "little"))
+
+    def close(self):
+        if self._fd != -1:
+            os.close(self._fd)
+            self._fd = -1
+        lgpio_spidev.lgpio.gpiochip_close(self.gpio_chip)
+
+    def setup_pins(
+        self,
+        reset: int,
+        busy: int,
+        cs: int,
+        irq: int = -1,
+        txen: int = -1,
+        rxen: int = -1,
+        wake: int = -1,
+    ):
+        # The kernel drives chip select; leave the manual CS line unclaimed
+        self._busy = busy
+        self._claim_pins(reset, busy, irq, txen, rxen, wake)
+
+    def _load(self, index: int, slot: int, frame, cs_change: int) -> int:
+        length = len(frame)
+        offset = slot * FRAME_SIZE
+        self._tx_view[offset : offset + length] = frame
+        xfer = self._xfers[index]
+        xfer.tx_buf = self._tx_addr + offset
+        xfer.rx_buf = self._rx_addr + offset
+        xfer.len = length
+        xfer.speed_hz = self._speed
+        xfer.delay_usecs = 0
+        xfer.cs_change = cs_change
+        return length
+
+    def _submit(self, count: int):
+        fcntl.ioctl(self._fd, self._requests[count], self._xfers, True)
+
+    def transfer(self, data):
+        length = self._load(0, 0, data, 0)
+        self._submit(1)
+        return bytes(self._rx_view[:length])
+
+    def transfer_many(self, frames) -> list:
+        responses = []
+        start = 0
+        while start < len(frames):
+            if start and not self._wait_ready():
+                # Previous ioctl ended with a command that never finished
+                break
+
+            count = 0
+            lengths = []
+            for frame in frames[start : start + MAX_TRANSFERS]:
+                lengths.append(self._load(count, count, frame, 1))
+                count += 1
+                if frame[0] not in SHORT_BUSY_OPCODES:
+                    # BUSY may outlast the cs_change gap: end the ioctl here
+                    break
+
+            # Leave chip select released after the last frame
+            self._xfers[count - 1].cs_change = 0
+            self._submit(count)
+
+            for slot, length in enumerate(lengths):
+                offset = slot * FRAME_SIZE
+                responses.append(bytes(self._rx_view[offset : offset + length]))
+            start += count
+        return responses
+
+    def _wait_ready(self, timeout: float = BUSY_TIMEOUT / 1000.0) -> bool:
+        return self.wait_for_level(self._busy, 0, timeout)
@@ -0,0 +1,231 @@
+import struct
+import time
+from collections import namedtuple
+
+from ..sx1262_constants import TRACE_BUFFER_SIZE
+from .base import Transport
+
+# File header, then records: timestamp (monotonic ns), opcode, BUSY wait
+# before the frame (s), MOSI length, MISO length, MOSI bytes, MISO bytes
+TRACE_MAGIC = b"SX1262TR\x01"
+_RECORD = struct.Struct("<QBfHH")
+
+TraceRecord = namedtuple("TraceRecord", "timestamp opcode busy mosi miso")
+
+
+class TraceMismatch(Exception):
+    """Raised by a strict ReplayTransport when the driver diverges from the trace."""
+
+
+class TraceTransport(Transport):
+    """
+    Transport wrapper recording every SPI transaction as a binary record.
+
+    Records are packed into a preallocated buffer; recording a frame is one
+    struct.pack_into() and two slice copies. When the buffer fills it is
+    written to 'path' in one write() call. Without a path the recorder is
+    a flight recorder: it swaps between two preallocated buffers and keeps
+    the most recent 'capacity' to 2 * 'capacity' bytes for dump().
+
+    Pin access and everything else is passed through to 'inner'. Set
+    busy_waiter (SX1262.start_trace() does) to record the BUSY wait that
+    preceded each frame.
+    """
+
+    def __init__(self, inner: Transport, path: str = None, capacity: int = TRACE_BUFFER_SIZE):
+        super().__init__()
+        self.inner = inner
+        self.supports_batch = inner.supports_batch
+        self.busy_waiter = None
+        self.records = 0
+        self._buffer = bytearray(capacity)
+        self._spare = None if path else bytearray(capacity)
+        self._previous = 0
+        self._pos = 0
+        self._file = None
+        if path:
+            self._file = open(path, "wb")
+            self._file.write(TRACE_MAGIC)
+
+    # ---------------------------------------------------------------------
+    # RECORDING
+    # ---------------------------------------------------------------------
+
+    def _record(self, timestamp: int, mosi, miso, busy: float):
+        n_mosi = len(mosi)
+        n_miso = len(miso)
+        size = _RECORD.size + n_mosi + n_miso
+        if self._pos + size > len(self._buffer):
+            self._rotate(size)
+        pos = self._pos
+        buffer = self._buffer
+        _RECORD.pack_into(buffer, pos, timestamp, mosi[0] if n_mosi else 0, busy, n_mosi, n_miso)
+        pos += _RECORD.size
+        buffer[pos : pos + n_mosi] = mosi
+        pos += n_mosi
+        buffer[pos : pos + n_miso] = miso
+        self._pos = pos + n_miso
+        self.records += 1
+
+    def _rotate(self, needed: int):
+        if self._file is not None:
+            self._file.write(memoryview(self._buffer)[: self._pos])
+        else:
+            (self._buffer, self._spare) = (self._spare, self._buffer)
+            self._previous = self._pos
+        self._pos = 0
+        if needed > len(self._buffer):
+            raise ValueError("trace record larger than the trace buffer")
+
+    def flush(self):
+        if self._file is not None:
+            self._file.write(memoryview(self._buffer)[: self._pos])
+            self._file.flush()
+            self._pos = 0
+
+    def dump(self, path: str):
+        """Write the flight recorder's contents (or the unflushed tail) to 'path'."""
+        with open(path, "wb") as f:
+            f.write(TRACE_MAGIC)
+            if self._spare is not None:
+                f.write(memoryview(self._spare)[: self._previous])
+            f.write(memoryview(self._buffer)[: self._pos])
+
+    def _busy(self) -> float:
+        waiter = self.busy_waiter
+        return waiter.waited if waiter is not None else 0.0
+
+    # ---------------------------------------------------------------------
+    # TRANSPORT
+    # ---------------------------------------------------------------------
+
+    def transfer(self, data):
+        timestamp = time.monotonic_ns()
+        response = self.inner.transfer(data)
+        self._record(timestamp, data, response, self._busy())
+        return response
+
+    def transfer_many(self, frames) -> list:
+        timestamp = time.monotonic_ns()
+        responses = self.inner.transfer_many(frames)
+        busy = self._busy()
+        for frame, response in zip(frames, responses):
+            self._record(timestamp, frame, response, busy)
+            busy = 0.0
+        return responses
+
+    def open(self, bus: int, cs: int, speed: int):
+        self.inner.open(bus, cs, speed)
+
+    def close(self):
+        self.inner.close()
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def setup_pins(self, *args, **kwargs):
+        self.inner.setup_pins(*args, **kwargs)
+
+    def write_pin(self, pin: int, level: int):
+        self.inner.write_pin(pin, level)
+
+    def read_pin(self, pin: int) -> int:
+        return self.inner.read_pin(pin)
+
+    def wait_for_level(self, pin: int, level: int, timeout: float) -> bool:
+        return self.inner.wait_for_level(pin, level, timeout)
+
+    def add_edge_callback(self, pin: int, callback):
+        return self.inner.add_edge_callback(pin, callback)
+
+
+def read_trace(path: str):
+    """Yield the TraceRecords stored in a trace file."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(TRACE_MAGIC):
+        raise ValueError(f"{path} is not an SX1262 trace")
+    view = memoryview(data)
+    pos = len(TRACE_MAGIC)
+    while pos + _RECORD.size <= len(data):
+        (timestamp, opcode, busy, n_mosi, n_miso) = _RECORD.unpack_from(data, pos)
+        pos += _RECORD.size
+        mosi = bytes(view[pos : pos + n_mosi])
+        pos += n_mosi
+        miso = bytes(view[pos : pos + n_miso])
+        pos += n_miso
+        yield TraceRecord(timestamp, opcode, busy, mosi, miso)
+
+
+class ReplayTransport(Transport):
+    """
+    Stand-in transport answering from a recorded trace.
+
+    Each transfer() consumes the next record, compares the frame the driver
+    sent with the recorded MOSI and returns the recorded MISO, so a driver
+    script re-run against it sees exactly what the field gateway saw. BUSY
+    always reads low and there are no IRQ edges (the driver polls).
+    Divergences are counted in 'mismatches'; with 'strict' the first one
+    raises TraceMismatch.
+    """
+
+    supports_batch = True
+
+    def __init__(self, records, strict: bool = False):
+        super().__init__()
+        self.records = list(records)
+        self.strict = strict
+        self.position = 0
+        self.mismatches = 0
+        self.first_mismatch = None
+
+    def open(self, bus: int, cs: int, speed: int):
+        pass
+
+    def close(self):
+        pass
+
+    def setup_pins(self, *args, **kwargs):
+        pass
+
+    def write_pin(self, pin: int, level: int):
+        pass
+
+    def read_pin(self, pin: int) -> int:
+        return 0
+
+    def wait_for_level(self, pin: int, level: int, timeout: float) -> bool:
+        return level == 0
+
+    def transfer(self, data):
+        data = bytes(data)
+        if self.position >= len(self.records):
+            self._mismatch(f"frame {data.hex()} sent after the end of the trace")
+            return bytearray(len(data))
+        record = self.records[self.position]
+        self.position += 1
+        if data != record.mosi:
+            self._mismatch(
+                f"record {self.position - 1}: sent {data.hex()}, trace has {record.mosi.hex()}"
+            )
+            if len(record.miso) != len(data):
+                return bytearray(len(data))
+        return bytearray(record.miso)
+
+    def transfer_many(self, frames) -> list:
+        return [self.transfer(frame) for frame in frames]
+
+    def _mismatch(self, message: str):
+        self.mismatches += 1
+        if self.first_mismatch is None:
+            self.first_mismatch = message
+        if self.strict:
+            raise TraceMismatch(message)
+
+    def rewind(self):
+        self.position = 0
+
+    @property
+    def remaining(self) -> int:
+        return len(self.records) - self.position
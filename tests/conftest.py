@@ -0,0 +1,43 @@
+import time
+
+import pytest
+
+from sx1262_driver import SX1262, EmulatorTransport
+
+RESET_PIN = 18
+BUSY_PIN = 20
+IRQ_PIN = 16
+
+
+def make_radio(irq: int = IRQ_PIN, **kwargs):
+    """An SX1262 on a fresh EmulatorTransport, after begin()."""
+    transport = EmulatorTransport(**kwargs)
+    radio = SX1262(transport=transport)
+    assert radio.begin(reset=RESET_PIN, busy=BUSY_PIN, irq=irq)
+    return radio
+
+
+def settle(condition, timeout: float = 1.0) -> bool:
+    """Poll 'condition' until it holds or 'timeout' seconds pass."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.002)
+    return True
+
+
+@pytest.fixture
+def radio():
+    # No BUSY time and fast airtime: exercises the logic, not the timing
+    radio = make_radio(busy_scale=0, airtime_scale=0.01)
+    yield radio
+    radio.end()
+
+
+@pytest.fixture
+def timed_radio():
+    # Real BUSY times, so a frame sent while BUSY is high is counted
+    radio = make_radio(busy_scale=1, airtime_scale=0.01)
+    yield radio
+    radio.end()
@@ -0,0 +1,98 @@
+import time
+
+import pytest
+
+from sx1262_driver import *
+
+
+class _Spy:
+    """Count transport calls and frames without changing them."""
+
+    def __init__(self, transport):
+        self.transfers = 0
+        self.batches = []
+        transfer = transport.transfer
+        transfer_many = transport.transfer_many
+
+        def spy_transfer(data):
+            self.transfers += 1
+            return transfer(data)
+
+        def spy_transfer_many(frames):
+            self.batches.append([frame[0] for frame in frames])
+            return transfer_many(frames)
+
+        transport.transfer = spy_transfer
+        transport.transfer_many = spy_transfer_many
+
+
+def test_batch_sends_writes_in_one_bus_operation(radio):
+    spy = _Spy(radio.transport)
+    with radio.batch():
+        radio.set_rf_frequency(868100000)
+        radio.write_buffer(0, b"hello", 5)
+        radio.set_buffer_base_address(0, 128)
+        # Nothing leaves before the block ends
+        assert spy.batches == [] and spy.transfers == 0
+
+    assert spy.transfers == 0
+    assert spy.batches == [[0x86, 0x0E, 0x8F]]
+    chip = radio.transport.chip
+    assert bytes(chip.buffer[0:5]) == b"hello"
+    assert chip.rx_base == 128
+
+
+def test_read_inside_batch_flushes_queued_writes(radio):
+    with radio.batch():
+        radio.write_buffer(10, b"abc", 3)
+        data = radio.read_buffer(10, 3)
+    assert bytes(data) == b"abc"
+
+
+def test_nested_batch_flushes_once(radio):
+    spy = _Spy(radio.transport)
+    with radio.batch():
+        radio.write_buffer(0, b"a", 1)
+        with radio.batch():
+            radio.write_buffer(1, b"b", 1)
+        assert spy.batches == []
+    assert spy.batches == [[0x0E, 0x0E]]
+
+
+def test_batch_waits_for_busy_after_long_opcodes(timed_radio):
+    chip = timed_radio.transport.chip
+    violations = chip.busy_violations
+    with timed_radio.batch():
+        timed_radio.calibrate(0x7F)
+        timed_radio.set_rf_frequency(915000000)
+        timed_radio.set_standby(STANDBY_RC)
+        timed_radio.write_buffer(0, b"x", 1)
+    assert chip.busy_violations == violations
+
+
+def test_write_bytes_rejects_short_data(radio):
+    with pytest.raises(ValueError):
+        radio._write_bytes(0x86, (1, 2), 4)
+
+
+def test_batch_stops_when_busy_never_drops(radio):
+    chip = radio.transport.chip
+    frequency = chip.rf_frequency
+    # BUSY stays high after the calibration
+    radio.transport.wait_for_level = lambda pin, level, timeout: False
+    with radio.batch():
+        radio.calibrate(0x7F)
+        radio.set_rf_frequency(915000000)
+    assert chip.rf_frequency == frequency
+    assert radio._mode == STATUS_MODE_UNKNOWN
+
+
+def test_transmit_time_starts_when_settx_is_sent(radio):
+    with radio.batch():
+        radio.begin_packet()
+        radio.put(b"x" * 10)
+        assert radio.end_packet()
+        # SetTx is still queued in the outer batch
+        time.sleep(0.02)
+        queued = time.time()
+    assert radio._transmit_time >= queued
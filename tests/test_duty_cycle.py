@@ -0,0 +1,85 @@
+import math
+
+import pytest
+
+from sx1262_driver import *
+from sx1262_driver.core.duty_cycle import DutyCycleLedger
+
+
+@pytest.fixture
+def ledger():
+    # 1% of a 100 s window: 1 s of airtime
+    return DutyCycleLedger(0.01, window=100.0)
+
+
+def test_fits_inside_budget(ledger):
+    assert ledger.earliest(0.4, now=0.0) == 0.0
+    ledger.record(0.0, 0.4)
+    assert ledger.earliest(0.4, now=1.0) == 1.0
+    assert ledger.transmissions == 1
+    assert ledger.airtime == pytest.approx(0.4)
+
+
+def test_waits_until_old_airtime_leaves_window(ledger):
+    ledger.record(0.0, 0.6)
+    ledger.record(10.0, 0.3)
+    # 0.9 s used: a 0.5 s transmission must wait for the first record to
+    # end a full window before its own end
+    start = ledger.earliest(0.5, now=20.0)
+    assert start == pytest.approx(0.6 + 100.0 - 0.5)
+    ledger.record(start, 0.5)
+    assert ledger.used(start + 0.5) <= ledger.budget + 1e-9
+
+
+def test_never_fits_beyond_budget(ledger):
+    assert ledger.earliest(1.5, now=0.0) == math.inf
+
+
+def test_records_expire(ledger):
+    ledger.record(0.0, 1.0)
+    assert ledger.earliest(1.0, now=50.0) > 50.0
+    assert ledger.used(101.0) == 0.0
+    assert ledger.earliest(1.0, now=101.0) == 101.0
+
+
+def test_used_counts_only_airtime_inside_window(ledger):
+    ledger.record(0.0, 1.0)
+    # Half of the transmission is still on air
+    assert ledger.used(0.5) == pytest.approx(0.5)
+    # Half of it has left the window
+    assert ledger.used(100.5) == pytest.approx(0.5)
+
+
+def test_utilisation_never_exceeds_one_under_admission(ledger):
+    now = 0.0
+    for _ in range(50):
+        start = ledger.earliest(0.3, now)
+        ledger.record(start, 0.3)
+        for t in (start, start + 0.15, start + 0.3):
+            assert ledger.utilisation(t) <= 1.0 + 1e-9
+        now = start + 0.3
+
+
+def test_started_moves_reservation_to_actual_start(ledger):
+    ledger.record(0.0, 0.4)
+    ledger.started(5.0)
+    # Counted from 5.0, so fully inside the window until 105.0
+    assert ledger.used(100.0) == pytest.approx(0.4)
+    assert ledger.used(105.2) == pytest.approx(0.2)
+    ledger.started(1.0)
+    assert ledger.used(105.2) == pytest.approx(0.2)
+
+
+def test_scheduler_charges_airtime_from_settx(radio):
+    ticks = iter(range(0, 1000, 10))
+    scheduler = TxScheduler(radio, clock=lambda: float(next(ticks)))
+    radio.set_frequency(868100000)
+    # Submitted at 0, dequeued at 10, SetTx sent at 20
+    future = scheduler.submit(b"payload")
+    scheduler.start()
+    try:
+        future.result(2)
+    finally:
+        scheduler.stop()
+    (end, airtime) = scheduler._ledgers["g1"]._records[-1]
+    assert end == pytest.approx(20.0 + airtime)
@@ -0,0 +1,57 @@
+import pytest
+
+from sx1262_driver import *
+
+from conftest import make_radio
+
+
+@pytest.fixture
+def polled_radio():
+    # No IRQ pin: wait() polls GetIrqStatus itself
+    radio = make_radio(irq=-1, busy_scale=0, airtime_scale=0.01)
+    yield radio
+    radio.end()
+
+
+def test_begin_brings_chip_to_standby(radio):
+    assert radio.transport.chip.mode in (STATUS_MODE_STDBY_RC, STATUS_MODE_STDBY_XOSC)
+
+
+def test_register_round_trip(radio):
+    radio.write_register(0x0740, (0x34, 0x44), 2)
+    assert tuple(radio.read_register(0x0740, 2)) == (0x34, 0x44)
+    assert bytes(radio.transport.chip.registers[0x0740:0x0742]) == b"\x34\x44"
+
+
+def test_buffer_round_trip(radio):
+    radio.write_buffer(200, tuple(b"payload"), 7)
+    assert bytes(radio.read_buffer(200, 7)) == b"payload"
+
+
+def test_modem_configuration_reaches_chip(radio):
+    radio.set_frequency(868100000)
+    radio.set_lora_modulation(9, 125000, 5)
+    chip = radio.transport.chip
+    assert chip.packet_type == LORA_MODEM
+    assert chip.rf_frequency != 0
+    assert chip.modulation[0] == 9
+
+
+def test_transmit_completes(polled_radio):
+    radio = polled_radio
+    radio.set_lora_packet(HEADER_EXPLICIT, 8, 255, True)
+    radio.begin_packet()
+    radio.put(b"hello")
+    assert radio.end_packet()
+    assert radio.wait(2)
+    assert radio.status() == STATUS_TX_DONE
+
+
+def test_received_packet_is_readable(polled_radio):
+    radio = polled_radio
+    radio.set_lora_packet(HEADER_EXPLICIT, 8, 255, True)
+    assert radio.request(RX_SINGLE)
+    assert radio.transport.chip.inject_packet(b"ping")
+    assert radio.wait(2)
+    assert radio.status() == STATUS_RX_DONE
+    assert radio.get(radio.available()) == b"ping"
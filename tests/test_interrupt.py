@@ -0,0 +1,39 @@
+from sx1262_driver import *
+from sx1262_driver.core import DISPATCH_THREADPOOL
+
+from conftest import settle
+
+
+def test_spurious_irq_is_cleared(radio):
+    radio.start_recv_loop()
+    chip = radio.transport.chip
+    reads = []
+    get_irq_status = radio.get_irq_status
+    radio.get_irq_status = lambda: reads.append(1) or get_irq_status()
+
+    with chip.changed:
+        chip.irq_mask |= 0x2000
+        chip.dio_masks = (chip.dio_masks[0] | 0x2000, *chip.dio_masks[1:])
+        chip._raise_irq(0x2000)
+        chip.changed.notify_all()
+
+    # Cleared at once, so DIO1 drops and the status is read only once
+    assert settle(lambda: radio._status_irq == 0x2000)
+    assert chip.irq_status == 0
+    assert not chip.irq_line()
+    assert len(reads) == 1
+
+
+def test_irq_timestamp_travels_with_event(radio):
+    got = []
+    radio.on("timeout", lambda timestamp, **kwargs: got.append(timestamp))
+    legacy = []
+    radio.on("timeout", lambda **kwargs: legacy.append(kwargs))
+
+    radio.set_dispatch_mode(DISPATCH_THREADPOOL)
+    radio._handle_irq(IRQ_TIMEOUT, 111)
+    radio._handle_irq(IRQ_TIMEOUT, 222)
+
+    assert settle(lambda: len(got) == 2 and len(legacy) == 2)
+    assert sorted(got) == [111, 222]
+    assert all("timestamp" not in kwargs for kwargs in legacy)
@@ -0,0 +1,103 @@
+import time
+
+from sx1262_driver import *
+
+
+def _configure(radio):
+    radio.apply(
+        RadioConfig(
+            frequency=868100000,
+            sf=9,
+            bw=125000,
+            cr=5,
+            sync_word=0x34,
+            tx_power=14,
+        )
+    )
+
+
+def _chip_state(chip):
+    return (
+        chip.packet_type,
+        chip.rf_frequency,
+        chip.modulation,
+        chip.packet_params,
+        bytes(chip.registers[0x0740:0x0742]),
+    )
+
+
+def test_warm_wake_keeps_configuration(timed_radio):
+    _configure(timed_radio)
+    chip = timed_radio.transport.chip
+    before = _chip_state(chip)
+
+    timed_radio.sleep(SLEEP_WARM_START)
+    time.sleep(0.001)
+    assert timed_radio.wake()
+
+    assert timed_radio.get_mode() == STATUS_MODE_STDBY_RC
+    assert _chip_state(chip) == before
+    assert timed_radio.metrics()["wake"]["warm"] == 1
+    assert timed_radio.metrics()["wake"]["restored_commands"] == 0
+
+
+def test_cold_wake_restores_configuration(timed_radio):
+    _configure(timed_radio)
+    chip = timed_radio.transport.chip
+    before = _chip_state(chip)
+
+    timed_radio.sleep(SLEEP_COLD_START)
+    time.sleep(0.001)
+    assert timed_radio.wake()
+    assert _chip_state(chip) == before
+    assert timed_radio.metrics()["wake"]["cold"] == 1
+    assert timed_radio.metrics()["wake"]["restored_commands"] > 0
+    assert chip.busy_violations == 0
+
+
+def test_reset_restores_configuration(timed_radio):
+    _configure(timed_radio)
+    chip = timed_radio.transport.chip
+    before = _chip_state(chip)
+
+    assert timed_radio.reset()
+    assert _chip_state(chip) == before
+
+
+def test_unknown_mode_wake_of_awake_chip_sends_no_restore(radio):
+    _configure(radio)
+    radio._ring.received(0, 10)
+    radio._mode = STATUS_MODE_UNKNOWN
+
+    assert radio.wake()
+    assert radio.get_mode() == STATUS_MODE_STDBY_RC
+    wakes = radio.metrics()["wake"]
+    assert (wakes["warm"], wakes["cold"], wakes["restored_commands"]) == (0, 0, 0)
+    # The RX ring survives: the chip never slept
+    assert radio._ring.unread == 10
+
+
+def test_unknown_mode_wake_detects_warm_start(timed_radio):
+    _configure(timed_radio)
+    timed_radio.sleep(SLEEP_WARM_START)
+    timed_radio._mode = STATUS_MODE_UNKNOWN
+    timed_radio._sleep_config = None
+    time.sleep(0.001)
+
+    assert timed_radio.wake()
+    assert timed_radio.metrics()["wake"]["warm"] == 1
+    assert timed_radio.metrics()["wake"]["cold"] == 0
+
+
+def test_unknown_mode_wake_detects_cold_start(timed_radio):
+    _configure(timed_radio)
+    chip = timed_radio.transport.chip
+    before = _chip_state(chip)
+    timed_radio.sleep(SLEEP_COLD_START)
+    timed_radio._mode = STATUS_MODE_UNKNOWN
+    timed_radio._sleep_config = None
+    time.sleep(0.001)
+
+    assert timed_radio.wake()
+    assert timed_radio.metrics()["wake"]["cold"] == 1
+    assert _chip_state(chip) == before
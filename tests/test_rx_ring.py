@@ -0,0 +1,136 @@
+import pytest
+
+from sx1262_driver import *
+from sx1262_driver.core.buffer_ring import BUFFER_SIZE, BufferRing
+
+from conftest import make_radio, settle
+
+
+# -------------------------------------------------------------------------
+# BufferRing bookkeeping
+# -------------------------------------------------------------------------
+
+
+def test_segments_split_at_end_of_buffer():
+    assert BufferRing.segments(10, 20) == ((10, 20),)
+    assert BufferRing.segments(250, 20) == ((250, 6), (0, 14))
+
+
+def test_received_wraps_write_index():
+    ring = BufferRing()
+    ring.received(200, 80)
+    assert ring.write_index == (200 + 80) % BUFFER_SIZE
+    assert ring.head() == (200, 80)
+
+
+def test_overrun_drops_oldest_packets():
+    ring = BufferRing()
+    offset = 0
+    for _ in range(5):
+        ring.received(offset, 60)
+        offset = ring.write_index
+    # 300 bytes into 256: the oldest packet was overwritten by the chip
+    assert ring.overruns == 1
+    assert ring.unread == 240
+    assert ring.head() == (60, 60)
+
+
+def test_consume_across_packets():
+    ring = BufferRing()
+    ring.received(0, 10)
+    ring.received(10, 10)
+    ring.consume(15)
+    assert ring.unread == 5
+    assert ring.head() == (15, 5)
+
+
+def test_reserve_tx_drops_packets_it_overwrites():
+    ring = BufferRing()
+    ring.received(0, 100)
+    ring.received(100, 100)
+    assert ring.reserve_tx(100) == 200
+    assert ring.overwritten == 1
+    assert ring.head() == (100, 100)
+
+
+# -------------------------------------------------------------------------
+# RX_CONTINUOUS against the emulator
+# -------------------------------------------------------------------------
+
+
+@pytest.fixture
+def listening(radio):
+    radio.set_lora_packet(HEADER_EXPLICIT, 8, 255, True)
+    radio.start_recv_loop()
+    assert radio.request(RX_CONTINUOUS)
+    return radio
+
+
+def test_packets_read_in_order_across_wrap(listening):
+    chip = listening.transport.chip
+    received = []
+    for i in range(10):
+        payload = bytes([i]) * 70
+        assert chip.inject_packet(payload)
+        assert settle(lambda: listening._ring.unread == 70)
+        received.append(listening.get(listening.available()))
+    assert received == [bytes([i]) * 70 for i in range(10)]
+    assert listening._ring.overruns == 0
+
+
+def test_overrun_keeps_newest_packets_intact(listening):
+    chip = listening.transport.chip
+    payloads = [bytes([i]) * 60 for i in range(6)]
+    for payload in payloads:
+        assert chip.inject_packet(payload)
+        assert settle(lambda: listening._ring.write_index == chip._rx_pointer)
+
+    assert listening._ring.overruns == 2
+    out = []
+    while listening.available():
+        out.append(listening.get(listening.available()))
+    assert out == payloads[2:]
+
+
+def test_pipeline_captures_packets_across_wrap(listening):
+    listening.enable_rx_pipeline()
+    chip = listening.transport.chip
+    payloads = [bytes([i]) * 70 for i in range(10)]
+    got = []
+    for payload in payloads:
+        assert chip.inject_packet(payload)
+        got.append(listening.get_packet(1.0))
+    assert [packet.payload for packet in got] == payloads
+    assert listening._ring.unread == 0
+
+
+def test_rx_timeout_in_wait_leaves_ring_alone():
+    # Recv loop off: wait() itself reads the buffer status
+    radio = make_radio(irq=-1, busy_scale=0, airtime_scale=0.01)
+    try:
+        radio.set_lora_packet(HEADER_EXPLICIT, 8, 255, True)
+        assert radio.request(RX_SINGLE)
+        assert radio.transport.chip.inject_packet(b"first")
+        assert radio.wait(1)
+        assert radio.get(radio.available()) == b"first"
+        write_index = radio._ring.write_index
+
+        assert radio.request(50)
+        assert radio.wait(2)
+        assert radio.status() == STATUS_RX_TIMEOUT
+        assert radio._ring.unread == 0
+        assert radio._ring.write_index == write_index
+    finally:
+        radio.end()
+
+
+def test_pipeline_counts_short_reads(listening, capsys):
+    listening.enable_rx_pipeline()
+    read_many = listening._read_many
+    # The transfer comes back one frame short
+    listening._read_many = lambda reads: read_many(reads)[:-1]
+    assert listening.transport.chip.inject_packet(b"lost")
+    assert settle(lambda: listening.metrics()["rx_short_reads"] == 1)
+    assert listening.get_packet(0.05) is None
+    assert listening._ring.unread == 0
+    assert "short" not in capsys.readouterr().out
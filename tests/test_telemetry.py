@@ -0,0 +1,111 @@
+import math
+import re
+
+import pytest
+
+from sx1262_driver import *
+
+from conftest import settle
+
+
+_SAMPLE = re.compile(r"([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})? (\S+)")
+_LABEL = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+_SUFFIXES = {
+    "counter": ("_total", "_created"),
+    "gauge": ("",),
+    "histogram": ("_bucket", "_count", "_sum", "_created"),
+}
+
+
+def _parse(text: str) -> dict:
+    """
+    Parse OpenMetrics text into {family: (type, [(suffix, labels, value)])},
+    failing on anything the format does not allow.
+    """
+    lines = text.split("\n")
+    assert lines[-2:] == ["# EOF", ""]
+    families = {}
+    for line in lines[:-2]:
+        if line.startswith("# TYPE "):
+            (name, kind) = line[7:].split(" ")
+            assert name not in families, f"{name} declared twice"
+            families[name] = (kind, [])
+            current = name
+        elif line.startswith("# HELP "):
+            assert line[7:].split(" ")[0] == current
+        else:
+            (metric, labels, value) = _SAMPLE.fullmatch(line).groups()
+            (kind, samples) = families[current]
+            suffix = metric[len(current):]
+            assert metric.startswith(current) and suffix in _SUFFIXES[kind], line
+            labels = dict(_LABEL.findall(labels or ""))
+            samples.append((suffix, labels, float(value)))
+    return families
+
+
+def _check_histogram(name: str, samples: list):
+    series = {}
+    for suffix, labels, value in samples:
+        labels = dict(labels)
+        le = labels.pop("le", None)
+        key = tuple(sorted(labels.items()))
+        series.setdefault(key, []).append((suffix, le, value))
+
+    for key, rows in series.items():
+        buckets = [(le, value) for suffix, le, value in rows if suffix == "_bucket"]
+        bounds = [float(le) for le, _ in buckets]
+        assert bounds == sorted(bounds) and bounds[-1] == math.inf, name
+        counts = [value for _, value in buckets]
+        assert counts == sorted(counts), f"{name} buckets not cumulative"
+        count = [value for suffix, _, value in rows if suffix == "_count"]
+        has_sum = any(suffix == "_sum" for suffix, _, _ in rows)
+        # _count and _sum come together, and never with negative buckets
+        assert has_sum == bool(count) == (bounds[0] >= 0), name
+        if count:
+            assert count == [counts[-1]], f"{name} +Inf bucket != _count"
+
+
+def test_histogram_omits_sum_for_negative_buckets():
+    registry = MetricsRegistry()
+    rssi = registry.histogram("rssi_dbm", "", RSSI_BUCKETS)
+    lag = registry.histogram("lag_seconds", "", IRQ_LAG_BUCKETS)
+    rssi.observe(-90.0)
+    lag.observe(0.001)
+
+    families = _parse(registry.render())
+    assert {suffix for suffix, _, _ in families["rssi_dbm"][1]} == {"_bucket"}
+    assert {suffix for suffix, _, _ in families["lag_seconds"][1]} == {
+        "_bucket",
+        "_count",
+        "_sum",
+    }
+
+
+def test_telemetry_exposition_is_valid(radio):
+    registry = radio.enable_telemetry()
+    radio.enable_metrics()
+    radio.set_lora_packet(HEADER_EXPLICIT, 8, 255, True)
+    radio.start_recv_loop()
+    radio.enable_rx_pipeline()
+    assert radio.request(RX_CONTINUOUS)
+    chip = radio.transport.chip
+    for payload in (b"one", b"two", b"three"):
+        assert chip.inject_packet(payload)
+        assert radio.get_packet(1.0) is not None
+    assert settle(lambda: radio._telemetry.rssi.count == 3)
+
+    families = _parse(registry.render())
+    for name, (kind, samples) in families.items():
+        if kind == "histogram":
+            _check_histogram(name, samples)
+    (kind, samples) = families["sx1262_rx_rssi_dbm"]
+    assert ("_bucket", {"le": "+Inf"}, 3.0) in samples
+
+
+def test_exposition_parses_with_prometheus_client(radio):
+    parser = pytest.importorskip("prometheus_client.openmetrics.parser")
+    registry = radio.enable_telemetry()
+    radio._telemetry.rssi.observe(-100.0)
+    radio._telemetry.snr.observe(-5.0)
+    names = {family.name for family in parser.text_string_to_metric_families(registry.render())}
+    assert {"sx1262_rx_rssi_dbm", "sx1262_rx_snr_db"} <= names
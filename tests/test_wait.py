@@ -0,0 +1,60 @@
+import threading
+import time
+
+import pytest
+
+from sx1262_driver import *
+
+from conftest import make_radio
+
+
+@pytest.fixture(params=["poll", "recv_loop"])
+def waiting_radio(request):
+    # wait() polls GetIrqStatus without the recv loop and sleeps on the
+    # IRQ condition with it
+    recv_loop = request.param == "recv_loop"
+    radio = make_radio(irq=16 if recv_loop else -1, busy_scale=0, airtime_scale=0.05)
+    radio.set_lora_packet(HEADER_EXPLICIT, 8, 255, True)
+    if recv_loop:
+        radio.start_recv_loop()
+    yield radio
+    radio.end()
+
+
+def test_wait_for_tx_done(waiting_radio):
+    waiting_radio.begin_packet()
+    waiting_radio.put(b"x" * 20)
+    assert waiting_radio.end_packet()
+    assert waiting_radio.wait(2)
+    assert waiting_radio.status() == STATUS_TX_DONE
+
+
+def test_wait_times_out_without_irq(waiting_radio):
+    assert waiting_radio.request(RX_SINGLE)
+    started = time.monotonic()
+    assert not waiting_radio.wait(0.2)
+    assert time.monotonic() - started >= 0.2
+
+
+def test_wait_for_rx_done(waiting_radio):
+    assert waiting_radio.request(RX_SINGLE)
+    chip = waiting_radio.transport.chip
+    threading.Timer(0.05, chip.inject_packet, (b"hello",)).start()
+    assert waiting_radio.wait(2)
+    assert waiting_radio.status() == STATUS_RX_DONE
+    assert waiting_radio.get(waiting_radio.available()) == b"hello"
+
+
+def test_filtered_packet_does_not_end_wait(radio):
+    radio.set_lora_packet(HEADER_EXPLICIT, 8, 255, True)
+    radio.add_filter(LengthFilter(min_length=10))
+    radio.start_recv_loop()
+    assert radio.request(RX_CONTINUOUS)
+    chip = radio.transport.chip
+    threading.Timer(0.02, chip.inject_packet, (b"short",)).start()
+    assert not radio.wait(0.2)
+
+    threading.Timer(0.02, chip.inject_packet, (b"long enough",)).start()
+    assert radio.wait(2)
+    assert radio.status() == STATUS_RX_DONE
+    assert radio.get(radio.available()) == b"long enough"